@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+Sync scraper_categories from a source's navigation HTML.
+
+Replaces parse_hk01_categories.py / generate_hk01_sql_with_metadata.py.
+Parses the live navigation page (or a saved HTML file) of a registered
+source and emits ONE idempotent SQL statement that:
+  - upserts every category found (multi-row VALUES + ON CONFLICT)
+  - re-enables categories that came back, renames changed ones
+  - deactivates categories that vanished from the navigation
+  - renames rows seeded under a legacy slug scheme (e.g. hk01-zone-03)
+    to the current slug instead of deactivating them
+  - preserves last_run_at, priority and learned metadata keys
+Rows that are already up to date are not rewritten.
+
+Usage:
+  python sync_categories.py hk01                       # fetch live nav, print SQL
+  python sync_categories.py mingpao --html-file SampleDate/mingpaoSection.txt
+  python sync_categories.py hk01 --output hk01_sync.sql
+  python sync_categories.py hk01 --database-url postgres://...   # show diff
+  python sync_categories.py hk01 --database-url postgres://... --apply
+
+--database-url (or DATABASE_URL) requires psycopg; without it the SQL is
+only written out, ready for the Supabase SQL editor.
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import urllib.request
+from html.parser import HTMLParser
+from urllib.parse import unquote, urljoin, urlparse
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/117.0.0.0 Safari/537.36"
+)
+
+# Slugs created by the app itself (see lib/repositories/scraperCategories.ts);
+# never deactivated by a navigation sync.
+DEFAULT_KEEP_SLUGS = {"hk01-auto"}
+
+
+class LinkCollector(HTMLParser):
+    """Collect (href, title, text) for every <a> in a document."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.links = []
+        self._current = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag != "a":
+            return
+        attr_map = dict(attrs)
+        if attr_map.get("href"):
+            self._current = {"href": attr_map["href"], "title": attr_map.get("title") or "", "text": ""}
+
+    def handle_data(self, data):
+        if self._current is not None:
+            self._current["text"] += data
+
+    def handle_endtag(self, tag):
+        if tag == "a" and self._current is not None:
+            self._current["text"] = self._current["text"].strip()
+            self.links.append(self._current)
+            self._current = None
+
+
+def collect_links(html):
+    parser = LinkCollector()
+    parser.feed(html)
+    parser.close()
+    return parser.links
+
+
+def parse_hk01(html, base_url):
+    """HK01 zones and channels: /zone/<id>/<name>, /channel/<id>/<name>."""
+    categories = []
+    for link in collect_links(html):
+        path = urlparse(urljoin(base_url, link["href"])).path
+        parts = [p for p in path.split("/") if p]
+        if len(parts) < 2 or parts[0] not in ("zone", "channel") or not parts[1].isdigit():
+            continue
+        name = link["title"] or link["text"] or (unquote(parts[2]) if len(parts) > 2 else parts[1])
+        categories.append({
+            "slug": f"{parts[1]}-{name}",
+            "name": name,
+            "metadata": {
+                "zoneId": parts[1],
+                "zoneUrl": urljoin(base_url, path),
+                "navType": parts[0],
+            },
+        })
+    return categories
+
+
+def parse_mingpao(html, base_url):
+    """MingPao sections: /pns|ins/<name>/section/<date|latest>/<code>."""
+    categories = []
+    for link in collect_links(html):
+        url = urlparse(urljoin(base_url, link["href"]))
+        parts = [p for p in url.path.split("/") if p]
+        if len(parts) != 5 or parts[0] not in ("pns", "ins") or parts[2] != "section":
+            continue
+        edition, encoded_name, _, _, code = parts
+        name = link["text"] or unquote(encoded_name)
+        # Always point at the rolling "latest" page, not a dated snapshot
+        section_url = f"https://news.mingpao.com/{edition}/{encoded_name}/section/latest/{code}"
+        categories.append({
+            "slug": f"mingpao-{edition}-{code}",
+            "name": name,
+            "metadata": {"sectionUrl": section_url, "sectionCode": code, "edition": edition},
+        })
+    return categories
+
+
+# Registered sources: keep in step with lib/constants/sourceRegistry.ts
+SOURCES = {
+    "hk01": {
+        "nav_url": "https://www.hk01.com/",
+        "base_url": "https://www.hk01.com",
+        "parse": parse_hk01,
+        # Older schema seeds used hk01-zone-NN; those rows are matched by zoneId
+        "legacy": {"slug_pattern": r"^hk01-zone-\d+$", "metadata_key": "zoneId"},
+    },
+    "mingpao": {
+        "nav_url": "https://news.mingpao.com/pns/%E8%A6%81%E8%81%9E/section/latest/s00001",
+        "base_url": "https://news.mingpao.com/htm/",
+        "parse": parse_mingpao,
+    },
+}
+
+
+def fetch_html(url):
+    request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+    with urllib.request.urlopen(request, timeout=30) as response:
+        charset = response.headers.get_content_charset() or "utf-8"
+        return response.read().decode(charset, errors="replace")
+
+
+def dedupe(categories):
+    """Keep the first occurrence of each slug, in navigation order."""
+    seen = set()
+    unique = []
+    for category in categories:
+        if category["slug"] in seen:
+            continue
+        seen.add(category["slug"])
+        unique.append(category)
+    return unique
+
+
+def sql_literal(value):
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def build_legacy_cte(legacy):
+    """Existing rows under a legacy slug, paired with the incoming slug that replaces them."""
+    if not legacy:
+        return "SELECT NULL::uuid AS id, NULL::text AS new_slug WHERE false"
+    key = sql_literal(legacy["metadata_key"])
+    return f"""SELECT DISTINCT ON (c.id) c.id, i.slug AS new_slug
+	FROM scraper_categories c
+	JOIN src ON c.source_id = src.id
+	JOIN incoming i ON i.metadata->>{key} = c.metadata->>{key}
+	WHERE c.slug ~ {sql_literal(legacy["slug_pattern"])}
+	  AND NOT EXISTS (
+		SELECT 1 FROM scraper_categories t WHERE t.source_id = src.id AND t.slug = i.slug
+	  )
+	ORDER BY c.id, i.priority"""
+
+
+def build_sync_sql(source_key, categories, keep_slugs, legacy=None):
+    """Single statement: rename legacy rows, upsert changed/new rows, deactivate vanished ones."""
+    values = ",\n\t\t".join(
+        "({slug}, {name}, {priority}, {metadata}::jsonb)".format(
+            slug=sql_literal(c["slug"]),
+            name=sql_literal(c["name"]),
+            priority=(index + 1) * 10,
+            metadata=sql_literal(json.dumps(c["metadata"], ensure_ascii=False, sort_keys=True)),
+        )
+        for index, c in enumerate(categories)
+    )
+    keep = ", ".join(sql_literal(slug) for slug in sorted(keep_slugs)) or "NULL"
+
+    return f"""-- scraper_categories sync for '{source_key}': {len(categories)} categories
+WITH src AS (
+	SELECT id FROM news_sources WHERE source_key = {sql_literal(source_key)}
+),
+incoming (slug, name, priority, metadata) AS (
+	VALUES
+		{values}
+),
+legacy AS (
+	{build_legacy_cte(legacy)}
+),
+migrated AS (
+	UPDATE scraper_categories c
+	SET slug = i.slug,
+	    name = i.name,
+	    is_enabled = true,
+	    metadata = COALESCE(c.metadata, '{{}}'::jsonb) || i.metadata
+	FROM legacy l
+	JOIN incoming i ON i.slug = l.new_slug
+	WHERE c.id = l.id
+	RETURNING c.slug
+),
+upserted AS (
+	INSERT INTO scraper_categories AS c (source_id, slug, name, priority, is_enabled, metadata)
+	SELECT src.id, i.slug, i.name, i.priority, true, i.metadata
+	FROM src CROSS JOIN incoming i
+	WHERE i.slug NOT IN (SELECT new_slug FROM legacy)
+	ON CONFLICT (source_id, slug) DO UPDATE
+		SET name = EXCLUDED.name,
+		    is_enabled = true,
+		    metadata = COALESCE(c.metadata, '{{}}'::jsonb) || EXCLUDED.metadata
+		WHERE c.name IS DISTINCT FROM EXCLUDED.name
+		   OR c.is_enabled IS NOT TRUE
+		   OR NOT (COALESCE(c.metadata, '{{}}'::jsonb) @> EXCLUDED.metadata)
+	RETURNING c.slug
+),
+deactivated AS (
+	UPDATE scraper_categories c
+	SET is_enabled = false
+	FROM src
+	WHERE c.source_id = src.id
+	  AND c.is_enabled
+	  AND c.slug NOT IN (SELECT slug FROM incoming)
+	  AND c.slug NOT IN ({keep})
+	  AND c.id NOT IN (SELECT id FROM legacy)
+	RETURNING c.slug
+)
+SELECT (SELECT count(*) FROM migrated) AS migrated,
+       (SELECT count(*) FROM upserted) AS upserted,
+       (SELECT count(*) FROM deactivated) AS deactivated;
+"""
+
+
+def load_current(conn, source_key):
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT c.slug, c.name, c.is_enabled, c.metadata
+            FROM scraper_categories c
+            JOIN news_sources s ON s.id = c.source_id
+            WHERE s.source_key = %s
+            """,
+            (source_key,),
+        )
+        return {row[0]: {"name": row[1], "is_enabled": row[2], "metadata": row[3] or {}} for row in cur.fetchall()}
+
+
+def match_legacy(current, categories, legacy):
+    """Map legacy slug -> incoming slug, mirroring the legacy CTE of build_sync_sql."""
+    if not legacy:
+        return {}
+    pattern = re.compile(legacy["slug_pattern"])
+    key = legacy["metadata_key"]
+    matches = {}
+    for slug, existing in current.items():
+        if not pattern.match(slug):
+            continue
+        for category in categories:
+            if category["slug"] in current:
+                continue
+            if str(existing["metadata"].get(key)) == str(category["metadata"].get(key)):
+                matches[slug] = category["slug"]
+                break
+    return matches
+
+
+def diff_categories(current, categories, keep_slugs, legacy=None):
+    incoming = {c["slug"]: c for c in categories}
+    migrated = match_legacy(current, categories, legacy)
+    migrated_to = set(migrated.values())
+    diff = {
+        "migrated": [f"{old} -> {new}" for old, new in migrated.items()],
+        "added": [], "renamed": [], "reactivated": [], "metadata": [], "deactivated": [], "unchanged": 0,
+    }
+    for slug, category in incoming.items():
+        existing = current.get(slug)
+        if existing is None:
+            if slug not in migrated_to:
+                diff["added"].append(slug)
+            continue
+        changed = False
+        if existing["name"] != category["name"]:
+            diff["renamed"].append(slug)
+            changed = True
+        if not existing["is_enabled"]:
+            diff["reactivated"].append(slug)
+            changed = True
+        if any(existing["metadata"].get(k) != v for k, v in category["metadata"].items()):
+            diff["metadata"].append(slug)
+            changed = True
+        if not changed:
+            diff["unchanged"] += 1
+    for slug, existing in current.items():
+        if slug not in incoming and existing["is_enabled"] and slug not in keep_slugs and slug not in migrated:
+            diff["deactivated"].append(slug)
+    return diff
+
+
+def print_diff(diff):
+    for key in ("migrated", "added", "renamed", "reactivated", "metadata", "deactivated"):
+        print(f"{key:12} {len(diff[key]):4}", file=sys.stderr)
+        for slug in diff[key][:20]:
+            print(f"    {slug}", file=sys.stderr)
+    print(f"{'unchanged':12} {diff['unchanged']:4}", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sync scraper_categories from navigation HTML")
+    parser.add_argument("source", choices=sorted(SOURCES), help="registered source key")
+    parser.add_argument("--html-file", help="parse a saved HTML file instead of fetching the live page")
+    parser.add_argument("--output", help="write SQL to this file (default: stdout)")
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"), help="Postgres URL for diff/apply")
+    parser.add_argument("--apply", action="store_true", help="execute the statement (requires --database-url)")
+    parser.add_argument("--keep", action="append", default=[], help="slug that must never be deactivated")
+    args = parser.parse_args()
+
+    source = SOURCES[args.source]
+    if args.html_file:
+        with open(args.html_file, encoding="utf-8") as f:
+            html = f.read()
+    else:
+        html = fetch_html(source["nav_url"])
+
+    categories = dedupe(source["parse"](html, source["base_url"]))
+    if not categories:
+        # An empty parse would deactivate everything: refuse instead
+        print(f"No categories found for {args.source}; navigation markup may have changed.", file=sys.stderr)
+        return 1
+
+    keep_slugs = DEFAULT_KEEP_SLUGS | set(args.keep)
+    sql = build_sync_sql(args.source, categories, keep_slugs, source.get("legacy"))
+    print(f"Parsed {len(categories)} categories for {args.source}", file=sys.stderr)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(sql)
+        print(f"Wrote {args.output}", file=sys.stderr)
+    elif not args.apply:
+        print(sql)
+
+    if args.database_url:
+        import psycopg
+
+        with psycopg.connect(args.database_url) as conn:
+            current = load_current(conn, args.source)
+            print_diff(diff_categories(current, categories, keep_slugs, source.get("legacy")))
+            if args.apply:
+                with conn.cursor() as cur:
+                    cur.execute(sql)
+                    migrated, upserted, deactivated = cur.fetchone()
+                conn.commit()
+                print(
+                    f"Applied: {migrated} migrated, {upserted} upserted, {deactivated} deactivated",
+                    file=sys.stderr,
+                )
+    elif args.apply:
+        print("--apply requires --database-url or DATABASE_URL", file=sys.stderr)
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Analyze the automation run log (logs/automation-run*.jsonl[.gz]).
+
+Streams every segment line by line, so rotated months of logs are read in
+constant memory (per-category/per-error aggregates only). Reports:
+  - throughput over time (articles processed / failed, URLs discovered)
+  - slowest categories (mean / max article time, mean per stage)
+  - slowest article URLs
+  - error hot spots by stage + normalized message, category and host
+  - runs that started but never logged run_end
+
+Usage:
+  python analyze_run_log.py                          # everything under ./logs
+  python analyze_run_log.py logs/automation-run-20261019T101500123Z-1a2b3c4d.jsonl.gz
+  python analyze_run_log.py --since 2026-10-18 --bucket 15
+  python analyze_run_log.py --pipeline process --top 20
+  python analyze_run_log.py --json > report.json
+
+The log format is written by lib/utils/automationLogger.ts.
+"""
+import argparse
+import gzip
+import heapq
+import json
+import os
+import re
+import sys
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlparse
+
+LOG_PREFIX = "automation-run"
+DEFAULT_LOG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs")
+
+
+def collect_segments(paths):
+    """Expand directories into log segments, oldest first (active file last)."""
+    segments = []
+    for path in paths:
+        if os.path.isdir(path):
+            names = [
+                name
+                for name in os.listdir(path)
+                if name.startswith(LOG_PREFIX) and (name.endswith(".jsonl") or name.endswith(".jsonl.gz"))
+            ]
+            rotated = sorted(name for name in names if name != f"{LOG_PREFIX}.jsonl")
+            active = [name for name in names if name == f"{LOG_PREFIX}.jsonl"]
+            segments.extend(os.path.join(path, name) for name in rotated + active)
+        elif os.path.exists(path):
+            segments.append(path)
+        else:
+            print(f"⚠️  Skipping missing path: {path}", file=sys.stderr)
+    return segments
+
+
+def iter_events(segments, stats):
+    for segment in segments:
+        opener = gzip.open if segment.endswith(".gz") else open
+        try:
+            with opener(segment, "rt", encoding="utf-8", errors="replace") as handle:
+                for line in handle:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        event = json.loads(line)
+                    except json.JSONDecodeError:
+                        stats["malformed_lines"] += 1
+                        continue
+                    if isinstance(event, dict):
+                        yield event
+        except (OSError, EOFError) as exc:
+            # A truncated .gz (crash mid-compression) still yields what it has
+            print(f"⚠️  Could not fully read {segment}: {exc}", file=sys.stderr)
+
+
+def parse_ts(value):
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def parse_bound(value):
+    parsed = parse_ts(value)
+    if parsed is None:
+        raise argparse.ArgumentTypeError(f"not an ISO date/time: {value}")
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+_NUMBER = re.compile(r"\d+")
+_URL = re.compile(r"https?://\S+")
+_QUOTED = re.compile(r"([\"']).*?\1")
+
+
+def normalize_message(message):
+    """Collapse ids, URLs and quoted values so equal failures group together."""
+    text = _URL.sub("<url>", message or "")
+    text = _QUOTED.sub("<str>", text)
+    text = _NUMBER.sub("N", text)
+    return text.strip()[:160]
+
+
+class Analyzer:
+    def __init__(self, bucket_minutes, top):
+        self.bucket = timedelta(minutes=bucket_minutes)
+        self.top = top
+        self.throughput = defaultdict(lambda: {"processed": 0, "failed": 0, "discovered": 0, "saved": 0})
+        self.categories = defaultdict(
+            lambda: {"articles": 0, "failed": 0, "total_ms": 0, "max_ms": 0, "stages": defaultdict(int), "discovery_ms": 0, "discoveries": 0}
+        )
+        self.slow_urls = []  # min-heap of (totalMs, url, category)
+        self.errors = defaultdict(lambda: {"count": 0, "sample_url": None, "last_seen": None})
+        self.errors_by_category = defaultdict(int)
+        self.errors_by_host = defaultdict(int)
+        self.runs = {"started": 0, "ended": 0, "by_status": defaultdict(int)}
+        self.open_runs = {}
+        self.first_ts = None
+        self.last_ts = None
+
+    def bucket_key(self, ts):
+        epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+        steps = (ts - epoch) // self.bucket
+        return epoch + steps * self.bucket
+
+    def forget_run(self, run_id):
+        """Drop an open run whose run_end falls outside the analyzed window."""
+        self.open_runs.pop(run_id, None)
+
+    def add(self, event, ts):
+        if ts is not None:
+            self.first_ts = ts if self.first_ts is None else min(self.first_ts, ts)
+            self.last_ts = ts if self.last_ts is None else max(self.last_ts, ts)
+        kind = event.get("type")
+        category = event.get("categorySlug") or "(none)"
+
+        if kind == "run_start":
+            self.runs["started"] += 1
+            self.open_runs[event.get("runId")] = event.get("ts")
+        elif kind == "run_end":
+            self.runs["ended"] += 1
+            self.runs["by_status"][event.get("status") or "unknown"] += 1
+            self.open_runs.pop(event.get("runId"), None)
+        elif kind == "discovery":
+            bucket = self.throughput[self.bucket_key(ts)] if ts else None
+            if bucket is not None:
+                bucket["discovered"] += event.get("discovered") or 0
+                bucket["saved"] += event.get("saved") or 0
+            entry = self.categories[category]
+            entry["discoveries"] += 1
+            entry["discovery_ms"] += event.get("durationMs") or 0
+        elif kind == "article":
+            total_ms = event.get("totalMs") or 0
+            failed = event.get("status") == "failed"
+            if ts:
+                self.throughput[self.bucket_key(ts)]["failed" if failed else "processed"] += 1
+            entry = self.categories[category]
+            entry["articles"] += 1
+            entry["failed"] += 1 if failed else 0
+            entry["total_ms"] += total_ms
+            entry["max_ms"] = max(entry["max_ms"], total_ms)
+            for stage, ms in (event.get("stages") or {}).items():
+                entry["stages"][stage] += ms or 0
+            item = (total_ms, event.get("url") or "", category)
+            if len(self.slow_urls) < self.top:
+                heapq.heappush(self.slow_urls, item)
+            elif item > self.slow_urls[0]:
+                heapq.heapreplace(self.slow_urls, item)
+        elif kind == "error":
+            key = (event.get("stage") or "unknown", normalize_message(event.get("message")))
+            entry = self.errors[key]
+            entry["count"] += 1
+            entry["sample_url"] = entry["sample_url"] or event.get("url")
+            entry["last_seen"] = event.get("ts")
+            self.errors_by_category[category] += 1
+            host = urlparse(event.get("url") or "").hostname
+            if host:
+                self.errors_by_host[host] += 1
+
+    def report(self):
+        def top_items(mapping, key):
+            return sorted(mapping.items(), key=key, reverse=True)[: self.top]
+
+        categories = []
+        for slug, entry in self.categories.items():
+            if not entry["articles"] and not entry["discoveries"]:
+                continue
+            articles = entry["articles"] or 1
+            categories.append(
+                {
+                    "category": slug,
+                    "articles": entry["articles"],
+                    "failed": entry["failed"],
+                    "mean_ms": round(entry["total_ms"] / articles) if entry["articles"] else None,
+                    "max_ms": entry["max_ms"] if entry["articles"] else None,
+                    "mean_stage_ms": {stage: round(ms / articles) for stage, ms in sorted(entry["stages"].items())},
+                    "discoveries": entry["discoveries"],
+                    "mean_discovery_ms": round(entry["discovery_ms"] / entry["discoveries"]) if entry["discoveries"] else None,
+                }
+            )
+        categories.sort(key=lambda c: (c["mean_ms"] or 0, c["mean_discovery_ms"] or 0), reverse=True)
+
+        return {
+            "window": {
+                "first": self.first_ts.isoformat() if self.first_ts else None,
+                "last": self.last_ts.isoformat() if self.last_ts else None,
+            },
+            "runs": {
+                "started": self.runs["started"],
+                "ended": self.runs["ended"],
+                "by_status": dict(self.runs["by_status"]),
+                "unfinished": [{"runId": run_id, "started": started} for run_id, started in self.open_runs.items()],
+            },
+            "throughput": [
+                {"bucket": bucket.isoformat(), **counts} for bucket, counts in sorted(self.throughput.items())
+            ],
+            "slowest_categories": categories[: self.top],
+            "slowest_urls": [
+                {"url": url, "category": category, "total_ms": ms}
+                for ms, url, category in sorted(self.slow_urls, reverse=True)
+            ],
+            "error_hot_spots": [
+                {"stage": stage, "message": message, **entry}
+                for (stage, message), entry in top_items(self.errors, key=lambda item: item[1]["count"])
+            ],
+            "errors_by_category": dict(top_items(self.errors_by_category, key=lambda item: item[1])),
+            "errors_by_host": dict(top_items(self.errors_by_host, key=lambda item: item[1])),
+        }
+
+
+def format_ms(ms):
+    if ms is None:
+        return "-"
+    return f"{ms / 1000:.1f}s" if ms >= 1000 else f"{ms}ms"
+
+
+def print_report(report, stats):
+    window = report["window"]
+    runs = report["runs"]
+    print(f"📊 Run log {window['first'] or '-'} → {window['last'] or '-'}")
+    print(f"   {stats['events']} events from {stats['segments']} segment(s), {stats['malformed_lines']} malformed line(s)")
+    print(f"   runs: {runs['started']} started, {runs['ended']} ended {runs['by_status']}")
+    for run in runs["unfinished"][:10]:
+        print(f"   ⚠️  unfinished run {run['runId']} (started {run['started']})")
+
+    print("\n⏱️  Throughput")
+    print(f"   {'bucket':<26} {'ok':>6} {'failed':>6} {'found':>6} {'saved':>6}")
+    for row in report["throughput"]:
+        print(f"   {row['bucket']:<26} {row['processed']:>6} {row['failed']:>6} {row['discovered']:>6} {row['saved']:>6}")
+
+    print("\n🐢 Slowest categories")
+    for row in report["slowest_categories"]:
+        stages = ", ".join(f"{stage} {format_ms(ms)}" for stage, ms in row["mean_stage_ms"].items())
+        print(
+            f"   {row['category']:<24} mean {format_ms(row['mean_ms']):>7} max {format_ms(row['max_ms']):>7}"
+            f"  {row['articles']} articles ({row['failed']} failed)"
+            f"  discovery {format_ms(row['mean_discovery_ms'])}"
+            + (f"  [{stages}]" if stages else "")
+        )
+
+    print("\n🐢 Slowest URLs")
+    for row in report["slowest_urls"]:
+        print(f"   {format_ms(row['total_ms']):>7}  {row['category']:<20} {row['url']}")
+
+    print("\n❌ Error hot spots")
+    for row in report["error_hot_spots"]:
+        print(f"   {row['count']:>5}  [{row['stage']}] {row['message']}")
+        if row["sample_url"]:
+            print(f"          e.g. {row['sample_url']}")
+    if report["errors_by_category"]:
+        print(f"\n   by category: {report['errors_by_category']}")
+    if report["errors_by_host"]:
+        print(f"   by host:     {report['errors_by_host']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analyze the automation JSONL run log")
+    parser.add_argument("paths", nargs="*", default=[DEFAULT_LOG_DIR], help="log files or directories (default: ./logs)")
+    parser.add_argument("--since", type=parse_bound, help="ignore events before this ISO date/time (UTC)")
+    parser.add_argument("--until", type=parse_bound, help="ignore events after this ISO date/time (UTC)")
+    parser.add_argument("--pipeline", choices=["discovery", "article", "process"], help="only runs of this pipeline")
+    parser.add_argument("--bucket", type=int, default=60, help="throughput bucket size in minutes (default 60)")
+    parser.add_argument("--top", type=int, default=10, help="rows per ranking (default 10)")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    segments = collect_segments(args.paths)
+    if not segments:
+        print("❌ No run log segments found", file=sys.stderr)
+        return 1
+
+    stats = {"segments": len(segments), "events": 0, "malformed_lines": 0}
+    analyzer = Analyzer(max(1, args.bucket), max(1, args.top))
+    # runId -> pipeline of the runs in progress; only needed to filter by pipeline
+    run_pipelines = {}
+
+    for event in iter_events(segments, stats):
+        ts = parse_ts(event.get("ts"))
+        if ts is not None and ts.tzinfo is None:
+            ts = ts.replace(tzinfo=timezone.utc)
+        if args.pipeline:
+            # Tracked before the time filter: a run that started before --since still has later events
+            run_id = event.get("runId")
+            if event.get("type") == "run_start":
+                run_pipelines[run_id] = event.get("pipeline")
+            pipeline = run_pipelines.get(run_id, event.get("pipeline"))
+            if event.get("type") == "run_end":
+                run_pipelines.pop(run_id, None)
+            if pipeline != args.pipeline:
+                continue
+        if (args.since and ts and ts < args.since) or (args.until and ts and ts > args.until):
+            if event.get("type") == "run_end":
+                analyzer.forget_run(event.get("runId"))
+            continue
+        stats["events"] += 1
+        analyzer.add(event, ts)
+
+    report = analyzer.report()
+    if args.json:
+        json.dump({"stats": stats, **report}, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        print_report(report, stats)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
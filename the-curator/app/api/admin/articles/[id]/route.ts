@@ -1,5 +1,7 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { supabaseAdmin } from '@/lib/db/supabase';
+import { restoreArchivedNewslist } from '@/lib/repositories/newslist';
+import { invalidateArticleCache } from '@/lib/services/newsCache';
 
 const formatErrorResponse = (status: number, message: string) => {
   return NextResponse.json(
@@ -141,6 +143,8 @@ export async function PATCH(request: NextRequest, { params }: { params: { id?: s
       await db.from('article_images').delete().in('id', payload.removeImageIds);
     }
 
+    invalidateArticleCache(id);
+
     const article = await fetchArticle(id);
     return NextResponse.json({ success: true, data: article });
   } catch (error: unknown) {
@@ -174,8 +178,11 @@ export async function DELETE(request: NextRequest, { params }: { params: { id?:
       return formatErrorResponse(500, error.message);
     }
 
+    invalidateArticleCache(id);
+
     const newslistId = request.nextUrl.searchParams.get('newslistId');
     if (newslistId) {
+      await restoreArchivedNewslist({ ids: [newslistId] });
       await db
         .from('newslist')
         .update({
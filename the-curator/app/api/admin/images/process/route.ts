@@ -0,0 +1,47 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { processPendingImages } from '@/lib/services/imageDerivatives';
+import { isAuthorizedCronRequest } from '@/lib/utils/cronAuth';
+
+export const runtime = 'nodejs';
+
+const DEFAULT_LIMIT = 20;
+const MAX_LIMIT = 50;
+
+async function runImageWorker(limit: number) {
+  try {
+    const result = await processPendingImages(limit);
+    return NextResponse.json({ success: true, ...result });
+  } catch (error) {
+    const message = error instanceof Error ? error.message : String(error);
+    console.error('[ImagesAPI] Failed to process images:', message);
+    return NextResponse.json(
+      { success: false, message: 'Failed to process images', error: message },
+      { status: 500 }
+    );
+  }
+}
+
+/**
+ * GET /api/admin/images/process
+ *
+ * Scheduled run of the derivative worker (Vercel Cron, see vercel.json).
+ */
+export async function GET(request: NextRequest) {
+  if (!isAuthorizedCronRequest(request)) {
+    return NextResponse.json({ success: false, message: 'Unauthorized' }, { status: 401 });
+  }
+  return runImageWorker(DEFAULT_LIMIT);
+}
+
+/**
+ * POST /api/admin/images/process
+ *
+ * Manual run of the derivative worker: fetches images of newly imported
+ * articles, writes their AVIF/WebP derivatives and records dimensions.
+ * Body: { limit?: number }
+ */
+export async function POST(request: NextRequest) {
+  const body = await request.json().catch(() => ({}));
+  const requestedLimit = typeof body?.limit === 'number' ? Math.max(1, body.limit) : DEFAULT_LIMIT;
+  return runImageWorker(Math.min(MAX_LIMIT, requestedLimit));
+}
@@ -0,0 +1,64 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { archiveExtractedNewslist } from '@/lib/repositories/newslist';
+import { pruneStoryBuckets } from '@/lib/repositories/storyClusters';
+import { isAuthorizedCronRequest } from '@/lib/utils/cronAuth';
+
+const DEFAULT_BATCH_SIZE = 5000;
+const MAX_BATCH_SIZE = 20000;
+const DEFAULT_MIN_AGE_HOURS = 24;
+
+function errorMessage(error: unknown): string {
+  return error instanceof Error ? error.message : (error as { message?: string })?.message ?? String(error);
+}
+
+async function runArchive(batchSize: number, minAgeHours: number) {
+  let archived: number;
+  try {
+    archived = await archiveExtractedNewslist(batchSize, minAgeHours);
+  } catch (error) {
+    const message = errorMessage(error);
+    console.error('[NewslistArchiveAPI] Failed to archive entries:', message);
+    return NextResponse.json(
+      { success: false, message: 'Failed to archive newslist entries', error: message },
+      { status: 500 }
+    );
+  }
+
+  // The archive has committed by now; a failed prune is reported on its own
+  try {
+    const prunedStoryBuckets = await pruneStoryBuckets();
+    return NextResponse.json({ success: true, archived, prunedStoryBuckets });
+  } catch (error) {
+    const message = errorMessage(error);
+    console.error('[NewslistArchiveAPI] Failed to prune story buckets:', message);
+    return NextResponse.json({ success: true, archived, prunedStoryBuckets: null, pruneError: message });
+  }
+}
+
+/**
+ * GET /api/admin/newslist/archive
+ *
+ * Scheduled archive run with the default batch size and age (Vercel Cron, see vercel.json).
+ */
+export async function GET(request: NextRequest) {
+  if (!isAuthorizedCronRequest(request)) {
+    return NextResponse.json({ success: false, message: 'Unauthorized' }, { status: 401 });
+  }
+  return runArchive(DEFAULT_BATCH_SIZE, DEFAULT_MIN_AGE_HOURS);
+}
+
+/**
+ * POST /api/admin/newslist/archive
+ *
+ * Moves extracted newslist rows to the month-partitioned cold tier so the
+ * hot queue stays small, and prunes story LSH buckets older than the match window.
+ * A failed prune does not fail the request: it is reported as pruneError.
+ * Body: { batchSize?: number, minAgeHours?: number }
+ */
+export async function POST(request: NextRequest) {
+  const body = await request.json().catch(() => ({}));
+  const requestedBatch = typeof body?.batchSize === 'number' ? Math.max(1, body.batchSize) : DEFAULT_BATCH_SIZE;
+  const batchSize = Math.min(MAX_BATCH_SIZE, requestedBatch);
+  const minAgeHours = typeof body?.minAgeHours === 'number' ? Math.max(0, body.minAgeHours) : DEFAULT_MIN_AGE_HOURS;
+  return runArchive(batchSize, minAgeHours);
+}
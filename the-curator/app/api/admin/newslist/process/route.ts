@@ -4,12 +4,18 @@ import chromium from "@sparticuz/chromium";
 import { supabaseAdmin, supabase } from "@/lib/db/supabase";
 import { ArticleScraper } from "@/lib/scrapers/ArticleScraper";
 import { hk01SourceConfig } from "@/lib/constants/sources";
-import { getSourceConfig } from "@/lib/constants/sourceRegistry";
+import { getSourceConfig, getNetworkPolicy } from "@/lib/constants/sourceRegistry";
+import { applyNetworkPolicy, waitForArticleRender, type NetworkStats } from "@/lib/scrapers/networkPolicy";
 import { importArticle } from "@/lib/supabase/articlesClient";
+import { restoreArchivedNewslist } from "@/lib/repositories/newslist";
+import { processPendingImages } from "@/lib/services/imageDerivatives";
 import type { ScrapedArticle } from "@/lib/types/database";
 import { logException, extractErrorDetails } from "@/lib/services/exceptionLogger";
+import { RunLog, createStageTimings } from "@/lib/utils/automationLogger";
 
 const MAX_BATCH = 25;
+// Derivatives built at the end of an automation batch; the scheduled worker picks up the rest
+const IMAGES_PER_RUN = 10;
 const FALLBACK_SOURCE_CONFIG = hk01SourceConfig;
 
 // Check if running in production (Vercel)
@@ -68,6 +74,13 @@ export async function POST(request: NextRequest) {
     );
   }
 
+  if (ids.length > 0) {
+    // Reprocessing an archived entry: move it back to the hot queue first
+    await restoreArchivedNewslist({ ids }).catch(restoreError => {
+      console.warn("[Process] Failed to restore archived newslist entries:", restoreError);
+    });
+  }
+
   let query = dbClient
     .from("newslist")
     .select(
@@ -108,6 +121,10 @@ export async function POST(request: NextRequest) {
     );
   }
 
+  const runLog = RunLog.start("process", {
+    meta: { entries: entries.length, byIds: ids.length > 0 },
+  });
+
   let browser;
   try {
     if (isProduction) {
@@ -160,6 +177,9 @@ export async function POST(request: NextRequest) {
       helpfulMessage = 'Chrome not found. Run: npx puppeteer browsers install chrome';
     }
     
+    runLog.error({ stage: "launch_browser", error: helpfulMessage });
+    await runLog.end({ status: "failed", processed: 0, failed: entries.length });
+
     await logException(dbClient, {
       errorType: errorDetails.type,
       errorMessage: helpfulMessage,
@@ -180,84 +200,111 @@ export async function POST(request: NextRequest) {
   const results: Array<{
     id: string;
     sourceArticleId?: string | null;
-    status: "imported" | "existing" | "failed";
+    status: "imported" | "updated" | "existing" | "failed";
     message: string;
     articleId?: string;
+    network?: NetworkStats;
+    renderMs?: number;
   }> = [];
   let imported = 0;
+  let updated = 0;
   let existing = 0;
   let failed = 0;
 
   try {
     for (const entry of entries) {
       const page = await browser.newPage();
+      // Normalize entry.source whether DB returned an object or an array
+      let sourceKey = "hk01";
+      const srcCandidate = Array.isArray(entry.source) ? entry.source[0] : entry.source;
+      if (srcCandidate && typeof srcCandidate === "object") {
+        // use a type assertion to avoid TS narrowing to `never` for unknown DB shapes
+        sourceKey = (srcCandidate as any)?.source_key ?? "hk01";
+      }
+      const networkPolicy = getNetworkPolicy(sourceKey);
+      const entryMeta = (entry.meta as { scheduler_category_slug?: string | null; category?: string | null } | null) ?? null;
+      const categorySlug = entryMeta?.scheduler_category_slug ?? entryMeta?.category ?? null;
+      const timings = createStageTimings();
+      let stage = "render";
+      let network: NetworkStats | undefined;
+      let renderMs: number | undefined;
       try {
-        await page.setRequestInterception(true);
-        page.on("request", requestEvent => {
-          const resourceType = requestEvent.resourceType();
-          if (["font", "stylesheet", "media"].includes(resourceType)) {
-            requestEvent.abort();
-          } else {
-            requestEvent.continue();
-          }
-        });
+        network = await applyNetworkPolicy(page, networkPolicy);
         await page.setUserAgent(
           "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/117.0.0.0 Safari/537.36"
         );
-        await page.goto(entry.url, { waitUntil: "domcontentloaded", timeout: 15000 });
-        await page.waitForSelector('[data-testid="article-top-section"]', { timeout: 5000 }).catch(() => {
-          /* continue even if selector missing */
-        });
-        await (page.evaluate as any)(() => {
-          window.scrollTo(0, document.body.scrollHeight);
+        const html = await timings.measure("render", async () => {
+          await page.goto(entry.url, { waitUntil: "domcontentloaded", timeout: 15000 });
+          await waitForArticleRender(page, networkPolicy);
+          return page.content();
         });
-        await new Promise(resolve => setTimeout(resolve, 2500));
-        const html = await page.content();
+        renderMs = timings.stages.render;
 
-        // Normalize entry.source whether DB returned an object or an array
-        let sourceKey = "hk01";
-        const srcCandidate = Array.isArray(entry.source) ? entry.source[0] : entry.source;
-        if (srcCandidate && typeof srcCandidate === "object") {
-          // use a type assertion to avoid TS narrowing to `never` for unknown DB shapes
-          sourceKey = (srcCandidate as any)?.source_key ?? "hk01";
-        }
-        
         // Get source config using sourceRegistry (supports both HK01 and MingPao)
+        stage = "parse";
         const sourceConfig = getSourceConfig(sourceKey) ?? FALLBACK_SOURCE_CONFIG;
         const scraper = new ArticleScraper(sourceConfig);
-        const scrapeResult = await scraper.scrapeArticle(html, entry.url);
+        const scrapeResult = await timings.measure("parse", () => scraper.scrapeArticle(html, entry.url));
 
         if (!scrapeResult.success || !scrapeResult.data) {
           throw new Error(scrapeResult.error || "Scraper failed to return article data");
         }
 
-        const importResult = await importArticle(scrapeResult.data as ScrapedArticle, entry.url, {
-          sourceKey: sourceKey,
-        });
+        stage = "import";
+        const importResult = await timings.measure("import", () =>
+          importArticle(scrapeResult.data as ScrapedArticle, entry.url, {
+            sourceKey: sourceKey,
+          })
+        );
 
         if (!importResult.success) {
           failed++;
+          runLog.error({ stage, error: importResult.error || importResult.message, url: entry.url, categorySlug, sourceKey });
+          runLog.article({
+            url: entry.url,
+            categorySlug,
+            sourceKey,
+            status: "failed",
+            stages: timings.stages,
+            totalMs: timings.totalMs(),
+          });
           results.push({
             id: entry.id,
             sourceArticleId: scrapeResult.data.articleId,
             status: "failed",
             message: importResult.error || importResult.message,
+            network,
+            renderMs,
           });
           continue;
         }
 
         if (importResult.isNew) {
           imported++;
+        } else if (importResult.isUpdated) {
+          updated++;
         } else {
           existing++;
         }
 
+        const status = importResult.isNew ? "imported" : importResult.isUpdated ? "updated" : "existing";
         results.push({
           id: entry.id,
           sourceArticleId: scrapeResult.data.articleId,
           articleId: importResult.articleId,
-          status: importResult.isNew ? "imported" : "existing",
+          status,
           message: importResult.message,
+          network,
+          renderMs,
+        });
+        runLog.article({
+          url: entry.url,
+          categorySlug,
+          sourceKey,
+          status,
+          articleId: importResult.articleId,
+          stages: timings.stages,
+          totalMs: timings.totalMs(),
         });
 
         // Mark newslist entry as extracted (successfully processed)
@@ -275,11 +322,22 @@ export async function POST(request: NextRequest) {
       } catch (entryError) {
         failed++;
         const errorMessage = entryError instanceof Error ? entryError.message : String(entryError);
+        runLog.error({ stage, error: entryError, url: entry.url, categorySlug, sourceKey });
+        runLog.article({
+          url: entry.url,
+          categorySlug,
+          sourceKey,
+          status: "failed",
+          stages: timings.stages,
+          totalMs: timings.totalMs(),
+        });
         results.push({
           id: entry.id,
           sourceArticleId: entry.source_article_id,
           status: "failed",
           message: errorMessage,
+          network,
+          renderMs,
         });
         await dbClient
           .from("newslist")
@@ -296,6 +354,9 @@ export async function POST(request: NextRequest) {
     }
   } catch (globalError) {
     const errorDetails = extractErrorDetails(globalError);
+    runLog.error({ stage: "process_articles", error: globalError });
+    await runLog.end({ status: "failed", processed: results.length, failed: failed + (entries.length - results.length) });
+
     await logException(dbClient, {
       errorType: errorDetails.type,
       errorMessage: errorDetails.message,
@@ -306,7 +367,7 @@ export async function POST(request: NextRequest) {
       requestUrl: request.url,
       requestBody: body,
       severity: 'critical',
-      metadata: { processedCount: results.length, imported, existing, failed },
+      metadata: { processedCount: results.length, imported, updated, existing, failed },
     });
     
     await browser?.close();
@@ -317,6 +378,7 @@ export async function POST(request: NextRequest) {
       error: errorDetails.message,
       processed: results.length,
       imported,
+      updated,
       existing,
       failed,
       results,
@@ -325,12 +387,47 @@ export async function POST(request: NextRequest) {
     await browser.close();
   }
 
+  // Per-batch render cost, to compare against the per-article network counters
+  const networkTotals = results.reduce(
+    (totals, result) => {
+      if (result.network) {
+        totals.allowedRequests += result.network.allowedRequests;
+        totals.blockedRequests += result.network.blockedRequests;
+        totals.stubbedRequests += result.network.stubbedRequests;
+        totals.allowedBytes += result.network.allowedBytes;
+      }
+      totals.renderMs += result.renderMs ?? 0;
+      return totals;
+    },
+    { allowedRequests: 0, blockedRequests: 0, stubbedRequests: 0, allowedBytes: 0, renderMs: 0 }
+  );
+
+  await runLog.end({
+    status: "completed",
+    processed: imported + updated + existing,
+    failed,
+    meta: { network: networkTotals },
+  });
+
+  // Give freshly imported articles their derivatives without waiting for the next scheduled worker run
+  let images: Awaited<ReturnType<typeof processPendingImages>> | { error: string } | null = null;
+  if (processAllPending && imported + updated > 0) {
+    images = await processPendingImages(IMAGES_PER_RUN).catch((imageError) => {
+      const message = imageError instanceof Error ? imageError.message : String(imageError);
+      console.warn("[Process] Image derivative worker failed:", message);
+      return { error: message };
+    });
+  }
+
   return NextResponse.json({
     success: true,
     processed: entries.length,
     imported,
+    updated,
     existing,
     failed,
+    network: networkTotals,
+    images,
     results,
   });
 }
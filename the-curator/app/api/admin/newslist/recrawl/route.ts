@@ -0,0 +1,44 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { requeueArticlesDueForRecrawl } from '@/lib/supabase/articlesClient';
+import { isAuthorizedCronRequest } from '@/lib/utils/cronAuth';
+
+const DEFAULT_LIMIT = 25;
+const MAX_LIMIT = 100;
+
+async function runRecrawl(limit: number) {
+  try {
+    const requeued = await requeueArticlesDueForRecrawl(limit);
+    return NextResponse.json({ success: true, requeued });
+  } catch (error) {
+    const message = error instanceof Error ? error.message : String(error);
+    console.error('[RecrawlAPI] Failed to requeue articles:', message);
+    return NextResponse.json(
+      { success: false, message: 'Failed to requeue articles for recrawl', error: message },
+      { status: 500 }
+    );
+  }
+}
+
+/**
+ * GET /api/admin/newslist/recrawl
+ *
+ * Scheduled requeue of due articles (Vercel Cron, see vercel.json).
+ */
+export async function GET(request: NextRequest) {
+  if (!isAuthorizedCronRequest(request)) {
+    return NextResponse.json({ success: false, message: 'Unauthorized' }, { status: 401 });
+  }
+  return runRecrawl(DEFAULT_LIMIT);
+}
+
+/**
+ * POST /api/admin/newslist/recrawl
+ *
+ * Requeues articles whose next_recrawl_at has passed so the process route
+ * re-scrapes them. Body: { limit?: number }
+ */
+export async function POST(request: NextRequest) {
+  const body = await request.json().catch(() => ({}));
+  const requestedLimit = typeof body?.limit === 'number' ? Math.max(1, body.limit) : DEFAULT_LIMIT;
+  return runRecrawl(Math.min(MAX_LIMIT, requestedLimit));
+}
@@ -1,5 +1,6 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { supabaseAdmin } from '@/lib/db/supabase';
+import { listNewslistEntries } from '@/lib/repositories/newslist';
 
 const DEFAULT_PAGE_SIZE = 20;
 const MAX_PAGE_SIZE = 100;
@@ -23,52 +24,22 @@ export async function GET(request: NextRequest) {
   const from = (page - 1) * limit;
   const to = from + limit - 1;
 
-  let query = supabaseAdmin
-    .from('newslist')
-    .select(
-      `id, source_article_id, url, status, attempt_count, last_processed_at, created_at, updated_at, error_log, meta, resolved_article_id,
-       source:news_sources(name, source_key)`,
-      { count: 'exact' }
-    )
-    .order('created_at', { ascending: false })
-    .range(from, to);
-
-  if (status) {
-    query = query.eq('status', status);
-  }
-
-  if (sourceKey) {
-    query = query.eq('news_sources.source_key', sourceKey);
-  }
-
-  if (category) {
-    query = query.eq('meta->>category', category);
-  }
-
-  if (search) {
-    const ilikeValue = `%${search}%`;
-    if (/^\d+$/.test(search)) {
-      query = query.ilike('source_article_id', ilikeValue);
-    } else {
-      query = query.ilike('url', ilikeValue);
-    }
-  }
-
-  const { data, error, count } = await query;
-
-  if (error) {
-    console.error('[NewslistAPI] Failed to fetch entries:', error.message);
+  try {
+    const { data, total } = await listNewslistEntries({ status, sourceKey, category, search, from, to });
+
+    return NextResponse.json({
+      success: true,
+      data,
+      total,
+      page,
+      pageSize: limit,
+    });
+  } catch (error) {
+    const message = error instanceof Error ? error.message : (error as { message?: string })?.message ?? String(error);
+    console.error('[NewslistAPI] Failed to fetch entries:', message);
     return NextResponse.json(
-      { success: false, message: 'Failed to load newslist entries', error: error.message },
+      { success: false, message: 'Failed to load newslist entries', error: message },
       { status: 500 }
     );
   }
-
-  return NextResponse.json({
-    success: true,
-    data: data || [],
-    total: count ?? data?.length ?? 0,
-    page,
-    pageSize: limit,
-  });
 }
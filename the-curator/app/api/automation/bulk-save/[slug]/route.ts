@@ -3,6 +3,8 @@ import { supabase, supabaseAdmin } from '@/lib/db/supabase';
 import { load } from 'cheerio';
 import type { ScraperCategory } from '@/lib/types/database';
 import { getNextScraperCategoryForSource, updateScraperCategoryLastRun } from '@/lib/repositories/scraperCategories';
+import { enqueueNewslistEntries } from '@/lib/repositories/newslist';
+import { RunLog } from '@/lib/utils/automationLogger';
 
 const USER_AGENT =
   'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/117.0.0.0 Safari/537.36';
@@ -149,11 +151,14 @@ export async function POST(_request: NextRequest, { params }: { params: RoutePar
   let candidates: ArticleCandidate[] = [];
   let selectedCategory: ScraperCategory | null = null;
   let zoneContext: { slug: string; name: string; url: string } | null = null;
+  const runLog = RunLog.start('discovery', { sourceKey: sourceConfig.key });
+  const discoveryStart = Date.now();
 
   try {
     if (sourceConfig.key === 'hk01') {
       selectedCategory = await getNextScraperCategoryForSource(sourceConfig.key);
       if (!selectedCategory) {
+        await runLog.end({ status: 'skipped', processed: 0, failed: 0, meta: { reason: 'no_category' } });
         return NextResponse.json(
           { success: false, error: 'No enabled HK01 scheduler category was found.' },
           { status: 404 }
@@ -209,10 +214,25 @@ export async function POST(_request: NextRequest, { params }: { params: RoutePar
     }
   } catch (error) {
     console.error('[BulkSave] Scraping error', error);
+    runLog.error({ stage: 'discover', error, categorySlug: selectedCategory?.slug, sourceKey: sourceConfig.key });
+    await runLog.end({ status: 'failed', processed: 0, failed: 1 });
     return NextResponse.json({ success: false, error: 'Failed to scrape article URLs.' }, { status: 500 });
   }
 
+  const discoveryMs = Date.now() - discoveryStart;
+  const logDiscovery = (saved: number, duplicates: number) =>
+    runLog.discovery({
+      categorySlug: zoneContext?.slug ?? null,
+      sourceKey: sourceConfig.key,
+      discovered: candidates.length,
+      saved,
+      duplicates,
+      durationMs: discoveryMs,
+    });
+
   if (candidates.length === 0) {
+    logDiscovery(0, 0);
+    await runLog.end({ status: 'empty', processed: 0, failed: 0 });
     return NextResponse.json({ success: false, error: 'No articles were discovered.' }, { status: 404 });
   }
 
@@ -223,41 +243,36 @@ export async function POST(_request: NextRequest, { params }: { params: RoutePar
     .single();
 
   if (!source?.id) {
+    runLog.error({ stage: 'enqueue', error: `Source ${sourceConfig.key} is not configured`, sourceKey: sourceConfig.key });
+    await runLog.end({ status: 'failed', processed: 0, failed: 1 });
     return NextResponse.json({ success: false, error: `Source ${sourceConfig.name} is not configured.` }, { status: 404 });
   }
 
+  // One round trip: the enqueue function dedups against both the hot queue and the archive
   let savedCount = 0;
   let duplicateCount = 0;
-  for (const article of candidates) {
-    const { data: existing } = await db
-      .from('newslist')
-      .select('id')
-      .eq('source_id', source.id)
-      .eq('source_article_id', article.articleId)
-      .limit(1)
-      .maybeSingle();
-
-    if (existing) {
-      duplicateCount++;
-      continue;
-    }
-
-    const { error } = await db.from('newslist').insert({
-      source_id: source.id,
-      source_article_id: article.articleId,
-      url: article.url,
-      status: 'pending',
-      meta: {
-        category: article.category ?? null,
-        title: article.title ?? null,
-        scheduler_category_slug: zoneContext?.slug ?? null,
-        scheduler_category_name: zoneContext?.name ?? null,
-      },
-    });
-
-    if (!error) {
-      savedCount++;
-    }
+  try {
+    const result = await enqueueNewslistEntries(
+      source.id,
+      candidates.map((article) => ({
+        sourceArticleId: article.articleId,
+        url: article.url,
+        meta: {
+          category: article.category ?? null,
+          title: article.title ?? null,
+          scheduler_category_slug: zoneContext?.slug ?? null,
+          scheduler_category_name: zoneContext?.name ?? null,
+        },
+      }))
+    );
+    savedCount = result.inserted;
+    duplicateCount = result.duplicates;
+  } catch (error) {
+    console.error('[BulkSave] Failed to enqueue newslist rows', error);
+    logDiscovery(0, 0);
+    runLog.error({ stage: 'enqueue', error, categorySlug: zoneContext?.slug, sourceKey: sourceConfig.key });
+    await runLog.end({ status: 'failed', processed: 0, failed: 1 });
+    return NextResponse.json({ success: false, error: 'Failed to save discovered URLs.' }, { status: 500 });
   }
 
   console.log(
@@ -267,6 +282,7 @@ export async function POST(_request: NextRequest, { params }: { params: RoutePar
     duplicateCount,
     zoneContext ? `for ${zoneContext.slug}` : ''
   );
+  logDiscovery(savedCount, duplicateCount);
 
   // Update last_run_at for any source that used scheduler
   if (selectedCategory) {
@@ -277,6 +293,8 @@ export async function POST(_request: NextRequest, { params }: { params: RoutePar
       }
     } catch (error) {
       console.error('[BulkSave] Failed to update scheduler last_run_at', error);
+      runLog.error({ stage: 'scheduler', error, categorySlug: selectedCategory.slug, sourceKey: sourceConfig.key });
+      await runLog.end({ status: 'failed', processed: savedCount, failed: 0 });
       return NextResponse.json(
         { success: false, error: 'Inserted URLs but failed to update scheduler last run timestamp.' },
         { status: 500 }
@@ -284,6 +302,8 @@ export async function POST(_request: NextRequest, { params }: { params: RoutePar
     }
   }
 
+  await runLog.end({ status: 'completed', processed: savedCount, failed: 0 });
+
   return NextResponse.json({
     success: true,
     source: sourceConfig.name,
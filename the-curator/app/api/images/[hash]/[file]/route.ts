@@ -0,0 +1,56 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { promises as fs } from 'fs';
+import { getDerivativePath } from '@/lib/services/imageDerivatives';
+import {
+  IMAGE_FORMATS,
+  IMAGE_VARIANTS,
+  getDerivativeUrl,
+  getImageStorageBucket,
+  type ImageFormat,
+  type ImageVariant,
+} from '@/lib/utils/imageUrl';
+
+export const runtime = 'nodejs';
+
+const FILE_PATTERN = /^([a-z]+)\.([a-z]+)$/;
+
+/**
+ * GET /api/images/[hash]/[variant].[format]
+ *
+ * Serves a locally stored image derivative. Paths are content-addressed,
+ * so responses are immutable and cached for a year. When derivatives live in
+ * a storage bucket, redirects to the bucket's public URL instead.
+ */
+export async function GET(_request: NextRequest, { params }: { params: { hash: string; file: string } }) {
+  const match = params.file.match(FILE_PATTERN);
+  const variant = match?.[1] as ImageVariant | undefined;
+  const format = match?.[2] as ImageFormat | undefined;
+
+  if (!variant || !format || !(variant in IMAGE_VARIANTS) || !IMAGE_FORMATS.includes(format)) {
+    return NextResponse.json({ success: false, message: 'Unknown image variant' }, { status: 400 });
+  }
+
+  const filePath = getDerivativePath(params.hash, variant, format);
+  if (!filePath) {
+    return NextResponse.json({ success: false, message: 'Invalid image hash' }, { status: 400 });
+  }
+
+  if (getImageStorageBucket()) {
+    return NextResponse.redirect(getDerivativeUrl(params.hash, variant, format), 308);
+  }
+
+  try {
+    const body = await fs.readFile(filePath);
+    return new NextResponse(body, {
+      status: 200,
+      headers: {
+        'Content-Type': `image/${format}`,
+        'Content-Length': String(body.length),
+        'Cache-Control': 'public, max-age=31536000, immutable',
+        ETag: `"${params.hash}-${variant}-${format}"`,
+      },
+    });
+  } catch {
+    return NextResponse.json({ success: false, message: 'Image not found' }, { status: 404 });
+  }
+}
@@ -1,126 +1,50 @@
 import { NextRequest, NextResponse } from 'next/server';
-import { supabase } from '@/lib/db/supabase';
-
-const MAX_PAGE_SIZE = 24;
+import {
+  NEWS_LIST_CACHE_CONTROL,
+  computeETag,
+  getCachedNewsFacets,
+  getCachedNewsList,
+  matchesETag,
+  parseNewsListQuery,
+} from '@/lib/services/newsCache';
 
 export async function GET(request: NextRequest) {
   const { searchParams } = new URL(request.url);
-  const page = Math.max(1, parseInt(searchParams.get('page') || '1', 10));
-  const limitRaw = parseInt(searchParams.get('limit') || '12', 10);
-  const limit = Math.min(MAX_PAGE_SIZE, Math.max(6, Number.isNaN(limitRaw) ? 12 : limitRaw));
-  const offset = (page - 1) * limit;
-  const search = searchParams.get('search')?.trim();
-  const category = searchParams.get('category');
-  const subCategory = searchParams.get('subCategory');
-  const tag = searchParams.get('tag')?.trim();
-  const dateFrom = searchParams.get('dateFrom');
-  const dateTo = searchParams.get('dateTo');
-  const sourceKey = searchParams.get('source')?.trim();
-
-  let query = supabase
-    .from('articles')
-    .select(
-      'id, title, excerpt, category, sub_category, published_date, main_image_url, tags, source_id, source_article_id',
-      { count: 'exact' }
-    )
-    .eq('scrape_status', 'success')
-    .order('published_date', { ascending: false })
-    .range(offset, offset + limit - 1);
-
-  if (search) {
-    query = query.ilike('title', `%${search}%`);
-  }
-
-  if (category) {
-    query = query.eq('category', category);
-  }
-
-  if (subCategory) {
-    query = query.eq('sub_category', subCategory);
-  }
-
-  if (tag) {
-    query = query.ilike('tags', `%${tag}%`);
-  }
-
-  // Add date range filtering
-  if (dateFrom) {
-    query = query.gte('published_date', dateFrom);
-  }
+  const query = parseNewsListQuery(searchParams);
 
-  if (dateTo) {
-    // Add 1 day to include the entire dateTo day
-    const dateToEnd = new Date(dateTo);
-    dateToEnd.setDate(dateToEnd.getDate() + 1);
-    const dateToEndStr = dateToEnd.toISOString().split('T')[0];
-    query = query.lt('published_date', dateToEndStr);
+  let list: Awaited<ReturnType<typeof getCachedNewsList>>;
+  try {
+    list = await getCachedNewsList(query);
+  } catch (error) {
+    const message = error instanceof Error ? error.message : String(error);
+    console.error('[NewsAPI] Failed to fetch articles', message);
+    return NextResponse.json({ success: false, message }, { status: 500, headers: { 'Cache-Control': 'no-store' } });
   }
 
-  // Filter by source if specified
-  if (sourceKey) {
-    const { data: sourceData } = await supabase
-      .from('news_sources')
-      .select('id')
-      .eq('source_key', sourceKey)
-      .single();
-    
-    if (sourceData?.id) {
-      query = query.eq('source_id', sourceData.id);
-    }
-  }
-
-  const { data: articles, error, count } = await query;
-
-  if (error) {
-    console.error('[NewsAPI] Failed to fetch articles', error.message);
-    return NextResponse.json({ success: false, message: error.message }, { status: 500 });
-  }
-
-  const { data: categoryRows, error: categoryError } = await supabase
-    .from('articles')
-    .select('category, sub_category')
-    .neq('category', null)
-    .order('category', { ascending: true });
-
-  if (categoryError) {
-    console.warn('[NewsAPI] Failed to load category list', categoryError.message);
-  }
-
-  const categories: string[] = [];
-  const subCategoriesByCategory: Record<string, string[]> = {};
-
-  (categoryRows || []).forEach((row) => {
-    const categoryKey = row.category?.trim();
-    if (!categoryKey) return;
-    if (!categories.includes(categoryKey)) {
-      categories.push(categoryKey);
-    }
+  // Clients that already hold the filter options send ?facets=0 to skip them
+  const facets = searchParams.get('facets') === '0' ? {} : await getCachedNewsFacets();
 
-    const subKey = row.sub_category?.trim();
-    if (!subKey) return;
-    subCategoriesByCategory[categoryKey] = subCategoriesByCategory[categoryKey] || [];
-    if (!subCategoriesByCategory[categoryKey].includes(subKey)) {
-      subCategoriesByCategory[categoryKey].push(subKey);
-    }
+  const body = JSON.stringify({
+    success: true,
+    data: list.data,
+    total: list.total,
+    page: query.page,
+    pageSize: query.limit,
+    ...facets,
   });
 
-  // Fetch available sources
-  const { data: sourcesData } = await supabase
-    .from('news_sources')
-    .select('source_key, name')
-    .eq('is_active', true)
-    .order('name');
+  const etag = computeETag(body);
+  const headers = {
+    'Cache-Control': NEWS_LIST_CACHE_CONTROL,
+    ETag: etag,
+  };
 
-  const sources = (sourcesData || []).map(s => ({ key: s.source_key, name: s.name }));
+  if (matchesETag(request.headers.get('if-none-match'), etag)) {
+    return new NextResponse(null, { status: 304, headers });
+  }
 
-  return NextResponse.json({
-    success: true,
-    data: articles || [],
-    total: count ?? (articles?.length ?? 0),
-    page,
-    pageSize: limit,
-    categories,
-    subCategoriesByCategory,
-    sources,
+  return new NextResponse(body, {
+    status: 200,
+    headers: { ...headers, 'Content-Type': 'application/json' },
   });
 }
@@ -3,6 +3,7 @@ import chromium from '@sparticuz/chromium';
 import { supabase, supabaseAdmin } from '@/lib/db/supabase';
 import { getSourceConfig, isSourceSupported } from '@/lib/constants/sourceRegistry';
 import { mingpaoSections } from '@/lib/constants/mingpaoSections';
+import { enqueueNewslistEntries } from '@/lib/repositories/newslist';
 
 // Source-specific URL patterns
 const ARTICLE_PATTERNS: Record<string, RegExp> = {
@@ -339,35 +340,22 @@ export async function POST(req: NextRequest) {
       if (sourceError) {
         console.warn(`[ArticleList] Unable to load ${sourceKey} source id:`, sourceError.message);
       } else if (sourceData?.id && articles.length > 0) {
-        const payload = articles.map(article => ({
-          source_id: sourceData.id,
-          source_article_id: article.articleId,
-          url: article.url,
-          status: 'pending',
-          meta: {
-            category: article.category,
-            title: article.titleSlug,
-          },
-        }));
-
-        const chunkSize = 100;
-        for (let i = 0; i < payload.length; i += chunkSize) {
-          const chunk = payload.slice(i, i + chunkSize);
-          const { error: insertError } = await db
-            .from('newslist')
-            .upsert(chunk, {
-              onConflict: 'source_id,source_article_id',
-              ignoreDuplicates: true,
-            });
-
-          if (insertError) {
-            console.warn('[ArticleList] Failed to upsert newslist chunk:', insertError.message);
-            break;
-          }
-        }
+        // Dedups against both the hot queue and the archive, so archived URLs are not re-queued
+        const { inserted, duplicates } = await enqueueNewslistEntries(
+          sourceData.id,
+          articles.map(article => ({
+            sourceArticleId: article.articleId,
+            url: article.url,
+            meta: {
+              category: article.category,
+              title: article.titleSlug,
+            },
+          }))
+        );
+        console.log('[ArticleList] Enqueued newslist rows — saved', inserted, 'duplicates', duplicates);
       }
     } catch (listError) {
-      console.warn('[ArticleList] Failed to upsert newslist entries:', listError);
+      console.warn('[ArticleList] Failed to enqueue newslist entries:', listError);
     }
     
     return Response.json({ 
@@ -2,9 +2,11 @@ import { NextRequest, NextResponse } from 'next/server';
 import { ArticleScraper } from '@/lib/scrapers/ArticleScraper';
 import { CategoryScheduler } from '@/lib/scrapers/categoryScheduler';
 import { createAutomationHistory, updateAutomationHistory } from '@/lib/services/automationHistory';
-import { appendAutomationLog } from '@/lib/utils/automationLogger';
+import { RunLog, createStageTimings } from '@/lib/utils/automationLogger';
 import { supabaseAdmin } from '@/lib/db/supabase';
 import { hk01SourceConfig } from '@/lib/constants/sources';
+import { detectSourceFromUrl, getNetworkPolicy } from '@/lib/constants/sourceRegistry';
+import { applyNetworkPolicy, waitForArticleRender } from '@/lib/scrapers/networkPolicy';
 import { importArticle } from '@/lib/supabase/articlesClient';
 import { logException, extractErrorDetails } from '@/lib/services/exceptionLogger';
 import type { ScraperCategory, ScrapedArticle } from '@/lib/types/database';
@@ -82,19 +84,12 @@ async function fetchPageHtml(url: string): Promise<string> {
   const page = await browser!.newPage();
 
   try {
-    await page.setRequestInterception(true);
-    page.on('request', (request) => {
-      const resourceType = request.resourceType();
-      if (['font', 'stylesheet', 'media', 'image'].includes(resourceType)) {
-        request.abort();
-      } else {
-        request.continue();
-      }
-    });
+    const networkPolicy = getNetworkPolicy(detectSourceFromUrl(url));
+    await applyNetworkPolicy(page, networkPolicy);
 
     await page.setUserAgent('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/117.0.0.0 Safari/537.36');
     await page.goto(url, { waitUntil: 'domcontentloaded', timeout: 15000 }).catch(() => {});
-    await new Promise((resolve) => setTimeout(resolve, 1500));
+    await waitForArticleRender(page, networkPolicy);
     const html = await page.content();
     return html;
   } finally {
@@ -179,6 +174,11 @@ async function updateNewslistEntry(entryId: string, patch: Partial<ArticleEntry>
 }
 
 export async function POST(request: NextRequest) {
+  // Declared outside the try so an unexpected failure still ends and flushes the run log
+  let runLog: RunLog | null = null;
+  let processed = 0;
+  const errors: string[] = [];
+
   try {
     const body: ArticleRunRequest = await request.json().catch(() => ({}));
     const limit = body.limit && body.limit > 0 ? Math.min(body.limit, 10) : 4;
@@ -225,11 +225,15 @@ export async function POST(request: NextRequest) {
       sourceId: category.source_id,
     });
 
-    const entries = await fetchPendingEntries(category, limit, Boolean(body.force));
-    const errors: string[] = [];
-    let processed = 0;
-    const startedAt = new Date().toISOString();
+    const sourceKey = category.source?.source_key ?? null;
+    runLog = RunLog.start('article', {
+      runId,
+      categorySlug: category.slug,
+      sourceKey,
+      meta: { limit, force: Boolean(body.force) },
+    });
 
+    const entries = await fetchPendingEntries(category, limit, Boolean(body.force));
     const sourceForScraper = buildScraperSource(category);
 
     for (const entry of entries) {
@@ -240,27 +244,51 @@ export async function POST(request: NextRequest) {
         last_processed_at: attemptTimestamp,
       });
 
+      const timings = createStageTimings();
+      let stage = 'render';
       try {
-        const html = await fetchPageHtml(entry.url);
+        const html = await timings.measure('render', () => fetchPageHtml(entry.url));
+        stage = 'parse';
         const scraper = new ArticleScraper(sourceForScraper as any);
-        const result = await scraper.scrapeArticle(html, entry.url);
+        const result = await timings.measure('parse', () => scraper.scrapeArticle(html, entry.url));
 
         if (!result.success) {
           throw new Error(result.error ?? 'Scraper returned failure.');
         }
 
-        const importOutcome = await importArticle(result.data as ScrapedArticle, entry.url, {
-          skipProcessingStatus: true,
-        });
+        stage = 'import';
+        const importOutcome = await timings.measure('import', () =>
+          importArticle(result.data as ScrapedArticle, entry.url, {
+            skipProcessingStatus: true,
+          })
+        );
 
         if (!importOutcome.success) {
           throw new Error(importOutcome.error ?? importOutcome.message);
         }
 
         processed += 1;
+        runLog.article({
+          url: entry.url,
+          categorySlug: category.slug,
+          sourceKey,
+          status: importOutcome.isNew ? 'imported' : importOutcome.isUpdated ? 'updated' : 'existing',
+          articleId: importOutcome.articleId,
+          stages: timings.stages,
+          totalMs: timings.totalMs(),
+        });
       } catch (err) {
         const message = err instanceof Error ? err.message : 'Unknown error';
         errors.push(message);
+        runLog.error({ stage, error: err, url: entry.url, categorySlug: category.slug, sourceKey });
+        runLog.article({
+          url: entry.url,
+          categorySlug: category.slug,
+          sourceKey,
+          status: 'failed',
+          stages: timings.stages,
+          totalMs: timings.totalMs(),
+        });
         const errorDetails = extractErrorDetails(err);
 
         // Log individual article scraping failures
@@ -299,15 +327,7 @@ export async function POST(request: NextRequest) {
 
     await CategoryScheduler.refreshLastRun(category.id, completedAt);
 
-    await appendAutomationLog({
-      runId,
-      categorySlug: category.slug,
-      status: 'completed',
-      articlesProcessed: processed,
-      errors,
-      startedAt,
-      completedAt,
-    });
+    await runLog.end({ status: 'completed', processed, failed: errors.length });
 
     return NextResponse.json({ success: true, data: { runId, processed, errors } });
   } catch (error) {
@@ -315,6 +335,11 @@ export async function POST(request: NextRequest) {
     const errorMessage = errorDetails.message;
     console.error('[Scraper Article] Unexpected error:', errorMessage);
 
+    if (runLog) {
+      runLog.error({ stage: 'article_run', error });
+      await runLog.end({ status: 'failed', processed, failed: errors.length });
+    }
+
     // Log critical exceptions
     if (supabaseAdmin) {
       const bodyForLogging = await request.json().catch(() => ({}));
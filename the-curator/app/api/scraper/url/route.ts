@@ -1,6 +1,7 @@
 import { NextRequest } from 'next/server';
 import { ArticleScraper } from '@/lib/scrapers/ArticleScraper';
-import { getSourceConfig, detectSourceFromUrl, isSourceSupported } from '@/lib/constants/sourceRegistry';
+import { getSourceConfig, detectSourceFromUrl, isSourceSupported, getNetworkPolicy } from '@/lib/constants/sourceRegistry';
+import { applyNetworkPolicy, formatNetworkStats, waitForArticleRender } from '@/lib/scrapers/networkPolicy';
 import puppeteer from 'puppeteer-core';
 import chromium from '@sparticuz/chromium';
 
@@ -103,16 +104,9 @@ export async function POST(req: NextRequest) {
     }
     const page = await browser.newPage();
     
-    // Block unnecessary resources to speed up loading
-    await page.setRequestInterception(true);
-    page.on('request', (request) => {
-      const resourceType = request.resourceType();
-      if (['font', 'stylesheet', 'media'].includes(resourceType)) {
-        request.abort();
-      } else {
-        request.continue();
-      }
-    });
+    // Block resources the scraper does not need (per-source policy)
+    const networkPolicy = getNetworkPolicy(resolvedSourceKey);
+    const networkStats = await applyNetworkPolicy(page, networkPolicy);
     
     await page.setUserAgent('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36');
     
@@ -129,22 +123,9 @@ export async function POST(req: NextRequest) {
       }, { status: 503 });
     }
     
-    // Wait for the main content to be present (with fallback)
-    try {
-      await page.waitForSelector('[data-testid="article-top-section"]', { timeout: 3000 });
-      console.log('[Scraper] Article section found');
-    } catch {
-      console.warn('[Scraper] Main section not found, attempting content extraction anyway');
-    }
-    
-    // Scroll to trigger lazy loading
-    await (page.evaluate as any)(() => {
-      window.scrollTo(0, document.body.scrollHeight);
-    });
-    
-    // Wait for images to load (increased from 2 to 5 seconds for lazy loading)
-    console.log('[Scraper] Waiting for lazy-loaded images...');
-    await new Promise(resolve => setTimeout(resolve, 5000));
+    // Wait for the article content and mount lazy image wrappers (no full-page scroll)
+    await waitForArticleRender(page, networkPolicy);
+    console.log('[Scraper] Network:', formatNetworkStats(networkStats));
     
     // Check time remaining
     const elapsed = Date.now() - startTime;
@@ -1,8 +1,13 @@
 import Link from 'next/link';
 import { notFound } from 'next/navigation';
-import { supabase } from '@/lib/db/supabase';
+import { getCachedArticleDetail, getHotArticleIds } from '@/lib/services/newsCache';
+import ResponsiveImage, { type ImageAssetSummary } from '@/components/news/ResponsiveImage';
 
-export const revalidate = 60;
+// Pages are invalidated by tag when their article is written (see lib/services/newsCache);
+// the timer is only a safety net for writes made outside the app.
+export const revalidate = 86400;
+
+const PRERENDER_ARTICLE_COUNT = 50;
 
 type ArticleBlock = {
   type: 'heading' | 'paragraph';
@@ -19,6 +24,7 @@ type ArticleDetail = {
   updated_date?: string | null;
   main_image_url?: string | null;
   main_image_caption?: string | null;
+  main_image_asset?: ImageAssetSummary | null;
   content?: ArticleBlock[];
   excerpt?: string | null;
   tags?: string | null;
@@ -26,25 +32,32 @@ type ArticleDetail = {
     image_url: string;
     caption?: string | null;
     is_main_image: boolean;
+    width?: number | null;
+    height?: number | null;
+    asset?: ImageAssetSummary | null;
   }>;
 };
 
-async function fetchArticle(id: string): Promise<ArticleDetail | null> {
-  const { data, error } = await supabase
-    .from('articles')
-    .select(
-      `id, title, author, category, sub_category, published_date, updated_date,
-       main_image_url, main_image_caption, content, excerpt, tags, article_images ( image_url, caption, is_main_image )`
-    )
-    .eq('id', id)
-    .maybeSingle();
+/**
+ * Pre-render the hottest articles at build time; others render on first request
+ */
+export async function generateStaticParams() {
+  try {
+    const ids = await getHotArticleIds(PRERENDER_ARTICLE_COUNT);
+    return ids.map((id) => ({ id }));
+  } catch (error) {
+    console.warn('Skipping article pre-render', error instanceof Error ? error.message : error);
+    return [];
+  }
+}
 
-  if (error) {
-    console.error('Failed to load article', error.message);
+async function fetchArticle(id: string): Promise<ArticleDetail | null> {
+  try {
+    return (await getCachedArticleDetail(id)) as ArticleDetail | null;
+  } catch (error) {
+    console.error('Failed to load article', error instanceof Error ? error.message : error);
     return null;
   }
-
-  return data;
 }
 
 function formatDate(value?: string | null) {
@@ -85,10 +98,13 @@ export default async function NewsArticlePage({ params }: { params: { id: string
           )}
           {article.main_image_url && (
             <figure className="rounded-2xl border border-slate-100 dark:border-stone-700 bg-slate-100/80 dark:bg-stone-900 overflow-hidden">
-              <img
+              <ResponsiveImage
                 src={article.main_image_url}
                 alt={article.title}
-                className="w-full rounded-2xl object-contain"
+                asset={article.main_image_asset}
+                variant="full"
+                loading="eager"
+                className="h-auto w-full rounded-2xl object-contain"
               />
               {article.main_image_caption && (
                 <figcaption className="p-3 text-xs text-slate-600 dark:text-stone-400">{article.main_image_caption}</figcaption>
@@ -135,7 +151,13 @@ export default async function NewsArticlePage({ params }: { params: { id: string
               <div className="grid gap-4 md:grid-cols-2">
                 {article.article_images.map((img, idx) => (
                   <div key={`${img.image_url}-${idx}`} className="space-y-2">
-                    <img src={img.image_url} alt={img.caption || `image-${idx + 1}`} className="h-44 w-full rounded-2xl object-cover" />
+                    <ResponsiveImage
+                      src={img.image_url}
+                      alt={img.caption || `image-${idx + 1}`}
+                      asset={img.asset ?? { width: img.width, height: img.height }}
+                      variant="card"
+                      className="h-44 w-full rounded-2xl object-cover"
+                    />
                     {img.caption && (
                       <p className="text-xs text-slate-500 dark:text-stone-400">{img.caption}</p>
                     )}
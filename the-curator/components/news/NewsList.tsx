@@ -3,6 +3,18 @@
 import Link from 'next/link';
 import { useCallback, useEffect, useMemo, useRef, useState } from 'react';
 import { usePathname, useRouter, useSearchParams } from 'next/navigation';
+import ResponsiveImage, { type ImageAssetSummary } from '@/components/news/ResponsiveImage';
+import {
+  NEWS_LIST_PAGE_SIZE,
+  getCachedFacets,
+  getCachedNewsListPage,
+  getNewsListScopeKey,
+  isAbortError,
+  loadNewsListPage,
+  prefetchNewsListPage,
+  type NewsFacets,
+  type NewsListFilters,
+} from '@/lib/utils/newsListClient';
 
 type ArticleSummary = {
   id: string;
@@ -12,22 +24,14 @@ type ArticleSummary = {
   sub_category?: string | null;
   published_date?: string | null;
   main_image_url?: string | null;
+  main_image_asset?: ImageAssetSummary | null;
+  story_cluster?: { id: string; article_count: number; source_count: number } | null;
   tags?: string | null;
 };
 
-type ApiResponse = {
-  success: boolean;
-  data: ArticleSummary[];
-  total: number;
-  page: number;
-  pageSize: number;
-  categories: string[];
-  subCategoriesByCategory: Record<string, string[]>;
-  sources?: Array<{ key: string; name: string }>;
-  message?: string;
-};
-
-const PAGE_SIZE = 12;
+const SEARCH_DEBOUNCE_MS = 350;
+// The sentinel triggers "load more" at 200px; the next page is requested well before that
+const PREFETCH_ROOT_MARGIN = '1200px';
 
 const translations = {
   searchLabel: '搜尋標題',
@@ -69,14 +73,35 @@ export default function NewsList() {
   const [dateFrom, setDateFrom] = useState(appliedDateFrom);
   const [dateTo, setDateTo] = useState(appliedDateTo);
   const [articles, setArticles] = useState<ArticleSummary[]>([]);
-  const [page, setPage] = useState(1);
+  const [pagination, setPagination] = useState({ scopeKey: '', page: 1 });
   const [total, setTotal] = useState(0);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
-  const [categories, setCategories] = useState<string[]>([]);
-  const [sources, setSources] = useState<Array<{ key: string; name: string }>>([]);
-  const [subCategoriesByCategory, setSubCategoriesByCategory] = useState<Record<string, string[]>>({});
+  const [facets, setFacets] = useState<NewsFacets | null>(() => getCachedFacets({}) ?? null);
+  const [composing, setComposing] = useState(false);
   const loadMoreRef = useRef<HTMLDivElement | null>(null);
+  // Search/tag values this component last wrote to the URL
+  const pushedInputsRef = useRef({ search: appliedSearch, tag: appliedTag });
+
+  const filters = useMemo<NewsListFilters>(
+    () => ({
+      search: appliedSearch,
+      tag: appliedTag,
+      source: appliedSource,
+      category: appliedCategory,
+      subCategory: appliedSubCategory,
+      dateFrom: appliedDateFrom,
+      dateTo: appliedDateTo,
+    }),
+    [appliedSearch, appliedTag, appliedSource, appliedCategory, appliedSubCategory, appliedDateFrom, appliedDateTo]
+  );
+  const scopeKey = getNewsListScopeKey(filters);
+  // Pagination belongs to one filter scope; a new scope starts again at page 1
+  const page = pagination.scopeKey === scopeKey ? pagination.page : 1;
+
+  const categories = facets?.categories ?? [];
+  const sources = facets?.sources ?? [];
+  const subCategoriesByCategory = useMemo(() => facets?.subCategoriesByCategory ?? {}, [facets]);
 
   const subCategoryOptions = useMemo(() => {
     if (category) {
@@ -86,27 +111,28 @@ export default function NewsList() {
     return Array.from(new Set(allSubs));
   }, [category, subCategoriesByCategory]);
 
-  const hasMore = page * PAGE_SIZE < total;
+  const hasMore = page * NEWS_LIST_PAGE_SIZE < total;
 
   useEffect(() => {
-    setSearchInput(appliedSearch);
-    setTagInput(appliedTag);
     setSource(appliedSource);
     setCategory(appliedCategory);
     setSubCategory(appliedSubCategory);
     setDateFrom(appliedDateFrom);
     setDateTo(appliedDateTo);
-    setPage(1);
-  }, [appliedSearch, appliedTag, appliedSource, appliedCategory, appliedSubCategory, appliedDateFrom, appliedDateTo]);
+  }, [appliedSource, appliedCategory, appliedSubCategory, appliedDateFrom, appliedDateTo]);
 
   useEffect(() => {
-    setPage(1);
-  }, [appliedSearch, appliedTag, appliedSource, appliedCategory, appliedSubCategory, appliedDateFrom, appliedDateTo]);
+    // Values we pushed ourselves are skipped: the input may already hold newer keystrokes
+    if (appliedSearch !== pushedInputsRef.current.search) setSearchInput(appliedSearch);
+    if (appliedTag !== pushedInputsRef.current.tag) setTagInput(appliedTag);
+    pushedInputsRef.current = { search: appliedSearch, tag: appliedTag };
+  }, [appliedSearch, appliedTag]);
 
   const updateFilters = useCallback(
     (updates: Partial<{ search: string; tag: string; source: string; category: string; subCategory: string; dateFrom: string; dateTo: string }>) => {
       const params = new URLSearchParams(paramString);
       if (updates.search !== undefined) {
+        pushedInputsRef.current.search = updates.search;
         if (updates.search) {
           params.set('search', updates.search);
         } else {
@@ -114,6 +140,7 @@ export default function NewsList() {
         }
       }
       if (updates.tag !== undefined) {
+        pushedInputsRef.current.tag = updates.tag;
         if (updates.tag) {
           params.set('tag', updates.tag);
         } else {
@@ -163,49 +190,66 @@ export default function NewsList() {
     [pathname, paramString, router]
   );
 
-  const fetchArticles = useCallback(async () => {
-    setLoading(true);
-    setError(null);
-    try {
-      const params = new URLSearchParams();
-      params.set('page', String(page));
-      params.set('limit', String(PAGE_SIZE));
-      if (appliedSearch) params.set('search', appliedSearch);
-      if (appliedTag) params.set('tag', appliedTag);
-      if (appliedSource) params.set('source', appliedSource);
-      if (appliedCategory) params.set('category', appliedCategory);
-      if (appliedSubCategory) params.set('subCategory', appliedSubCategory);
-      if (appliedDateFrom) params.set('dateFrom', appliedDateFrom);
-      if (appliedDateTo) params.set('dateTo', appliedDateTo);
-
-      const response = await fetch(`/api/news/list?${params.toString()}`);
-      const payload: ApiResponse = await response.json();
-
-      if (!response.ok || !payload.success) {
-        throw new Error(payload.message || 'Failed to load news');
+  useEffect(() => {
+    const controller = new AbortController();
+
+    const apply = (result: { data: ArticleSummary[]; total: number }) => {
+      setTotal(result.total);
+      setArticles(prev => (page === 1 ? result.data : [...prev, ...result.data]));
+      const cachedFacets = getCachedFacets(filters);
+      if (cachedFacets) {
+        setFacets(cachedFacets);
       }
+    };
 
-      setTotal(payload.total || 0);
-      setCategories(payload.categories || []);
-      setSources(payload.sources || []);
-      setSubCategoriesByCategory(payload.subCategoriesByCategory || {});
-      setArticles(prev => (page === 1 ? payload.data : [...prev, ...payload.data]));
-    } catch (err) {
-      setError(err instanceof Error ? err.message : '載入失敗');
-    } finally {
+    setError(null);
+    const cached = getCachedNewsListPage<ArticleSummary>(filters, page);
+    if (cached) {
+      apply(cached);
       setLoading(false);
+      return;
     }
-  }, [page, appliedSearch, appliedTag, appliedSource, appliedCategory, appliedSubCategory, appliedDateFrom, appliedDateTo]);
+
+    setLoading(true);
+    loadNewsListPage<ArticleSummary>(filters, page, controller.signal)
+      .then(apply)
+      .catch(err => {
+        // Superseded by a newer filter scope: its own request owns the UI now
+        if (isAbortError(err)) return;
+        setError(err instanceof Error ? err.message : '載入失敗');
+      })
+      .finally(() => {
+        if (!controller.signal.aborted) {
+          setLoading(false);
+        }
+      });
+
+    return () => controller.abort();
+  }, [filters, page]);
+
+  // Prefetches for the current scope are dropped as soon as the filters change
+  const prefetchControllerRef = useRef<AbortController | null>(null);
+  useEffect(() => {
+    const controller = new AbortController();
+    prefetchControllerRef.current = controller;
+    return () => controller.abort();
+  }, [scopeKey]);
 
   useEffect(() => {
-    fetchArticles();
-  }, [fetchArticles]);
+    if (composing) return;
+    const search = searchInput.trim();
+    const tag = tagInput.trim();
+    if (search === appliedSearch && tag === appliedTag) return;
+
+    const timer = setTimeout(() => updateFilters({ search, tag }), SEARCH_DEBOUNCE_MS);
+    return () => clearTimeout(timer);
+  }, [searchInput, tagInput, composing, appliedSearch, appliedTag, updateFilters]);
 
   const loadMore = useCallback(() => {
     if (hasMore && !loading) {
-      setPage(prev => prev + 1);
+      setPagination({ scopeKey, page: page + 1 });
     }
-  }, [hasMore, loading]);
+  }, [hasMore, loading, scopeKey, page]);
 
   useEffect(() => {
     if (!loadMoreRef.current || !hasMore) {
@@ -220,9 +264,20 @@ export default function NewsList() {
       });
     }, { rootMargin: '200px' });
 
+    const prefetchObserver = new IntersectionObserver(entries => {
+      if (entries.some(entry => entry.isIntersecting)) {
+        prefetchNewsListPage(filters, page + 1, prefetchControllerRef.current?.signal);
+        prefetchObserver.disconnect();
+      }
+    }, { rootMargin: PREFETCH_ROOT_MARGIN });
+
     observer.observe(loadMoreRef.current);
-    return () => observer.disconnect();
-  }, [hasMore, loading, loadMore]);
+    prefetchObserver.observe(loadMoreRef.current);
+    return () => {
+      observer.disconnect();
+      prefetchObserver.disconnect();
+    };
+  }, [hasMore, loading, loadMore, filters, page]);
 
   const handleSearch = (event: React.FormEvent) => {
     event.preventDefault();
@@ -268,6 +323,8 @@ export default function NewsList() {
                 placeholder={t.searchPlaceholder}
                 value={searchInput}
                 onChange={event => setSearchInput(event.target.value)}
+                onCompositionStart={() => setComposing(true)}
+                onCompositionEnd={() => setComposing(false)}
               />
             </div>
             <div className="flex flex-col">
@@ -279,6 +336,8 @@ export default function NewsList() {
                 placeholder={t.tagPlaceholder}
                 value={tagInput}
                 onChange={event => setTagInput(event.target.value)}
+                onCompositionStart={() => setComposing(true)}
+                onCompositionEnd={() => setComposing(false)}
               />
             </div>
             <button
@@ -395,10 +454,12 @@ export default function NewsList() {
           >
             {article.main_image_url && (
               <div className="overflow-hidden bg-slate-100 dark:bg-stone-900">
-                <img
+                <ResponsiveImage
                   src={article.main_image_url}
                   alt={article.title}
-                  className="w-full object-contain"
+                  asset={article.main_image_asset}
+                  variant="card"
+                  className="h-auto w-full object-contain"
                 />
               </div>
             )}
@@ -412,6 +473,11 @@ export default function NewsList() {
               <p className="text-sm text-slate-600 dark:text-stone-300 line-clamp-3">
                 {article.excerpt || '尚未生成摘要'}
               </p>
+              {article.story_cluster && article.story_cluster.source_count > 1 && (
+                <div className="text-xs text-slate-400 dark:text-stone-500">
+                  {article.story_cluster.source_count} 個來源報道此新聞
+                </div>
+              )}
               {article.tags && (
                 <div className="flex flex-wrap gap-2 text-xs">
                   {article.tags
@@ -0,0 +1,80 @@
+"use client";
+
+import { useEffect, useRef, useState } from 'react';
+import {
+  IMAGE_FORMATS,
+  getDerivativeUrl,
+  getVariantDimensions,
+  type ImageVariant,
+} from '@/lib/utils/imageUrl';
+
+export type ImageAssetSummary = {
+  content_hash?: string | null;
+  width?: number | null;
+  height?: number | null;
+};
+
+type ResponsiveImageProps = {
+  src: string;
+  alt: string;
+  asset?: ImageAssetSummary | null;
+  variant: ImageVariant;
+  className?: string;
+  loading?: 'lazy' | 'eager';
+};
+
+/**
+ * Renders the AVIF/WebP derivative when the image worker has processed the
+ * source image, falling back to the source URL otherwise or when the
+ * derivative fails to load (e.g. a local-disk store on another instance).
+ * Known dimensions are emitted as width/height to avoid layout shift.
+ */
+export default function ResponsiveImage({ src, alt, asset, variant, className, loading = 'lazy' }: ResponsiveImageProps) {
+  const hasDimensions = Boolean(asset?.width && asset?.height);
+  const dimensions = hasDimensions ? getVariantDimensions(asset!.width!, asset!.height!, variant) : null;
+  const imgRef = useRef<HTMLImageElement>(null);
+  const [derivativeFailed, setDerivativeFailed] = useState(false);
+
+  useEffect(() => {
+    // A server-rendered image may fail before hydration attaches onError
+    const img = imgRef.current;
+    if (img && img.complete && img.naturalWidth === 0) {
+      setDerivativeFailed(true);
+    }
+  }, []);
+
+  if (!asset?.content_hash || derivativeFailed) {
+    return (
+      <img
+        src={src}
+        alt={alt}
+        className={className}
+        loading={loading}
+        decoding="async"
+        width={dimensions?.width}
+        height={dimensions?.height}
+      />
+    );
+  }
+
+  const [fallbackFormat] = IMAGE_FORMATS.slice(-1);
+
+  return (
+    <picture>
+      {IMAGE_FORMATS.map(format => (
+        <source key={format} type={`image/${format}`} srcSet={getDerivativeUrl(asset.content_hash!, variant, format)} />
+      ))}
+      <img
+        ref={imgRef}
+        src={getDerivativeUrl(asset.content_hash, variant, fallbackFormat)}
+        alt={alt}
+        onError={() => setDerivativeFailed(true)}
+        className={className}
+        loading={loading}
+        decoding="async"
+        width={dimensions?.width}
+        height={dimensions?.height}
+      />
+    </picture>
+  );
+}
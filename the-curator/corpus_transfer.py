@@ -0,0 +1,623 @@
+#!/usr/bin/env python3
+"""
+Bulk export / import of the article corpus.
+
+Snapshots news_sources, articles, article_images and newslist (hot queue and
+archive) before a reset_curator_schema(), moves them between environments,
+or feeds analytics.
+
+export  streams each table in keyset-paginated chunks (one REPEATABLE READ
+        snapshot for all tables) to gzipped JSONL and/or Parquet / Arrow IPC
+        with zstd compression, plus a manifest.json describing the dump.
+import  restores a dump in FK order. Every chunk is COPYed into a temp
+        staging table and merged with one INSERT ... SELECT ... ON CONFLICT
+        in its own transaction; restore-checkpoint.json then records it, so
+        an interrupted restore resumes at the last committed chunk (a chunk
+        replayed after a crash is absorbed by the upsert). The table's
+        updated_at triggers are disabled inside that transaction, so merged
+        rows keep their dumped updated_at (needs table ownership).
+
+Memory stays at one chunk per table regardless of corpus size.
+
+Restore rules:
+  - news_sources merge on source_key; restored rows pointing at a source id
+    are remapped to the target's id (a reset re-seeds sources with new ids)
+  - references to tables outside the dump (image_assets, story_clusters) are
+    kept only when the target row exists; otherwise NULL (an article that
+    loses its story cluster becomes a story primary again)
+  - articles / newslist rows whose natural key already exists in the target
+    under another id are skipped, as are images of articles not in the target
+  - restored articles are not re-indexed for story clustering
+
+Usage:
+  python corpus_transfer.py export --out dumps/2026-10-19
+  python corpus_transfer.py export --out dumps/analytics --format parquet --tables articles
+  python corpus_transfer.py export --out dumps/full --format jsonl,parquet,arrow
+  python corpus_transfer.py import dumps/2026-10-19
+  python corpus_transfer.py import dumps/2026-10-19 --on-conflict skip --restart
+
+Needs psycopg (v3); Parquet / Arrow need pyarrow. --database-url defaults to
+DATABASE_URL (Supabase: direct or session-pooler connection, COPY is not
+available through the transaction pooler).
+"""
+import argparse
+import datetime as dt
+import decimal
+import gzip
+import json
+import os
+import sys
+import time
+import uuid
+
+# Restore order follows the foreign keys
+TABLES = {
+    "news_sources": {
+        "key": ["id"],
+        "conflict": ["source_key"],
+    },
+    "articles": {
+        "key": ["id"],
+        "conflict": ["id"],
+        "source_column": "source_id",
+        "natural_keys": [["source_id", "source_article_id"]],
+        "external_refs": {"main_image_asset_id": "image_assets", "story_cluster_id": "story_clusters"},
+        "overrides": {
+            "is_story_primary": (
+                "CASE WHEN EXISTS (SELECT 1 FROM story_clusters r WHERE r.id = s.story_cluster_id) "
+                "THEN s.is_story_primary ELSE true END"
+            ),
+        },
+    },
+    "article_images": {
+        "key": ["id"],
+        "conflict": ["id"],
+        "parent": ("article_id", "articles"),
+        "external_refs": {"asset_id": "image_assets"},
+    },
+    "newslist": {
+        "key": ["id"],
+        "conflict": ["id"],
+        "source_column": "source_id",
+        "natural_keys": [["url"], ["source_id", "source_article_id"]],
+        "external_refs": {"resolved_article_id": "articles"},
+    },
+    "newslist_archive": {
+        "key": ["id", "created_at"],
+        "conflict": ["id", "created_at"],
+        "source_column": "source_id",
+        "monthly_partitions": True,
+    },
+}
+
+# "--tables newslist" means both tiers of the queue
+TABLE_ALIASES = {"newslist": ["newslist", "newslist_archive"]}
+
+FORMATS = ("jsonl", "parquet", "arrow")
+FILE_SUFFIX = {"jsonl": ".jsonl.gz", "parquet": ".parquet", "arrow": ".arrow"}
+MANIFEST = "manifest.json"
+CHECKPOINT = "restore-checkpoint.json"
+JSON_TYPES = {"json", "jsonb"}
+
+
+def require(module, hint):
+    try:
+        return __import__(module)
+    except ImportError:
+        print(f"❌ {module} is required for this command: {hint}", file=sys.stderr)
+        sys.exit(1)
+
+
+def resolve_tables(names):
+    if not names:
+        return list(TABLES)
+    selected = set()
+    for name in names.split(","):
+        name = name.strip()
+        if name not in TABLES and name not in TABLE_ALIASES:
+            raise SystemExit(f"Unknown table {name!r}; choose from {', '.join(TABLES)}")
+        selected.update(TABLE_ALIASES.get(name, [name]))
+    return [table for table in TABLES if table in selected]
+
+
+def write_json_atomic(path, payload):
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, path)
+
+
+def log(message):
+    print(message, file=sys.stderr, flush=True)
+
+
+def load_columns(conn, table):
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT column_name, udt_name
+            FROM information_schema.columns
+            WHERE table_schema = 'public' AND table_name = %s
+            ORDER BY ordinal_position
+            """,
+            (table,),
+        )
+        return [{"name": name, "type": udt} for name, udt in cur.fetchall()]
+
+
+# ---------------------------------------------------------------------------
+# Export
+# ---------------------------------------------------------------------------
+
+
+def to_json_value(value):
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, (dt.datetime, dt.date)):
+        return value.isoformat()
+    if isinstance(value, decimal.Decimal):
+        return str(value)
+    raise TypeError(f"Unserializable value {type(value).__name__}")
+
+
+def arrow_type(pa, pg_type):
+    if pg_type.startswith("_"):
+        return pa.list_(arrow_type(pa, pg_type[1:]))
+    return {
+        "int2": pa.int16(),
+        "int4": pa.int32(),
+        "int8": pa.int64(),
+        "float4": pa.float32(),
+        "float8": pa.float64(),
+        "bool": pa.bool_(),
+        "timestamptz": pa.timestamp("us", tz="UTC"),
+        "timestamp": pa.timestamp("us"),
+        "date": pa.date32(),
+    }.get(pg_type, pa.string())
+
+
+def to_arrow_value(value, pg_type):
+    if value is None:
+        return None
+    if pg_type in JSON_TYPES:
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, (uuid.UUID, decimal.Decimal)):
+        return str(value)
+    return value
+
+
+class JsonlSink:
+    def __init__(self, path, columns, level):
+        self.names = [column["name"] for column in columns]
+        self.handle = gzip.open(path, "wt", encoding="utf-8", compresslevel=level)
+
+    def write(self, rows):
+        for row in rows:
+            record = dict(zip(self.names, row))
+            self.handle.write(json.dumps(record, ensure_ascii=False, default=to_json_value))
+            self.handle.write("\n")
+
+    def close(self):
+        self.handle.close()
+
+
+class ArrowSink:
+    """One Parquet row group / Arrow record batch per chunk."""
+
+    def __init__(self, path, columns, fmt, compression):
+        self.pa = require("pyarrow", "pip install pyarrow")
+        self.columns = columns
+        self.schema = self.pa.schema([(c["name"], arrow_type(self.pa, c["type"])) for c in columns])
+        if fmt == "parquet":
+            import pyarrow.parquet as pq
+
+            self.writer = pq.ParquetWriter(path, self.schema, compression=compression)
+        else:
+            options = self.pa.ipc.IpcWriteOptions(compression=compression)
+            self.writer = self.pa.ipc.new_file(path, self.schema, options=options)
+
+    def write(self, rows):
+        arrays = [
+            self.pa.array([to_arrow_value(row[index], column["type"]) for row in rows], type=self.schema.field(index).type)
+            for index, column in enumerate(self.columns)
+        ]
+        self.writer.write_batch(self.pa.RecordBatch.from_arrays(arrays, schema=self.schema))
+
+    def close(self):
+        self.writer.close()
+
+
+def export_table(conn, table, out_dir, formats, args):
+    from psycopg import sql
+
+    spec = TABLES[table]
+    columns = load_columns(conn, table)
+    if not columns:
+        log(f"⚠️  {table}: not found, skipped")
+        return None
+
+    sinks = []
+    for fmt in formats:
+        path = os.path.join(out_dir, f"{table}{FILE_SUFFIX[fmt]}")
+        if fmt == "jsonl":
+            sinks.append(JsonlSink(path, columns, args.gzip_level))
+        else:
+            sinks.append(ArrowSink(path, columns, fmt, args.compression))
+
+    names = [column["name"] for column in columns]
+    key_positions = [names.index(key) for key in spec["key"]]
+    select = sql.SQL("SELECT {cols} FROM {table}").format(
+        cols=sql.SQL(", ").join(map(sql.Identifier, names)),
+        table=sql.Identifier(table),
+    )
+    order = sql.SQL(" ORDER BY {keys} LIMIT %s").format(keys=sql.SQL(", ").join(map(sql.Identifier, spec["key"])))
+    after = sql.SQL(" WHERE ({keys}) > ({params})").format(
+        keys=sql.SQL(", ").join(map(sql.Identifier, spec["key"])),
+        params=sql.SQL(", ").join(sql.Placeholder() * len(spec["key"])),
+    )
+
+    rows_written = 0
+    last_key = None
+    started = time.monotonic()
+    try:
+        with conn.cursor() as cur:
+            while True:
+                if last_key is None:
+                    cur.execute(select + order, (args.chunk_size,))
+                else:
+                    cur.execute(select + after + order, (*last_key, args.chunk_size))
+                rows = cur.fetchall()
+                if not rows:
+                    break
+                for sink in sinks:
+                    sink.write(rows)
+                rows_written += len(rows)
+                last_key = tuple(rows[-1][position] for position in key_positions)
+                elapsed = max(time.monotonic() - started, 1e-6)
+                log(f"   {table}: {rows_written} rows ({rows_written / elapsed:,.0f}/s)")
+                if len(rows) < args.chunk_size:
+                    break
+    finally:
+        for sink in sinks:
+            sink.close()
+
+    return {"rows": rows_written, "columns": columns, "key": spec["key"]}
+
+
+def run_export(args):
+    psycopg = require("psycopg", "pip install 'psycopg[binary]'")
+    formats = [fmt.strip() for fmt in args.format.split(",") if fmt.strip()]
+    for fmt in formats:
+        if fmt not in FORMATS:
+            raise SystemExit(f"Unknown format {fmt!r}; choose from {', '.join(FORMATS)}")
+    if any(fmt != "jsonl" for fmt in formats):
+        require("pyarrow", "pip install pyarrow")
+
+    tables = resolve_tables(args.tables)
+    os.makedirs(args.out, exist_ok=True)
+    manifest = {
+        "created_at": dt.datetime.now(dt.timezone.utc).isoformat(),
+        "formats": formats,
+        "chunk_size": args.chunk_size,
+        "tables": {},
+    }
+
+    started = time.monotonic()
+    with psycopg.connect(args.database_url) as conn:
+        # One snapshot for every table, so article_images never reference articles newer than the dump
+        conn.isolation_level = psycopg.IsolationLevel.REPEATABLE_READ
+        conn.read_only = True
+        with conn.transaction():
+            for table in tables:
+                log(f"📤 Exporting {table}")
+                result = export_table(conn, table, args.out, formats, args)
+                if result:
+                    manifest["tables"][table] = result
+
+    write_json_atomic(os.path.join(args.out, MANIFEST), manifest)
+    total = sum(entry["rows"] for entry in manifest["tables"].values())
+    log(f"✅ Exported {total} rows from {len(manifest['tables'])} tables in {time.monotonic() - started:.1f}s → {args.out}")
+    return 0
+
+
+# ---------------------------------------------------------------------------
+# Import
+# ---------------------------------------------------------------------------
+
+
+def iter_chunks(dump_dir, table, fmt, names, chunk_size, skip_rows):
+    """Yield lists of row tuples (dump column order), skipping rows already restored."""
+    path = os.path.join(dump_dir, f"{table}{FILE_SUFFIX[fmt]}")
+
+    def batched(records):
+        chunk = []
+        for record in records:
+            chunk.append(record)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def records():
+        seen = 0
+        if fmt == "jsonl":
+            with gzip.open(path, "rt", encoding="utf-8") as handle:
+                for line in handle:
+                    seen += 1
+                    if seen <= skip_rows:
+                        continue
+                    record = json.loads(line)
+                    yield tuple(record.get(name) for name in names)
+            return
+
+        pa = require("pyarrow", "pip install pyarrow")
+        if fmt == "parquet":
+            import pyarrow.parquet as pq
+
+            batches = pq.ParquetFile(path).iter_batches(batch_size=chunk_size, columns=names)
+        else:
+            reader = pa.ipc.open_file(pa.memory_map(path))
+            batches = (reader.get_batch(index) for index in range(reader.num_record_batches))
+
+        for batch in batches:
+            if seen + batch.num_rows <= skip_rows:
+                seen += batch.num_rows
+                continue
+            columns = [batch.column(batch.schema.get_field_index(name)).to_pylist() for name in names]
+            for row in zip(*columns):
+                seen += 1
+                if seen <= skip_rows:
+                    continue
+                yield row
+
+    return batched(records())
+
+
+def to_copy_value(value, pg_type, json_as_text):
+    if value is None:
+        return None
+    if pg_type in JSON_TYPES and not json_as_text:
+        # JSONL keeps JSON columns nested; Parquet / Arrow already hold JSON text
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+def build_merge_sql(table, columns, on_conflict):
+    """INSERT ... SELECT from the staging table applying the restore rules."""
+    spec = TABLES[table]
+    names = [column["name"] for column in columns]
+
+    def qi(name):
+        return '"' + name.replace('"', '""') + '"'
+
+    def expr(name):
+        if name in spec.get("overrides", {}):
+            return spec["overrides"][name]
+        if name == spec.get("source_column"):
+            return f"COALESCE(sm.new_id, s.{qi(name)})"
+        ref_table = spec.get("external_refs", {}).get(name)
+        if ref_table:
+            return f"(SELECT r.id FROM {qi(ref_table)} r WHERE r.id = s.{qi(name)})"
+        return f"s.{qi(name)}"
+
+    joins = ""
+    if spec.get("source_column"):
+        joins = f" LEFT JOIN _restore_source_map sm ON sm.old_id = s.{qi(spec['source_column'])}"
+
+    conditions = []
+    if spec.get("parent"):
+        column, parent = spec["parent"]
+        conditions.append(f"EXISTS (SELECT 1 FROM {qi(parent)} p WHERE p.id = s.{qi(column)})")
+    for natural_key in spec.get("natural_keys", []):
+        matches = " AND ".join(f"x.{qi(column)} = {expr(column)}" for column in natural_key)
+        conditions.append(f"NOT EXISTS (SELECT 1 FROM {qi(table)} x WHERE {matches} AND x.id <> s.id)")
+    where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+
+    conflict_target = ", ".join(qi(column) for column in spec["conflict"])
+    updatable = [name for name in names if name not in spec["conflict"] and name != "id"]
+    if on_conflict == "skip" or not updatable:
+        action = "DO NOTHING"
+    else:
+        action = "DO UPDATE SET " + ", ".join(f"{qi(name)} = EXCLUDED.{qi(name)}" for name in updatable)
+
+    return (
+        f"INSERT INTO {qi(table)} ({', '.join(qi(name) for name in names)}) "
+        f"SELECT {', '.join(expr(name) for name in names)} FROM _restore_stage s{joins}{where} "
+        f"ON CONFLICT ({conflict_target}) {action}"
+    )
+
+
+def prepare_source_map(conn, dump_dir, fmt, manifest):
+    """Map dumped news_sources ids to the target's ids by source_key."""
+    with conn.cursor() as cur:
+        cur.execute("CREATE TEMP TABLE IF NOT EXISTS _restore_source_map (old_id UUID PRIMARY KEY, new_id UUID NOT NULL)")
+        cur.execute("TRUNCATE _restore_source_map")
+        if "news_sources" not in manifest["tables"]:
+            return
+        cur.execute("CREATE TEMP TABLE _restore_source_keys (old_id UUID, source_key TEXT) ON COMMIT DROP")
+        with cur.copy("COPY _restore_source_keys (old_id, source_key) FROM STDIN") as copy:
+            for chunk in iter_chunks(dump_dir, "news_sources", fmt, ["id", "source_key"], 1000, 0):
+                for row in chunk:
+                    copy.write_row(row)
+        cur.execute(
+            """
+            INSERT INTO _restore_source_map (old_id, new_id)
+            SELECT k.old_id, s.id FROM _restore_source_keys k JOIN news_sources s ON s.source_key = k.source_key
+            """
+        )
+    conn.commit()
+
+
+def updated_at_triggers(conn, table):
+    """Names of the BEFORE UPDATE triggers that stamp updated_at = NOW() on a table."""
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT t.tgname
+            FROM pg_trigger t
+            JOIN pg_proc p ON p.oid = t.tgfoid
+            WHERE t.tgrelid = to_regclass(%s) AND NOT t.tgisinternal AND p.proname = 'update_updated_at_column'
+            """,
+            (table,),
+        )
+        return [row[0] for row in cur.fetchall()]
+
+
+def owns_table(conn, table):
+    with conn.cursor() as cur:
+        cur.execute("SELECT pg_has_role(relowner, 'USAGE') FROM pg_class WHERE oid = to_regclass(%s)", (table,))
+        row = cur.fetchone()
+    return bool(row and row[0])
+
+
+def import_table(conn, table, dump_dir, fmt, manifest, checkpoint, checkpoint_path, args):
+    from psycopg import sql
+
+    entry = manifest["tables"][table]
+    target_columns = {column["name"] for column in load_columns(conn, table)}
+    if not target_columns:
+        log(f"⚠️  {table}: missing in target database, skipped")
+        return
+    columns = [column for column in entry["columns"] if column["name"] in target_columns]
+    dropped = [column["name"] for column in entry["columns"] if column["name"] not in target_columns]
+    if dropped:
+        log(f"⚠️  {table}: target has no column(s) {', '.join(dropped)}; their values are not restored")
+
+    names = [column["name"] for column in columns]
+    types = [column["type"] for column in columns]
+    state = checkpoint["tables"].setdefault(table, {"rows": 0, "written": 0, "done": False})
+    if state["done"]:
+        log(f"⏭️  {table}: already restored ({state['rows']} rows)")
+        return
+    if state["rows"]:
+        log(f"↪️  {table}: resuming after {state['rows']} rows")
+
+    merge = build_merge_sql(table, columns, args.on_conflict)
+    # DO UPDATE fires BEFORE UPDATE triggers, which would overwrite the dumped updated_at
+    triggers = updated_at_triggers(conn, table) if args.on_conflict == "update" else []
+    if triggers and not owns_table(conn, table):
+        raise SystemExit(
+            f"❌ {table}: keeping updated_at needs ALTER TABLE ... DISABLE TRIGGER; "
+            "connect as the table owner or use --on-conflict skip"
+        )
+    toggle = {
+        action: [
+            sql.SQL("ALTER TABLE {} {} TRIGGER {}").format(sql.Identifier(table), sql.SQL(action), sql.Identifier(name))
+            for name in triggers
+        ]
+        for action in ("DISABLE", "ENABLE")
+    }
+    copy_stmt = sql.SQL("COPY _restore_stage ({cols}) FROM STDIN").format(cols=sql.SQL(", ").join(map(sql.Identifier, names)))
+
+    with conn.cursor() as cur:
+        cur.execute("DROP TABLE IF EXISTS _restore_stage")
+        cur.execute(sql.SQL("CREATE TEMP TABLE _restore_stage (LIKE {} INCLUDING DEFAULTS)").format(sql.Identifier(table)))
+    conn.commit()
+
+    started = time.monotonic()
+    session_rows = 0
+    for chunk in iter_chunks(dump_dir, table, fmt, names, args.chunk_size, state["rows"]):
+        with conn.transaction():
+            with conn.cursor() as cur:
+                with cur.copy(copy_stmt) as copy:
+                    for row in chunk:
+                        copy.write_row([to_copy_value(value, pg_type, fmt != "jsonl") for value, pg_type in zip(row, types)])
+                if TABLES[table].get("monthly_partitions"):
+                    cur.execute(
+                        "SELECT ensure_newslist_archive_partition(m) "
+                        "FROM (SELECT DISTINCT date_trunc('month', created_at)::date AS m FROM _restore_stage) months"
+                    )
+                # Transactional: a failed chunk rolls the triggers back to enabled
+                for statement in toggle["DISABLE"]:
+                    cur.execute(statement)
+                cur.execute(merge)
+                written = max(cur.rowcount, 0)
+                for statement in toggle["ENABLE"]:
+                    cur.execute(statement)
+                cur.execute("TRUNCATE _restore_stage")
+
+        # Written after commit: a crash in between replays one chunk, which the merge absorbs
+        state["rows"] += len(chunk)
+        state["written"] += written
+        write_json_atomic(checkpoint_path, checkpoint)
+
+        session_rows += len(chunk)
+        elapsed = max(time.monotonic() - started, 1e-6)
+        log(f"   {table}: {state['rows']}/{entry['rows']} rows, {state['written']} written ({session_rows / elapsed:,.0f}/s)")
+
+    state["done"] = True
+    write_json_atomic(checkpoint_path, checkpoint)
+    skipped = state["rows"] - state["written"]
+    log(f"✅ {table}: {state['written']} rows written" + (f", {skipped} skipped by restore rules" if skipped else ""))
+
+
+def run_import(args):
+    psycopg = require("psycopg", "pip install 'psycopg[binary]'")
+    manifest_path = os.path.join(args.dump, MANIFEST)
+    if not os.path.exists(manifest_path):
+        log(f"❌ {manifest_path} not found (incomplete export?)")
+        return 1
+    with open(manifest_path, encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    fmt = args.format or manifest["formats"][0]
+    if fmt not in manifest["formats"]:
+        log(f"❌ Dump has no {fmt} files (available: {', '.join(manifest['formats'])})")
+        return 1
+
+    tables = [table for table in resolve_tables(args.tables) if table in manifest["tables"]]
+    checkpoint_path = os.path.join(args.dump, CHECKPOINT)
+    checkpoint = {"dump_created_at": manifest["created_at"], "tables": {}}
+    if os.path.exists(checkpoint_path) and not args.restart:
+        with open(checkpoint_path, encoding="utf-8") as f:
+            saved = json.load(f)
+        if saved.get("dump_created_at") == manifest["created_at"]:
+            checkpoint = saved
+
+    started = time.monotonic()
+    with psycopg.connect(args.database_url) as conn:
+        for table in tables:
+            if table != "news_sources" and TABLES[table].get("source_column"):
+                prepare_source_map(conn, args.dump, fmt, manifest)
+            log(f"📥 Importing {table} ({manifest['tables'][table]['rows']} rows, {fmt})")
+            import_table(conn, table, args.dump, fmt, manifest, checkpoint, checkpoint_path, args)
+
+    log(f"✅ Restore finished in {time.monotonic() - started:.1f}s")
+    return 0
+
+
+def main():
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--database-url", default=os.environ.get("DATABASE_URL"), help="Postgres URL (default: DATABASE_URL)")
+    common.add_argument("--chunk-size", type=int, default=5000, help="rows per keyset page / restore batch (default 5000)")
+    common.add_argument("--tables", help=f"comma-separated subset of {', '.join(TABLES)} (newslist includes the archive)")
+
+    parser = argparse.ArgumentParser(description="Bulk export / import of the article corpus")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export = commands.add_parser("export", parents=[common], help="dump tables to a directory")
+    export.add_argument("--out", required=True, help="output directory")
+    export.add_argument("--format", default="jsonl", help="comma-separated: jsonl, parquet, arrow (default jsonl)")
+    export.add_argument("--compression", default="zstd", help="Parquet / Arrow codec (default zstd)")
+    export.add_argument("--gzip-level", type=int, default=6, help="JSONL gzip level (default 6)")
+
+    restore = commands.add_parser("import", parents=[common], help="restore a dump directory")
+    restore.add_argument("dump", help="directory written by export")
+    restore.add_argument("--format", choices=FORMATS, help="which files to read (default: first exported format)")
+    restore.add_argument("--on-conflict", choices=["update", "skip"], default="update", help="existing rows: overwrite or keep (default update)")
+    restore.add_argument("--restart", action="store_true", help="ignore restore-checkpoint.json and start over")
+
+    args = parser.parse_args()
+    if not args.database_url:
+        print("--database-url or DATABASE_URL is required", file=sys.stderr)
+        return 1
+    args.chunk_size = max(1, args.chunk_size)
+
+    if args.command == "export":
+        return run_export(args)
+    return run_import(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,7 +5,68 @@
  * Each source defines its own selectors, base URL, and scraping configuration.
  */
 
-import type { NewsSource } from '../types/database';
+import type { NewsSource, SourceNetworkPolicy } from '../types/database';
+
+/**
+ * Resource types article renders never need: the scraper reads image URLs
+ * from the DOM, not image bytes, and ignores styling and media.
+ */
+export const HEAVY_RESOURCE_TYPES = [
+  'image',
+  'media',
+  'font',
+  'stylesheet',
+  'texttrack',
+  'websocket',
+  'eventsource',
+  'manifest',
+  'ping',
+  'cspviolationreport',
+];
+
+// No-op globals for ad/analytics loaders that first-party code calls directly
+const GOOGLE_TAG_STUB = 'window.googletag=window.googletag||{cmd:[]};';
+const DATA_LAYER_STUB = 'window.dataLayer=window.dataLayer||[];';
+const FACEBOOK_SDK_STUB = 'window.FB=window.FB||{init:function(){},XFBML:{parse:function(){}}};';
+
+const hk01NetworkPolicy: SourceNetworkPolicy = {
+  allowedHosts: ['hk01.com'],
+  blockedResourceTypes: HEAVY_RESOURCE_TYPES,
+  blockedDomains: ['social-reaction-api.hk01.com'],
+  stubbedScripts: [
+    { host: 'securepubads.g.doubleclick.net', pathPrefix: '/tag/js/gpt.js', body: GOOGLE_TAG_STUB },
+    { host: 'googletagmanager.com', body: DATA_LAYER_STUB },
+    { host: 'connect.facebook.net', body: FACEBOOK_SDK_STUB },
+  ],
+  readySelector: '[data-testid="article-top-section"]',
+  // In-article images are only mounted once their wrapper enters the viewport
+  lazyMount: {
+    wrapperSelector: '.article-grid__content-section .lazyload-wrapper',
+    placeholderSelector: '.lazyload-placeholder',
+  },
+};
+
+const mingPaoNetworkPolicy: SourceNetworkPolicy = {
+  allowedHosts: ['mingpao.com', 'cdnjs.cloudflare.com'],
+  blockedResourceTypes: HEAVY_RESOURCE_TYPES,
+  // Ad creatives and the video player are served from first-party subdomains
+  blockedDomains: ['creative.mingpao.com', 'streaming.mingpao.com'],
+  stubbedScripts: [
+    { host: 'securepubads.g.doubleclick.net', pathPrefix: '/tag/js/gpt.js', body: GOOGLE_TAG_STUB },
+    { host: 'googletagmanager.com', body: DATA_LAYER_STUB },
+    { host: 'connect.facebook.net', body: FACEBOOK_SDK_STUB },
+  ],
+  // Article body is server-rendered; lazy images keep their URL in data-original
+  readySelector: 'article.txt4, div#lower',
+};
+
+/**
+ * Policy for sources without their own: block heavy resource types only
+ */
+export const DEFAULT_NETWORK_POLICY: SourceNetworkPolicy = {
+  allowedHosts: [],
+  blockedResourceTypes: HEAVY_RESOURCE_TYPES,
+};
 
 // HK01 Configuration
 export const hk01Config: NewsSource = {
@@ -32,6 +93,7 @@ export const hk01Config: NewsSource = {
       category: '[data-testid="article-breadcrumb-zone"], [data-testid="article-breadcrumb-channel"]',
     },
   },
+  network_policy: hk01NetworkPolicy,
   created_at: new Date().toISOString(),
   updated_at: new Date().toISOString(),
 };
@@ -61,6 +123,7 @@ export const mingPaoConfig: NewsSource = {
       category: 'div.colleft a h3',
     },
   },
+  network_policy: mingPaoNetworkPolicy,
   created_at: new Date().toISOString(),
   updated_at: new Date().toISOString(),
 };
@@ -95,6 +158,13 @@ export function getAllSourceConfigs(): NewsSource[] {
   return Object.values(SOURCE_REGISTRY);
 }
 
+/**
+ * Get the headless-render network policy for a source
+ */
+export function getNetworkPolicy(sourceKey?: string | null): SourceNetworkPolicy {
+  return (sourceKey ? SOURCE_REGISTRY[sourceKey]?.network_policy : undefined) ?? DEFAULT_NETWORK_POLICY;
+}
+
 /**
  * Detect source from URL
  */
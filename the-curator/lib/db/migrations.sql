@@ -20,10 +20,15 @@ BEGIN
 		-- DROP EXISTING TABLES (complete clean slate)
 		-- ============================================================================
 		DROP TABLE IF EXISTS article_images CASCADE;
+		DROP TABLE IF EXISTS story_lsh_buckets CASCADE;
+		DROP TABLE IF EXISTS story_clusters CASCADE;
 		DROP TABLE IF EXISTS articles CASCADE;
+		DROP TABLE IF EXISTS image_assets CASCADE;
 		DROP TABLE IF EXISTS news_sources CASCADE;
 		DROP TABLE IF EXISTS scraper_categories CASCADE;
 		DROP TABLE IF EXISTS automation_history CASCADE;
+		DROP VIEW IF EXISTS newslist_all;
+		DROP TABLE IF EXISTS newslist_archive CASCADE;
 		DROP TABLE IF EXISTS newslist CASCADE;
 
 		-- Enable required extensions
@@ -49,6 +54,28 @@ BEGIN
 			UNIQUE(source_id, source_article_id)
 		);
 
+		-- ============================================================================
+		-- TABLE: newslist_archive
+		-- Cold tier: extracted newslist rows moved out of the hot queue in batches,
+		-- range-partitioned by month of discovery (partitions created on demand)
+		-- ============================================================================
+		CREATE TABLE newslist_archive (
+			id UUID NOT NULL,
+			source_id UUID NOT NULL,
+			source_article_id VARCHAR(100),
+			url TEXT NOT NULL,
+			status VARCHAR(20) NOT NULL,
+			meta JSONB,
+			error_log TEXT,
+			attempt_count INTEGER NOT NULL DEFAULT 0,
+			last_processed_at TIMESTAMPTZ,
+			resolved_article_id UUID,
+			created_at TIMESTAMPTZ NOT NULL,
+			updated_at TIMESTAMPTZ,
+			archived_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+			PRIMARY KEY (id, created_at)
+		) PARTITION BY RANGE (created_at);
+
 		-- ============================================================================
 		-- TABLE: news_sources
 		-- Stores configuration for each news source
@@ -82,6 +109,27 @@ BEGIN
 			UNIQUE(source_id, slug)
 		);
 
+		-- ============================================================================
+		-- TABLE: image_assets
+		-- One row per distinct source image (by normalized URL) with local derivatives
+		-- ============================================================================
+		CREATE TABLE image_assets (
+			id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+			normalized_url TEXT NOT NULL UNIQUE,
+			content_hash VARCHAR(64),
+			width INTEGER,
+			height INTEGER,
+			byte_size INTEGER,
+			mime_type VARCHAR(50),
+			derivatives JSONB,
+			status VARCHAR(20) NOT NULL DEFAULT 'pending',
+			error_log TEXT,
+			attempt_count INTEGER NOT NULL DEFAULT 0,
+			fetched_at TIMESTAMPTZ,
+			created_at TIMESTAMPTZ DEFAULT NOW(),
+			updated_at TIMESTAMPTZ DEFAULT NOW()
+		);
+
 		-- ============================================================================
 		-- TABLE: articles
 		-- Core article storage matching HK01 extraction
@@ -102,7 +150,16 @@ BEGIN
 			excerpt TEXT,
 			main_image_url TEXT,
 			main_image_caption TEXT,
+			main_image_asset_id UUID REFERENCES image_assets(id) ON DELETE SET NULL,
 			metadata JSONB,
+			content_hash VARCHAR(64),
+			last_checked_at TIMESTAMPTZ,
+			next_recrawl_at TIMESTAMPTZ,
+			recrawl_count INTEGER NOT NULL DEFAULT 0,
+			story_signature INTEGER[],
+			story_cluster_id UUID,
+			is_story_primary BOOLEAN NOT NULL DEFAULT true,
+			story_similarity REAL,
 			scraped_at TIMESTAMPTZ DEFAULT NOW(),
 			last_updated_at TIMESTAMPTZ DEFAULT NOW(),
 			scrape_status VARCHAR(20) DEFAULT 'success',
@@ -123,7 +180,36 @@ BEGIN
 			caption TEXT,
 			display_order INTEGER DEFAULT 0,
 			is_main_image BOOLEAN DEFAULT false,
-			created_at TIMESTAMPTZ DEFAULT NOW()
+			asset_id UUID REFERENCES image_assets(id) ON DELETE SET NULL,
+			width INTEGER,
+			height INTEGER,
+			created_at TIMESTAMPTZ DEFAULT NOW(),
+			updated_at TIMESTAMPTZ DEFAULT NOW()
+		);
+
+		-- ============================================================================
+		-- TABLE: story_clusters
+		-- Near-duplicate articles (usually from different sources) covering one story
+		-- ============================================================================
+		CREATE TABLE story_clusters (
+			id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+			representative_article_id UUID REFERENCES articles(id) ON DELETE SET NULL,
+			article_count INTEGER NOT NULL DEFAULT 1,
+			source_count INTEGER NOT NULL DEFAULT 1,
+			first_published_at TIMESTAMPTZ,
+			created_at TIMESTAMPTZ DEFAULT NOW(),
+			updated_at TIMESTAMPTZ DEFAULT NOW()
+		);
+
+		-- ============================================================================
+		-- TABLE: story_lsh_buckets
+		-- LSH index over article MinHash signatures: one row per (band key, article)
+		-- ============================================================================
+		CREATE TABLE story_lsh_buckets (
+			band_key VARCHAR(32) NOT NULL,
+			article_id UUID NOT NULL REFERENCES articles(id) ON DELETE CASCADE,
+			created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+			PRIMARY KEY (band_key, article_id)
 		);
 
 		-- ============================================================================
@@ -149,8 +235,16 @@ BEGIN
 		-- INDEXES
 		-- ============================================================================
 		CREATE INDEX IF NOT EXISTS idx_newslist_source_id ON newslist(source_id);
-		CREATE INDEX IF NOT EXISTS idx_newslist_status ON newslist(status);
+		CREATE INDEX IF NOT EXISTS idx_newslist_status_created_at ON newslist(status, created_at);
 		CREATE INDEX IF NOT EXISTS idx_newslist_created_at ON newslist(created_at DESC);
+		CREATE INDEX IF NOT EXISTS idx_newslist_active ON newslist(created_at)
+			WHERE status IN ('pending', 'queued', 'processing', 'failed');
+		CREATE INDEX IF NOT EXISTS idx_newslist_extracted_updated_at ON newslist(updated_at)
+			WHERE status = 'extracted';
+
+		CREATE INDEX IF NOT EXISTS idx_newslist_archive_source_article ON newslist_archive(source_id, source_article_id);
+		CREATE INDEX IF NOT EXISTS idx_newslist_archive_url ON newslist_archive(url);
+		CREATE INDEX IF NOT EXISTS idx_newslist_archive_created_at ON newslist_archive(created_at DESC);
 
 		CREATE INDEX IF NOT EXISTS idx_articles_source_id ON articles(source_id);
 		CREATE INDEX IF NOT EXISTS idx_articles_source_article_id ON articles(source_id, source_article_id);
@@ -162,9 +256,19 @@ BEGIN
 		CREATE INDEX IF NOT EXISTS idx_articles_title_trgm ON articles USING gin(title gin_trgm_ops);
 		CREATE INDEX IF NOT EXISTS idx_articles_category_published ON articles(category, published_date DESC);
 		CREATE INDEX IF NOT EXISTS idx_articles_sub_category_published ON articles(sub_category, published_date DESC);
+		CREATE INDEX IF NOT EXISTS idx_articles_next_recrawl_at ON articles(next_recrawl_at) WHERE next_recrawl_at IS NOT NULL;
+		CREATE INDEX IF NOT EXISTS idx_articles_story_cluster_id ON articles(story_cluster_id) WHERE story_cluster_id IS NOT NULL;
+		CREATE INDEX IF NOT EXISTS idx_articles_story_primary_published ON articles(published_date DESC) WHERE is_story_primary;
+
+		CREATE INDEX IF NOT EXISTS idx_story_lsh_buckets_article_id ON story_lsh_buckets(article_id);
+		CREATE INDEX IF NOT EXISTS idx_story_lsh_buckets_created_at ON story_lsh_buckets(created_at);
 
 		CREATE INDEX IF NOT EXISTS idx_article_images_article_id ON article_images(article_id);
 		CREATE INDEX IF NOT EXISTS idx_article_images_display_order ON article_images(display_order);
+		CREATE INDEX IF NOT EXISTS idx_article_images_pending_asset ON article_images(created_at) WHERE asset_id IS NULL;
+		CREATE INDEX IF NOT EXISTS idx_articles_pending_main_image ON articles(created_at DESC) WHERE main_image_url IS NOT NULL AND main_image_asset_id IS NULL;
+
+		CREATE INDEX IF NOT EXISTS idx_image_assets_content_hash ON image_assets(content_hash);
 
 		CREATE INDEX IF NOT EXISTS idx_scraper_categories_source_id ON scraper_categories(source_id);
 		CREATE INDEX IF NOT EXISTS idx_scraper_categories_priority ON scraper_categories(priority, last_run_at);
@@ -183,6 +287,257 @@ BEGIN
 		END;
 		$_upd$ LANGUAGE plpgsql;
 
+		-- ============================================================================
+		-- NEWSLIST TIERING
+		-- Hot: newslist (pending/queued/processing/failed + recently extracted)
+		-- Cold: newslist_archive (extracted, partitioned by month)
+		-- ============================================================================
+		CREATE OR REPLACE FUNCTION ensure_newslist_archive_partition(p_month DATE)
+		RETURNS void AS $_part$
+		DECLARE
+			v_start DATE := date_trunc('month', p_month)::date;
+			v_end DATE := (date_trunc('month', p_month) + INTERVAL '1 month')::date;
+		BEGIN
+			EXECUTE format(
+				'CREATE TABLE IF NOT EXISTS %I PARTITION OF newslist_archive FOR VALUES FROM (%L) TO (%L)',
+				'newslist_archive_' || to_char(v_start, 'YYYY_MM'),
+				v_start,
+				v_end
+			);
+		END;
+		$_part$ LANGUAGE plpgsql;
+
+		-- Moves one batch of extracted rows older than p_min_age to the cold tier
+		CREATE OR REPLACE FUNCTION archive_extracted_newslist(
+			p_batch_size INTEGER DEFAULT 5000,
+			p_min_age INTERVAL DEFAULT INTERVAL '1 day'
+		)
+		RETURNS INTEGER AS $_arch$
+		DECLARE
+			v_ids UUID[];
+			v_month DATE;
+			v_moved INTEGER;
+		BEGIN
+			SELECT array_agg(id) INTO v_ids
+			FROM (
+				SELECT id FROM newslist
+				WHERE status = 'extracted' AND updated_at < NOW() - p_min_age
+				ORDER BY updated_at
+				LIMIT p_batch_size
+				FOR UPDATE SKIP LOCKED
+			) batch;
+
+			IF v_ids IS NULL THEN
+				RETURN 0;
+			END IF;
+
+			FOR v_month IN
+				SELECT DISTINCT date_trunc('month', COALESCE(created_at, NOW()))::date
+				FROM newslist WHERE id = ANY(v_ids)
+			LOOP
+				PERFORM ensure_newslist_archive_partition(v_month);
+			END LOOP;
+
+			-- Copy first and delete only what was written; a stale archived copy
+			-- of the same row is overwritten by the hot one
+			WITH archived AS (
+				INSERT INTO newslist_archive (
+					id, source_id, source_article_id, url, status, meta, error_log, attempt_count,
+					last_processed_at, resolved_article_id, created_at, updated_at
+				)
+				SELECT id, source_id, source_article_id, url, status, meta, error_log, attempt_count,
+				       last_processed_at, resolved_article_id, COALESCE(created_at, NOW()), updated_at
+				FROM newslist
+				WHERE id = ANY(v_ids)
+				ON CONFLICT (id, created_at) DO UPDATE SET
+					source_id = EXCLUDED.source_id,
+					source_article_id = EXCLUDED.source_article_id,
+					url = EXCLUDED.url,
+					status = EXCLUDED.status,
+					meta = EXCLUDED.meta,
+					error_log = EXCLUDED.error_log,
+					attempt_count = EXCLUDED.attempt_count,
+					last_processed_at = EXCLUDED.last_processed_at,
+					resolved_article_id = EXCLUDED.resolved_article_id,
+					updated_at = EXCLUDED.updated_at,
+					archived_at = NOW()
+				RETURNING id
+			)
+			DELETE FROM newslist n
+			USING archived
+			WHERE n.id = archived.id;
+
+			GET DIAGNOSTICS v_moved = ROW_COUNT;
+			RETURN v_moved;
+		END;
+		$_arch$ LANGUAGE plpgsql;
+
+		-- Moves archived rows back to the hot tier (reprocess, recrawl, article deletion)
+		-- Rows that clash with a hot row (same id, url or source article) stay archived
+		CREATE OR REPLACE FUNCTION restore_archived_newslist(
+			p_ids UUID[] DEFAULT NULL,
+			p_source_id UUID DEFAULT NULL,
+			p_source_article_ids TEXT[] DEFAULT NULL
+		)
+		RETURNS INTEGER AS $_rest$
+		DECLARE
+			v_restored INTEGER;
+		BEGIN
+			WITH restored AS (
+				INSERT INTO newslist (
+					id, source_id, source_article_id, url, status, meta, error_log, attempt_count,
+					last_processed_at, resolved_article_id, created_at
+				)
+				SELECT a.id, a.source_id, a.source_article_id, a.url, a.status, a.meta, a.error_log, a.attempt_count,
+				       a.last_processed_at, a.resolved_article_id, a.created_at
+				FROM newslist_archive a
+				WHERE (p_ids IS NOT NULL AND a.id = ANY(p_ids))
+				   OR (p_source_id IS NOT NULL AND a.source_id = p_source_id
+				       AND a.source_article_id = ANY(p_source_article_ids))
+				ON CONFLICT DO NOTHING
+				RETURNING id, created_at
+			)
+			DELETE FROM newslist_archive a
+			USING restored r
+			WHERE a.id = r.id AND a.created_at = r.created_at;
+
+			GET DIAGNOSTICS v_restored = ROW_COUNT;
+			RETURN v_restored;
+		END;
+		$_rest$ LANGUAGE plpgsql;
+
+		-- Batched discovery insert; deduplicates against both tiers in one statement
+		CREATE OR REPLACE FUNCTION enqueue_newslist_entries(p_source_id UUID, p_entries JSONB)
+		RETURNS TABLE (inserted INTEGER, duplicates INTEGER) AS $_enq$
+		DECLARE
+			v_total INTEGER;
+			v_inserted INTEGER;
+		BEGIN
+			SELECT count(*) INTO v_total FROM jsonb_array_elements(p_entries);
+
+			WITH incoming AS (
+				SELECT DISTINCT ON (e->>'source_article_id')
+				       e->>'source_article_id' AS source_article_id,
+				       e->>'url' AS url,
+				       e->'meta' AS meta
+				FROM jsonb_array_elements(p_entries) e
+			)
+			INSERT INTO newslist (source_id, source_article_id, url, status, meta)
+			SELECT p_source_id, i.source_article_id, i.url, 'pending', i.meta
+			FROM incoming i
+			WHERE NOT EXISTS (
+				SELECT 1 FROM newslist_archive a
+				WHERE a.source_id = p_source_id AND a.source_article_id = i.source_article_id
+			)
+			AND NOT EXISTS (SELECT 1 FROM newslist_archive a WHERE a.url = i.url)
+			ON CONFLICT DO NOTHING;
+
+			GET DIAGNOSTICS v_inserted = ROW_COUNT;
+			RETURN QUERY SELECT v_inserted, v_total - v_inserted;
+		END;
+		$_enq$ LANGUAGE plpgsql;
+
+		-- Read-only union of both tiers for history listings
+		CREATE OR REPLACE VIEW newslist_all AS
+			SELECT id, source_id, source_article_id, url, status, meta, error_log, attempt_count,
+			       last_processed_at, resolved_article_id, created_at, updated_at,
+			       NULL::timestamptz AS archived_at
+			FROM newslist
+			UNION ALL
+			SELECT id, source_id, source_article_id, url, status, meta, error_log, attempt_count,
+			       last_processed_at, resolved_article_id, created_at, updated_at,
+			       archived_at
+			FROM newslist_archive;
+
+		-- ============================================================================
+		-- STORY CLUSTERS
+		-- ============================================================================
+		-- Attaches p_article_id to the cluster of p_match_article_id, creating the
+		-- cluster (with the match as representative) on first use
+		CREATE OR REPLACE FUNCTION join_story_cluster(
+			p_article_id UUID,
+			p_match_article_id UUID,
+			p_similarity REAL
+		)
+		RETURNS UUID AS $_join$
+		DECLARE
+			v_cluster UUID;
+		BEGIN
+			SELECT story_cluster_id INTO v_cluster
+			FROM articles WHERE id = p_match_article_id
+			FOR UPDATE;
+
+			IF NOT FOUND THEN
+				RETURN NULL;
+			END IF;
+
+			IF v_cluster IS NULL THEN
+				INSERT INTO story_clusters (representative_article_id, article_count, source_count, first_published_at)
+				SELECT id, 1, 1, published_date FROM articles WHERE id = p_match_article_id
+				RETURNING id INTO v_cluster;
+
+				UPDATE articles SET story_cluster_id = v_cluster, is_story_primary = true
+				WHERE id = p_match_article_id;
+			END IF;
+
+			UPDATE articles
+			SET story_cluster_id = v_cluster, is_story_primary = false, story_similarity = p_similarity
+			WHERE id = p_article_id AND story_cluster_id IS NULL;
+
+			IF FOUND THEN
+				UPDATE story_clusters c
+				SET article_count = stats.article_count,
+				    source_count = stats.source_count,
+				    first_published_at = stats.first_published_at
+				FROM (
+					SELECT count(*) AS article_count,
+					       count(DISTINCT source_id) AS source_count,
+					       min(published_date) AS first_published_at
+					FROM articles WHERE story_cluster_id = v_cluster
+				) stats
+				WHERE c.id = v_cluster;
+			END IF;
+
+			RETURN v_cluster;
+		END;
+		$_join$ LANGUAGE plpgsql;
+
+		-- Keeps a cluster visible when its representative is deleted
+		CREATE OR REPLACE FUNCTION handle_story_member_delete()
+		RETURNS TRIGGER AS $_sdel$
+		DECLARE
+			v_next UUID;
+		BEGIN
+			IF OLD.story_cluster_id IS NULL THEN
+				RETURN OLD;
+			END IF;
+
+			SELECT id INTO v_next FROM articles
+			WHERE story_cluster_id = OLD.story_cluster_id
+			ORDER BY is_story_primary DESC, published_date NULLS LAST, created_at
+			LIMIT 1;
+
+			IF v_next IS NULL THEN
+				DELETE FROM story_clusters WHERE id = OLD.story_cluster_id;
+				RETURN OLD;
+			END IF;
+
+			IF OLD.is_story_primary THEN
+				UPDATE articles SET is_story_primary = true WHERE id = v_next;
+				UPDATE story_clusters SET representative_article_id = v_next WHERE id = OLD.story_cluster_id;
+			END IF;
+
+			UPDATE story_clusters
+			SET article_count = GREATEST(article_count - 1, 1),
+			    source_count = (
+			        SELECT count(DISTINCT source_id) FROM articles WHERE story_cluster_id = OLD.story_cluster_id
+			    )
+			WHERE id = OLD.story_cluster_id;
+
+			RETURN OLD;
+		END;
+		$_sdel$ LANGUAGE plpgsql;
+
 		-- ============================================================================
 		-- TRIGGERS
 		-- ============================================================================
@@ -204,12 +559,30 @@ BEGIN
 			FOR EACH ROW
 			EXECUTE FUNCTION update_updated_at_column();
 
+		DROP TRIGGER IF EXISTS trg_articles_story_member_delete ON articles;
+		CREATE TRIGGER trg_articles_story_member_delete
+			AFTER DELETE ON articles
+			FOR EACH ROW
+			EXECUTE FUNCTION handle_story_member_delete();
+
+		DROP TRIGGER IF EXISTS trg_story_clusters_updated_at ON story_clusters;
+		CREATE TRIGGER trg_story_clusters_updated_at
+			BEFORE UPDATE ON story_clusters
+			FOR EACH ROW
+			EXECUTE FUNCTION update_updated_at_column();
+
 		DROP TRIGGER IF EXISTS trg_article_images_updated_at ON article_images;
 		CREATE TRIGGER trg_article_images_updated_at
 			BEFORE UPDATE ON article_images
 			FOR EACH ROW
 			EXECUTE FUNCTION update_updated_at_column();
 
+		DROP TRIGGER IF EXISTS trg_image_assets_updated_at ON image_assets;
+		CREATE TRIGGER trg_image_assets_updated_at
+			BEFORE UPDATE ON image_assets
+			FOR EACH ROW
+			EXECUTE FUNCTION update_updated_at_column();
+
 		DROP TRIGGER IF EXISTS trg_scraper_categories_updated_at ON scraper_categories;
 		CREATE TRIGGER trg_scraper_categories_updated_at
 			BEFORE UPDATE ON scraper_categories
@@ -264,6 +637,17 @@ BEGIN
 			TO anon
 			USING (true);
 
+		ALTER TABLE newslist_archive ENABLE ROW LEVEL SECURITY;
+		CREATE POLICY "Public read newslist_archive"
+			ON newslist_archive FOR SELECT
+			TO anon, authenticated
+			USING (true);
+		CREATE POLICY "Admin write newslist_archive"
+			ON newslist_archive FOR ALL
+			TO authenticated
+			USING (true)
+			WITH CHECK (true);
+
 		ALTER TABLE news_sources ENABLE ROW LEVEL SECURITY;
 		DROP POLICY IF EXISTS "Admin insert news_sources" ON news_sources;
 		DROP POLICY IF EXISTS "Admin update news_sources" ON news_sources;
@@ -365,6 +749,36 @@ BEGIN
 			TO anon
 			USING (true);
 
+		ALTER TABLE image_assets ENABLE ROW LEVEL SECURITY;
+		DROP POLICY IF EXISTS "Admin write image_assets" ON image_assets;
+		CREATE POLICY "Public read image_assets"
+			ON image_assets FOR SELECT
+			TO anon, authenticated
+			USING (true);
+		CREATE POLICY "Admin write image_assets"
+			ON image_assets FOR ALL
+			TO authenticated
+			USING (true)
+			WITH CHECK (true);
+
+		ALTER TABLE story_clusters ENABLE ROW LEVEL SECURITY;
+		CREATE POLICY "Public read story_clusters"
+			ON story_clusters FOR SELECT
+			TO anon, authenticated
+			USING (true);
+		CREATE POLICY "Admin write story_clusters"
+			ON story_clusters FOR ALL
+			TO authenticated
+			USING (true)
+			WITH CHECK (true);
+
+		ALTER TABLE story_lsh_buckets ENABLE ROW LEVEL SECURITY;
+		CREATE POLICY "Admin write story_lsh_buckets"
+			ON story_lsh_buckets FOR ALL
+			TO authenticated
+			USING (true)
+			WITH CHECK (true);
+
 		ALTER TABLE scraper_categories ENABLE ROW LEVEL SECURITY;
 		DROP POLICY IF EXISTS "Admin insert scraper categories" ON scraper_categories;
 		DROP POLICY IF EXISTS "Admin update scraper categories" ON scraper_categories;
@@ -445,6 +859,18 @@ BEGIN
 			REFERENCES articles(id)
 			ON DELETE SET NULL;
 
+		ALTER TABLE articles
+			ADD CONSTRAINT articles_story_cluster_fk
+			FOREIGN KEY (story_cluster_id)
+			REFERENCES story_clusters(id)
+			ON DELETE SET NULL;
+
+		ALTER TABLE newslist_archive
+			ADD CONSTRAINT newslist_archive_source_fk
+			FOREIGN KEY (source_id)
+			REFERENCES news_sources(id)
+			ON DELETE CASCADE;
+
 		-- ============================================================================
 		-- SEED DATA
 		-- ============================================================================
@@ -471,6 +897,7 @@ BEGIN
 		)
 		ON CONFLICT (source_key) DO NOTHING;
 
+		-- Slugs and metadata follow sync_categories.py ({zoneId}-{name}) so a later sync updates these rows
 		WITH hk01_source AS (
 			SELECT id FROM news_sources WHERE source_key = 'hk01' LIMIT 1
 		)
@@ -479,22 +906,22 @@ BEGIN
 		       zones.slug,
 		       zones.name,
 		       zones.priority,
-		       jsonb_build_object('zoneId', zones.zone_id, 'zoneUrl', zones.zone_url)
+		       jsonb_build_object('zoneId', zones.zone_id, 'zoneUrl', zones.zone_url, 'navType', 'zone')
 		FROM hk01_source
 		CROSS JOIN (
 			VALUES
-				('hk01-zone-01', 'HK01 Zone 1 · Headlines', 10, 1, 'https://www.hk01.com/zone/1'),
-				('hk01-zone-02', 'HK01 Zone 2 · Hong Kong', 20, 2, 'https://www.hk01.com/zone/2'),
-				('hk01-zone-03', 'HK01 Zone 3 · Finance', 30, 3, 'https://www.hk01.com/zone/3'),
-				('hk01-zone-04', 'HK01 Zone 4 · Lifestyle', 40, 4, 'https://www.hk01.com/zone/4'),
-				('hk01-zone-05', 'HK01 Zone 5 · Entertainment', 50, 5, 'https://www.hk01.com/zone/5'),
-				('hk01-zone-06', 'HK01 Zone 6 · Sports', 60, 6, 'https://www.hk01.com/zone/6'),
-				('hk01-zone-07', 'HK01 Zone 7 · China', 70, 7, 'https://www.hk01.com/zone/7'),
-				('hk01-zone-08', 'HK01 Zone 8 · International', 80, 8, 'https://www.hk01.com/zone/8'),
-				('hk01-zone-09', 'HK01 Zone 9 · Technology', 90, 9, 'https://www.hk01.com/zone/9'),
-				('hk01-zone-10', 'HK01 Zone 10 · Culture', 100, 10, 'https://www.hk01.com/zone/10'),
-				('hk01-zone-11', 'HK01 Zone 11 · Education', 110, 11, 'https://www.hk01.com/zone/11'),
-				('hk01-zone-12', 'HK01 Zone 12 · Opinion', 120, 12, 'https://www.hk01.com/zone/12')
+				('1-港聞', '港聞', 10, '1', 'https://www.hk01.com/zone/1/%E6%B8%AF%E8%81%9E'),
+				('2-娛樂', '娛樂', 20, '2', 'https://www.hk01.com/zone/2/%E5%A8%9B%E6%A8%82'),
+				('3-體育', '體育', 30, '3', 'https://www.hk01.com/zone/3/%E9%AB%94%E8%82%B2'),
+				('4-國際', '國際', 40, '4', 'https://www.hk01.com/zone/4/%E5%9C%8B%E9%9A%9B'),
+				('5-中國', '中國', 50, '5', 'https://www.hk01.com/zone/5/%E4%B8%AD%E5%9C%8B'),
+				('6-女生', '女生', 60, '6', 'https://www.hk01.com/zone/6/%E5%A5%B3%E7%94%9F'),
+				('7-熱話', '熱話', 70, '7', 'https://www.hk01.com/zone/7/%E7%86%B1%E8%A9%B1'),
+				('8-生活', '生活', 80, '8', 'https://www.hk01.com/zone/8/%E7%94%9F%E6%B4%BB'),
+				('9-藝文格物', '藝文格物', 90, '9', 'https://www.hk01.com/zone/9/%E8%97%9D%E6%96%87%E6%A0%BC%E7%89%A9'),
+				('10-社區', '社區', 100, '10', 'https://www.hk01.com/zone/10/%E7%A4%BE%E5%8D%80'),
+				('11-科技', '科技', 110, '11', 'https://www.hk01.com/zone/11/%E7%A7%91%E6%8A%80%E7%8E%A9%E7%89%A9'),
+				('12-觀點', '觀點', 120, '12', 'https://www.hk01.com/zone/12/%E8%A7%80%E9%BB%9E')
 		) AS zones(slug, name, priority, zone_id, zone_url)
 		ON CONFLICT (source_id, slug) DO NOTHING;
 
@@ -503,14 +930,24 @@ BEGIN
 		-- ============================================================================
 		COMMENT ON TABLE newslist IS 'Tracks all discovered URLs and their processing status.';
 		COMMENT ON COLUMN newslist.status IS 'Status machine for newslist entries.';
+		COMMENT ON TABLE newslist_archive IS 'Cold tier of newslist: extracted rows archived in batches, partitioned by month.';
+		COMMENT ON VIEW newslist_all IS 'Union of hot and archived newslist rows for history listings.';
 		COMMENT ON TABLE news_sources IS 'Configuration for each news source and its selectors.';
 		COMMENT ON TABLE scraper_categories IS 'Scheduler categories for automation runs.';
 		COMMENT ON COLUMN scraper_categories.last_run_at IS 'Last run timestamp for the scheduler category.';
 		COMMENT ON TABLE articles IS 'Core article storage with metadata and content.';
 		COMMENT ON COLUMN articles.content IS 'JSONB array of structured content blocks.';
 		COMMENT ON COLUMN articles.metadata IS 'Source-specific metadata stored as JSONB.';
+		COMMENT ON COLUMN articles.content_hash IS 'SHA-256 of normalized title, content blocks and images; re-scrapes write only when it changes.';
+		COMMENT ON COLUMN articles.next_recrawl_at IS 'When the article is next due for a re-scrape; NULL once it has aged out of the recrawl window.';
+		COMMENT ON COLUMN articles.story_signature IS 'MinHash signature of normalized title and content, used for near-duplicate detection.';
+		COMMENT ON COLUMN articles.is_story_primary IS 'False for articles collapsed under another article of the same story cluster.';
+		COMMENT ON TABLE story_clusters IS 'Groups of near-duplicate articles covering the same story across sources.';
+		COMMENT ON TABLE story_lsh_buckets IS 'LSH band keys of recent article signatures; pruned once older than the match window.';
 		COMMENT ON TABLE article_images IS 'Images attached to each article.';
 		COMMENT ON COLUMN article_images.is_main_image IS 'Flag identifying the hero image.';
+		COMMENT ON TABLE image_assets IS 'Source images fetched once per normalized URL; derivatives live in the local content-addressed store.';
+		COMMENT ON COLUMN image_assets.content_hash IS 'SHA-256 of the source bytes; addresses derivatives at /api/images/<hash>/<variant>.<format>.';
 		COMMENT ON TABLE automation_history IS 'Audit trail for automation executions.';
 		COMMENT ON COLUMN automation_history.errors IS 'JSON array of error messages during automation.';
 
@@ -0,0 +1,202 @@
+import { supabaseAdmin } from '@/lib/db/supabase';
+import type { NewslistEntry, NewslistStatus } from '@/lib/types/database';
+
+/**
+ * Newslist repository
+ *
+ * newslist is tiered: the hot `newslist` table holds the working queue
+ * (pending/queued/processing/failed and recently extracted rows) while
+ * extracted rows are archived in batches to the month-partitioned
+ * `newslist_archive`. Discovery dedup and restores go through SQL functions
+ * so both tiers are checked in a single round trip.
+ */
+
+const NEWSLIST_TABLE = 'newslist';
+const NEWSLIST_ALL_VIEW = 'newslist_all';
+const NEWS_SOURCES_TABLE = 'news_sources';
+
+/** Statuses that only ever live in the hot tier */
+export const HOT_NEWSLIST_STATUSES: NewslistStatus[] = ['pending', 'queued', 'processing', 'failed'];
+
+const ENTRY_COLUMNS =
+  'id, source_id, source_article_id, url, status, attempt_count, last_processed_at, created_at, updated_at, error_log, meta, resolved_article_id';
+
+function ensureAdminClient() {
+  if (!supabaseAdmin) {
+    throw new Error('Supabase service role client is required for newslist operations.');
+  }
+  return supabaseAdmin;
+}
+
+export interface NewslistCandidate {
+  sourceArticleId: string;
+  url: string;
+  meta?: Record<string, unknown> | null;
+}
+
+/**
+ * Insert newly discovered URLs in one statement, skipping any already in either tier
+ */
+export async function enqueueNewslistEntries(
+  sourceId: string,
+  candidates: NewslistCandidate[]
+): Promise<{ inserted: number; duplicates: number }> {
+  if (candidates.length === 0) {
+    return { inserted: 0, duplicates: 0 };
+  }
+
+  const client = ensureAdminClient();
+  const { data, error } = await client
+    .rpc('enqueue_newslist_entries', {
+      p_source_id: sourceId,
+      p_entries: candidates.map((candidate) => ({
+        source_article_id: candidate.sourceArticleId,
+        url: candidate.url,
+        meta: candidate.meta ?? null,
+      })),
+    })
+    .single();
+
+  if (error) {
+    throw error;
+  }
+
+  const result = data as { inserted: number; duplicates: number } | null;
+  return { inserted: result?.inserted ?? 0, duplicates: result?.duplicates ?? candidates.length };
+}
+
+/**
+ * Move extracted rows older than minAgeHours to the cold tier
+ * Runs up to maxBatches batches so one call cannot hold locks for too long.
+ *
+ * @returns Number of rows archived
+ */
+export async function archiveExtractedNewslist(
+  batchSize: number = 5000,
+  minAgeHours: number = 24,
+  maxBatches: number = 10
+): Promise<number> {
+  const client = ensureAdminClient();
+  let archived = 0;
+
+  for (let batch = 0; batch < maxBatches; batch++) {
+    const { data, error } = await client.rpc('archive_extracted_newslist', {
+      p_batch_size: batchSize,
+      p_min_age: `${minAgeHours} hours`,
+    });
+
+    if (error) {
+      throw error;
+    }
+
+    const moved = (data as number | null) ?? 0;
+    archived += moved;
+    if (moved < batchSize) {
+      break;
+    }
+  }
+
+  return archived;
+}
+
+/**
+ * Bring archived rows back to the hot tier so they can be updated or reprocessed
+ * Pass either newslist ids or a source id with source article ids.
+ */
+export async function restoreArchivedNewslist(options: {
+  ids?: string[];
+  sourceId?: string;
+  sourceArticleIds?: string[];
+}): Promise<number> {
+  const client = ensureAdminClient();
+  const { data, error } = await client.rpc('restore_archived_newslist', {
+    p_ids: options.ids && options.ids.length > 0 ? options.ids : null,
+    p_source_id: options.sourceId ?? null,
+    p_source_article_ids: options.sourceArticleIds ?? null,
+  });
+
+  if (error) {
+    throw error;
+  }
+
+  return (data as number | null) ?? 0;
+}
+
+export interface NewslistListFilters {
+  status?: string | null;
+  sourceKey?: string | null;
+  category?: string | null;
+  search?: string | null;
+  from: number;
+  to: number;
+}
+
+/**
+ * List newslist entries for the admin screens
+ * Queue statuses are served from the hot table with exact counts; history
+ * listings (extracted / all) read the two-tier view with planner-estimated counts.
+ */
+export async function listNewslistEntries(
+  filters: NewslistListFilters
+): Promise<{ data: NewslistEntry[]; total: number }> {
+  const client = ensureAdminClient();
+  const hotOnly = Boolean(filters.status && HOT_NEWSLIST_STATUSES.includes(filters.status as NewslistStatus));
+
+  let sourceId: string | null = null;
+  if (filters.sourceKey) {
+    const { data: source } = await client
+      .from(NEWS_SOURCES_TABLE)
+      .select('id')
+      .eq('source_key', filters.sourceKey)
+      .maybeSingle();
+    if (!source?.id) {
+      return { data: [], total: 0 };
+    }
+    sourceId = source.id;
+  }
+
+  let query = client
+    .from(hotOnly ? NEWSLIST_TABLE : NEWSLIST_ALL_VIEW)
+    .select(ENTRY_COLUMNS, { count: hotOnly ? 'exact' : 'estimated' })
+    .order('created_at', { ascending: false })
+    .range(filters.from, filters.to);
+
+  if (filters.status) {
+    query = query.eq('status', filters.status);
+  }
+
+  if (sourceId) {
+    query = query.eq('source_id', sourceId);
+  }
+
+  if (filters.category) {
+    query = query.eq('meta->>category', filters.category);
+  }
+
+  if (filters.search) {
+    const ilikeValue = `%${filters.search}%`;
+    if (/^\d+$/.test(filters.search)) {
+      query = query.ilike('source_article_id', ilikeValue);
+    } else {
+      query = query.ilike('url', ilikeValue);
+    }
+  }
+
+  const { data, error, count } = await query;
+
+  if (error) {
+    throw error;
+  }
+
+  const rows = (data ?? []) as unknown as NewslistEntry[];
+
+  // The view cannot embed news_sources, so attach source names from the (tiny) sources table
+  const { data: sources } = await client.from(NEWS_SOURCES_TABLE).select('id, name, source_key');
+  const sourcesById = new Map((sources ?? []).map((source) => [source.id, source]));
+  const entries = rows.map((row) => {
+    const source = sourcesById.get(row.source_id);
+    return source ? { ...row, source: { name: source.name, source_key: source.source_key } } : row;
+  });
+
+  return { data: entries, total: count ?? entries.length };
+}
@@ -0,0 +1,177 @@
+import { supabaseAdmin } from '@/lib/db/supabase';
+import type { ScrapedArticle } from '@/lib/types/database';
+import {
+  STORY_SIMILARITY_THRESHOLD,
+  computeStorySignature,
+  estimateStorySimilarity,
+  getStoryBandKeys,
+} from '@/lib/utils/storySignature';
+
+/**
+ * Story cluster repository
+ *
+ * Each article's MinHash band keys are stored in `story_lsh_buckets`. A new
+ * article looks up only its own band keys (primary-key lookups, bounded by
+ * the match window), scores the few candidates it shares a bucket with, and
+ * joins the best cross-source match's cluster via `join_story_cluster`.
+ */
+
+const ARTICLES_TABLE = 'articles';
+const BUCKETS_TABLE = 'story_lsh_buckets';
+
+/** Only articles indexed within this window are considered as matches */
+export const STORY_MATCH_WINDOW_HOURS = 72;
+
+/** Upper bound on bucket rows read per lookup, keeps matching constant-time */
+const MAX_CANDIDATE_ROWS = 200;
+
+function ensureAdminClient() {
+  if (!supabaseAdmin) {
+    throw new Error('Supabase service role client is required for story cluster operations.');
+  }
+  return supabaseAdmin;
+}
+
+export interface StoryIndexResult {
+  clusterId: string | null;
+  matchedArticleId?: string;
+  similarity?: number;
+}
+
+interface IndexedArticle {
+  id: string;
+  source_id: string;
+  story_cluster_id?: string | null;
+}
+
+/**
+ * Store an article's signature and band keys, then attach it to the cluster
+ * of its most similar recent article from another source (if any).
+ * Articles already in a cluster keep their membership; only the index is refreshed.
+ */
+export async function indexArticleStory(
+  article: IndexedArticle,
+  scrapedArticle: Pick<ScrapedArticle, 'title' | 'content'>
+): Promise<StoryIndexResult> {
+  const client = ensureAdminClient();
+  const signature = computeStorySignature(scrapedArticle);
+
+  const { error: signatureError } = await client
+    .from(ARTICLES_TABLE)
+    .update({ story_signature: signature })
+    .eq('id', article.id);
+
+  if (signatureError) {
+    throw signatureError;
+  }
+
+  const { error: clearError } = await client.from(BUCKETS_TABLE).delete().eq('article_id', article.id);
+  if (clearError) {
+    throw clearError;
+  }
+
+  if (!signature) {
+    return { clusterId: article.story_cluster_id ?? null };
+  }
+
+  const bandKeys = getStoryBandKeys(signature);
+  const match = article.story_cluster_id ? null : await findBestMatch(article, signature, bandKeys);
+
+  const { error: bucketError } = await client
+    .from(BUCKETS_TABLE)
+    .insert(bandKeys.map((bandKey) => ({ band_key: bandKey, article_id: article.id })));
+
+  if (bucketError) {
+    throw bucketError;
+  }
+
+  if (!match) {
+    return { clusterId: article.story_cluster_id ?? null };
+  }
+
+  const { data: clusterId, error: joinError } = await client.rpc('join_story_cluster', {
+    p_article_id: article.id,
+    p_match_article_id: match.articleId,
+    p_similarity: match.similarity,
+  });
+
+  if (joinError) {
+    throw joinError;
+  }
+
+  return {
+    clusterId: (clusterId as string | null) ?? null,
+    matchedArticleId: match.articleId,
+    similarity: match.similarity,
+  };
+}
+
+async function findBestMatch(
+  article: IndexedArticle,
+  signature: number[],
+  bandKeys: string[]
+): Promise<{ articleId: string; similarity: number } | null> {
+  const client = ensureAdminClient();
+  const since = new Date(Date.now() - STORY_MATCH_WINDOW_HOURS * 60 * 60 * 1000).toISOString();
+
+  const { data: bucketRows, error } = await client
+    .from(BUCKETS_TABLE)
+    .select('article_id')
+    .in('band_key', bandKeys)
+    .gte('created_at', since)
+    .neq('article_id', article.id)
+    .order('created_at', { ascending: false })
+    .limit(MAX_CANDIDATE_ROWS);
+
+  if (error) {
+    throw error;
+  }
+
+  const candidateIds = Array.from(new Set((bucketRows ?? []).map((row) => row.article_id as string)));
+  if (candidateIds.length === 0) {
+    return null;
+  }
+
+  const { data: candidates, error: candidateError } = await client
+    .from(ARTICLES_TABLE)
+    .select('id, source_id, story_signature')
+    .in('id', candidateIds)
+    .neq('source_id', article.source_id);
+
+  if (candidateError) {
+    throw candidateError;
+  }
+
+  let best: { articleId: string; similarity: number } | null = null;
+  for (const candidate of candidates ?? []) {
+    const candidateSignature = candidate.story_signature as number[] | null;
+    if (!candidateSignature) continue;
+    const similarity = estimateStorySimilarity(signature, candidateSignature);
+    if (similarity >= STORY_SIMILARITY_THRESHOLD && (!best || similarity > best.similarity)) {
+      best = { articleId: candidate.id, similarity };
+    }
+  }
+
+  return best;
+}
+
+/**
+ * Drop bucket rows older than the match window; they can no longer produce matches
+ *
+ * @returns Number of rows removed
+ */
+export async function pruneStoryBuckets(maxAgeHours: number = STORY_MATCH_WINDOW_HOURS): Promise<number> {
+  const client = ensureAdminClient();
+  const cutoff = new Date(Date.now() - maxAgeHours * 60 * 60 * 1000).toISOString();
+
+  const { count, error } = await client
+    .from(BUCKETS_TABLE)
+    .delete({ count: 'exact' })
+    .lt('created_at', cutoff);
+
+  if (error) {
+    throw error;
+  }
+
+  return count ?? 0;
+}
@@ -0,0 +1,174 @@
+import fs from 'fs';
+import path from 'path';
+import * as cheerio from 'cheerio';
+import {
+  createNetworkStats,
+  evaluateNetworkRequest,
+  formatNetworkStats,
+  recordNetworkVerdict,
+  type NetworkVerdict,
+} from '../networkPolicy.js';
+import { getNetworkPolicy } from '../../constants/sourceRegistry.js';
+
+/**
+ * Test the per-source network policies against the requests real article pages make
+ * Run with: npx tsx lib/scrapers/__tests__/networkPolicy.test.ts
+ *
+ * Every resource referenced by a saved page is run through its source's policy.
+ * The resources the article render depends on (framework bundles, the page's
+ * own scripts) must be allowed, ad/analytics loaders that first-party code
+ * calls must be stubbed, and tracker networks must never be fetched.
+ */
+
+type RequiredResource = { label: string; type: string; pattern: RegExp };
+
+const fixtures: Array<{ file: string; sourceKey: string; pageUrl: string; required: RequiredResource[] }> = [
+  {
+    file: 'Article1Sourcecode.txt',
+    sourceKey: 'hk01',
+    pageUrl: 'https://www.hk01.com/',
+    required: [
+      { label: 'Next.js runtime', type: 'script', pattern: /\/_next\/static\/chunks\/(webpack|framework|main)-/ },
+      // Mounts the lazy in-article images the scraper reads
+      { label: 'article page bundle', type: 'script', pattern: /\/_next\/static\/chunks\/pages\/article-/ },
+    ],
+  },
+  {
+    file: 'Article3SourceCode.txt',
+    sourceKey: 'hk01',
+    pageUrl: 'https://www.hk01.com/',
+    required: [
+      { label: 'Next.js runtime', type: 'script', pattern: /\/_next\/static\/chunks\/(webpack|framework|main)-/ },
+      { label: 'article page bundle', type: 'script', pattern: /\/_next\/static\/chunks\/pages\/article-/ },
+    ],
+  },
+  {
+    file: 'MingPao1Sourcecode.txt',
+    sourceKey: 'mingpao',
+    pageUrl: 'https://news.mingpao.com/',
+    required: [
+      { label: 'jQuery', type: 'script', pattern: /\/js\/vendor\/jquery-[\d.]+(\.min)?\.js/ },
+      { label: 'cookie consent (cdnjs)', type: 'script', pattern: /^https:\/\/cdnjs\.cloudflare\.com\/.*cookieconsent/ },
+    ],
+  },
+];
+
+// Element -> resource type of the request the browser makes for it
+const RESOURCE_ELEMENTS = [
+  { selector: 'script[src]', attr: 'src', type: 'script' },
+  { selector: 'iframe[src]', attr: 'src', type: 'document' },
+  { selector: 'link[rel="stylesheet"][href]', attr: 'href', type: 'stylesheet' },
+  { selector: 'img[src]', attr: 'src', type: 'image' },
+  { selector: 'video[src], source[src]', attr: 'src', type: 'media' },
+];
+
+// Loaders whose globals first-party code calls directly: blocking them breaks the page
+const STUBBED_LOADERS = [
+  { label: 'GPT', pattern: /^https:\/\/securepubads\.g\.doubleclick\.net\/tag\/js\/gpt\.js/ },
+  { label: 'Google Tag Manager', pattern: /^https:\/\/www\.googletagmanager\.com\// },
+];
+
+// Ad / analytics networks that must never be fetched
+const TRACKER_HOSTS = [
+  'doubleclick.net',
+  'googlesyndication.com',
+  'googletagmanager.com',
+  'google-analytics.com',
+  'facebook.net',
+  'rubiconproject.com',
+  'adnxs.com',
+  'taboola.com',
+  'teads.tv',
+];
+
+type PageRequest = { url: URL; type: string; verdict: NetworkVerdict };
+
+function collectPageRequests(html: string, pageUrl: string, sourceKey: string): PageRequest[] {
+  const policy = getNetworkPolicy(sourceKey);
+  const $ = cheerio.load(html);
+  const requests: PageRequest[] = [];
+
+  for (const { selector, attr, type } of RESOURCE_ELEMENTS) {
+    $(selector).each((_, elem) => {
+      const raw = $(elem).attr(attr) || '';
+      let url: URL;
+      try {
+        url = new URL(raw, pageUrl);
+      } catch {
+        return;
+      }
+      requests.push({ url, type, verdict: evaluateNetworkRequest(policy, { url: url.href, resourceType: type }) });
+    });
+  }
+
+  return requests;
+}
+
+function testFixture(fixture: (typeof fixtures)[number]): boolean {
+  const html = fs.readFileSync(path.join(process.cwd(), '..', 'SampleDate', fixture.file), 'utf-8');
+  const requests = collectPageRequests(html, fixture.pageUrl, fixture.sourceKey);
+  const pageHost = new URL(fixture.pageUrl).hostname;
+  const stats = createNetworkStats();
+  const failures: string[] = [];
+
+  for (const { url, type, verdict } of requests) {
+    recordNetworkVerdict(stats, verdict, type);
+
+    const isTracker = TRACKER_HOSTS.some((host) => url.hostname === host || url.hostname.endsWith(`.${host}`));
+    if (isTracker && verdict.decision === 'allow') {
+      failures.push(`tracker allowed: ${url.hostname}${url.pathname}`);
+    }
+
+    // The page's own scripts build the DOM the scraper reads
+    if (type === 'script' && url.hostname === pageHost && verdict.decision !== 'allow') {
+      failures.push(`first-party script ${verdict.decision}ed (${verdict.reason}): ${url.pathname}`);
+    }
+  }
+
+  for (const required of fixture.required) {
+    const matches = requests.filter(({ url, type }) => type === required.type && required.pattern.test(url.href));
+    if (matches.length === 0) {
+      failures.push(`fixture no longer references ${required.label}`);
+    }
+    matches
+      .filter(({ verdict }) => verdict.decision !== 'allow')
+      .forEach(({ url, verdict }) => failures.push(`${required.label} ${verdict.decision}ed (${verdict.reason}): ${url.href}`));
+  }
+
+  for (const loader of STUBBED_LOADERS) {
+    requests
+      .filter(({ url, type }) => type === 'script' && loader.pattern.test(url.href))
+      .filter(({ verdict }) => verdict.decision !== 'stub')
+      .forEach(({ url, verdict }) => failures.push(`${loader.label} not stubbed (${verdict.decision}): ${url.href}`));
+  }
+
+  if (stats.blockedRequests === 0) {
+    failures.push('policy blocked nothing');
+  }
+
+  const icon = failures.length === 0 ? '✅' : '❌';
+  console.log(`${icon} ${fixture.file} (${fixture.sourceKey}): ${formatNetworkStats(stats)}`);
+  console.log(`   blocked by reason: ${JSON.stringify(stats.blockedByReason)}`);
+  failures.forEach((failure) => console.log(`   - ${failure}`));
+
+  return failures.length === 0;
+}
+
+function testNetworkPolicies() {
+  console.log('🧪 Testing network policies against fixture pages...\n');
+
+  let passed = 0;
+  for (const fixture of fixtures) {
+    if (testFixture(fixture)) {
+      passed++;
+    }
+  }
+
+  console.log(`\n${passed}/${fixtures.length} fixtures passed`);
+  if (passed !== fixtures.length) {
+    process.exitCode = 1;
+  }
+}
+
+// Run test
+testNetworkPolicies();
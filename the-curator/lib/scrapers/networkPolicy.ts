@@ -0,0 +1,216 @@
+/**
+ * Network Policy Engine
+ *
+ * Applies a source's declarative SourceNetworkPolicy (see sourceRegistry) to a
+ * headless page: every request is allowed, blocked or answered with a stub,
+ * and per-render counters record what was fetched.
+ *
+ * Decision order:
+ * 1. non-http(s) URLs and the main document are always allowed
+ * 2. blockedDomains -> block
+ * 3. stubbedScripts -> respond with the stub body
+ * 4. blockedResourceTypes -> block
+ * 5. allowedHosts (empty = any host) -> allow, otherwise block as third-party
+ */
+
+import type { HTTPRequest, Page } from 'puppeteer-core';
+import type { SourceNetworkPolicy } from '@/lib/types/database';
+
+export type NetworkDecision = 'allow' | 'block' | 'stub';
+
+export type NetworkDecisionReason =
+  | 'non-http'
+  | 'main-document'
+  | 'blocked-domain'
+  | 'stubbed-script'
+  | 'blocked-type'
+  | 'first-party'
+  | 'third-party';
+
+export interface NetworkRequestInfo {
+  url: string;
+  resourceType: string;
+  isMainDocument?: boolean;
+}
+
+export interface NetworkVerdict {
+  decision: NetworkDecision;
+  reason: NetworkDecisionReason;
+  stubBody?: string;
+}
+
+export interface NetworkStats {
+  allowedRequests: number;
+  blockedRequests: number;
+  stubbedRequests: number;
+  allowedBytes: number; // Encoded bytes received for allowed requests
+  stubbedBytes: number; // Bytes served from stubs instead of the network
+  blockedByReason: Record<string, number>;
+  blockedByType: Record<string, number>;
+}
+
+const READY_TIMEOUT_MS = 5000;
+const LAZY_MOUNT_TIMEOUT_MS = 3000;
+
+function hostMatches(hostname: string, patterns: string[] | undefined): boolean {
+  return (patterns ?? []).some((pattern) => hostname === pattern || hostname.endsWith(`.${pattern}`));
+}
+
+/**
+ * Pure decision function; shared by the page interceptor and the fixture tests
+ */
+export function evaluateNetworkRequest(policy: SourceNetworkPolicy, request: NetworkRequestInfo): NetworkVerdict {
+  let parsed: URL;
+  try {
+    parsed = new URL(request.url);
+  } catch {
+    return { decision: 'allow', reason: 'non-http' };
+  }
+
+  if (parsed.protocol !== 'http:' && parsed.protocol !== 'https:') {
+    return { decision: 'allow', reason: 'non-http' };
+  }
+
+  if (request.isMainDocument) {
+    return { decision: 'allow', reason: 'main-document' };
+  }
+
+  const hostname = parsed.hostname.toLowerCase();
+
+  if (hostMatches(hostname, policy.blockedDomains)) {
+    return { decision: 'block', reason: 'blocked-domain' };
+  }
+
+  if (request.resourceType === 'script') {
+    const stub = policy.stubbedScripts?.find(
+      (candidate) =>
+        hostMatches(hostname, [candidate.host]) &&
+        (!candidate.pathPrefix || parsed.pathname.startsWith(candidate.pathPrefix))
+    );
+    if (stub) {
+      return { decision: 'stub', reason: 'stubbed-script', stubBody: stub.body };
+    }
+  }
+
+  if (policy.blockedResourceTypes.includes(request.resourceType)) {
+    return { decision: 'block', reason: 'blocked-type' };
+  }
+
+  if (policy.allowedHosts.length === 0 || hostMatches(hostname, policy.allowedHosts)) {
+    return { decision: 'allow', reason: 'first-party' };
+  }
+
+  return { decision: 'block', reason: 'third-party' };
+}
+
+export function createNetworkStats(): NetworkStats {
+  return {
+    allowedRequests: 0,
+    blockedRequests: 0,
+    stubbedRequests: 0,
+    allowedBytes: 0,
+    stubbedBytes: 0,
+    blockedByReason: {},
+    blockedByType: {},
+  };
+}
+
+export function recordNetworkVerdict(stats: NetworkStats, verdict: NetworkVerdict, resourceType: string) {
+  if (verdict.decision === 'allow') {
+    stats.allowedRequests++;
+  } else if (verdict.decision === 'stub') {
+    stats.stubbedRequests++;
+    stats.stubbedBytes += Buffer.byteLength(verdict.stubBody ?? '');
+  } else {
+    stats.blockedRequests++;
+    stats.blockedByReason[verdict.reason] = (stats.blockedByReason[verdict.reason] ?? 0) + 1;
+    stats.blockedByType[resourceType] = (stats.blockedByType[resourceType] ?? 0) + 1;
+  }
+}
+
+/**
+ * Enable request interception on a fresh page and enforce the policy
+ * The returned stats object keeps updating until the page is closed.
+ */
+export async function applyNetworkPolicy(page: Page, policy: SourceNetworkPolicy): Promise<NetworkStats> {
+  const stats = createNetworkStats();
+
+  await page.setRequestInterception(true);
+  page.on('request', (request: HTTPRequest) => {
+    if (request.isInterceptResolutionHandled()) {
+      return;
+    }
+
+    const resourceType = request.resourceType();
+    const verdict = evaluateNetworkRequest(policy, {
+      url: request.url(),
+      resourceType,
+      isMainDocument: request.isNavigationRequest() && request.frame() === page.mainFrame(),
+    });
+    recordNetworkVerdict(stats, verdict, resourceType);
+
+    if (verdict.decision === 'allow') {
+      request.continue();
+    } else if (verdict.decision === 'stub') {
+      request.respond({ status: 200, contentType: 'application/javascript', body: verdict.stubBody ?? '' });
+    } else {
+      request.abort('blockedbyclient');
+    }
+  });
+
+  // Transfer sizes are only exposed through the DevTools protocol
+  const session = await page.createCDPSession();
+  await session.send('Network.enable');
+  session.on('Network.loadingFinished', (event) => {
+    stats.allowedBytes += event.encodedDataLength;
+  });
+
+  return stats;
+}
+
+/**
+ * Wait until the article content the scraper reads is in the DOM
+ * Replaces the fixed full-page scroll + sleep: only the source's lazy image
+ * wrappers are scrolled into view, and image bytes stay blocked by the policy.
+ */
+export async function waitForArticleRender(page: Page, policy: SourceNetworkPolicy): Promise<void> {
+  if (policy.readySelector) {
+    await page.waitForSelector(policy.readySelector, { timeout: READY_TIMEOUT_MS }).catch(() => {
+      /* continue even if selector missing */
+    });
+  }
+
+  if (!policy.lazyMount) {
+    return;
+  }
+
+  const { wrapperSelector, placeholderSelector } = policy.lazyMount;
+  await page.evaluate(
+    async (wrappers: string, placeholder: string) => {
+      for (const wrapper of Array.from(document.querySelectorAll(wrappers))) {
+        if (!wrapper.querySelector(placeholder)) continue;
+        wrapper.scrollIntoView({ block: 'center' });
+        await new Promise((resolve) => requestAnimationFrame(() => resolve(null)));
+      }
+    },
+    wrapperSelector,
+    placeholderSelector
+  );
+
+  await page
+    .waitForFunction(
+      (wrappers: string, placeholder: string) =>
+        Array.from(document.querySelectorAll(wrappers)).every((wrapper) => !wrapper.querySelector(placeholder)),
+      { timeout: LAZY_MOUNT_TIMEOUT_MS },
+      wrapperSelector,
+      placeholderSelector
+    )
+    .catch(() => {
+      /* scrape whatever has mounted */
+    });
+}
+
+export function formatNetworkStats(stats: NetworkStats): string {
+  const kb = (bytes: number) => `${(bytes / 1024).toFixed(1)}KB`;
+  return `allowed=${stats.allowedRequests} (${kb(stats.allowedBytes)}) stubbed=${stats.stubbedRequests} blocked=${stats.blockedRequests}`;
+}
@@ -0,0 +1,56 @@
+/**
+ * Recrawl Policy
+ *
+ * Decides when an already-imported article should be scraped again to pick up
+ * corrections. Fresh articles are revisited often; the interval grows
+ * geometrically with every unchanged visit and stops once the article is old.
+ */
+
+const HOUR_MS = 60 * 60 * 1000;
+
+export const RECRAWL_BASE_INTERVAL_MS = 1 * HOUR_MS;
+export const RECRAWL_BACKOFF_FACTOR = 3;
+export const RECRAWL_MAX_INTERVAL_MS = 48 * HOUR_MS;
+export const RECRAWL_MAX_AGE_MS = 7 * 24 * HOUR_MS;
+// How long a requeued article stays off the due list while its entry is processed
+export const RECRAWL_LEASE_MS = 6 * HOUR_MS;
+
+/**
+ * Compute the next recrawl timestamp for an article
+ *
+ * @param referenceDate - Latest of the source's published/updated date (ISO string)
+ * @param recrawlCount - Number of consecutive visits that found no change
+ * @param now - Current time (injectable for tests)
+ * @returns ISO timestamp, or null when the article should no longer be revisited
+ */
+export function computeNextRecrawlAt(
+  referenceDate: string | null | undefined,
+  recrawlCount: number,
+  now: Date = new Date()
+): string | null {
+  const reference = referenceDate ? new Date(referenceDate).getTime() : now.getTime();
+  const referenceMs = Number.isNaN(reference) ? now.getTime() : reference;
+
+  const interval = Math.min(
+    RECRAWL_MAX_INTERVAL_MS,
+    RECRAWL_BASE_INTERVAL_MS * Math.pow(RECRAWL_BACKOFF_FACTOR, Math.max(0, recrawlCount))
+  );
+  const next = now.getTime() + interval;
+
+  if (next - referenceMs > RECRAWL_MAX_AGE_MS) {
+    return null;
+  }
+
+  return new Date(next).toISOString();
+}
+
+/**
+ * Pick the date the recrawl schedule decays from: the source's last update
+ * when known, otherwise its publish date.
+ */
+export function getRecrawlReferenceDate(
+  publishedDate?: string | null,
+  updatedDate?: string | null
+): string | null {
+  return updatedDate || publishedDate || null;
+}
@@ -0,0 +1,333 @@
+/**
+ * Image Derivative Pipeline
+ *
+ * Fetches each source image once (deduplicated by normalized URL), stores
+ * AVIF/WebP derivatives in a content-addressed store and records the
+ * original dimensions so pages can reserve layout space.
+ *
+ * Store: the public Supabase Storage bucket NEXT_PUBLIC_IMAGE_STORAGE_BUCKET
+ * when set (required with more than one instance or a read-only filesystem),
+ * otherwise local disk under IMAGE_STORE_DIR.
+ * Layout: <hash[0:2]>/<hash>/<variant>.<format>
+ */
+
+import { createHash } from 'crypto';
+import { promises as fs } from 'fs';
+import path from 'path';
+import sharp from 'sharp';
+import { supabase, supabaseAdmin } from '@/lib/db/supabase';
+import { invalidateArticleCache } from '@/lib/services/newsCache';
+import {
+  IMAGE_FORMATS,
+  IMAGE_VARIANTS,
+  getDerivativeKey,
+  getImageStorageBucket,
+  normalizeImageUrl,
+  type ImageFormat,
+  type ImageVariant,
+} from '@/lib/utils/imageUrl';
+
+const dbClient = supabaseAdmin ?? supabase;
+
+const ASSETS_TABLE = 'image_assets';
+const USER_AGENT =
+  'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/117.0.0.0 Safari/537.36';
+const FETCH_TIMEOUT_MS = 15000;
+const MAX_SOURCE_BYTES = 20 * 1024 * 1024;
+const MAX_ATTEMPTS = 3;
+
+const CONTENT_HASH_PATTERN = /^[a-f0-9]{64}$/;
+
+export function getImageStoreDir(): string {
+  return process.env.IMAGE_STORE_DIR || path.join(process.cwd(), 'storage', 'images');
+}
+
+/**
+ * Absolute path of a derivative file, or null if the hash is malformed
+ */
+export function getDerivativePath(contentHash: string, variant: ImageVariant, format: ImageFormat): string | null {
+  if (!CONTENT_HASH_PATTERN.test(contentHash)) {
+    return null;
+  }
+  return path.join(getImageStoreDir(), ...getDerivativeKey(contentHash, variant, format).split('/'));
+}
+
+interface ImageAssetRecord {
+  id: string;
+  normalized_url: string;
+  content_hash: string | null;
+  width: number | null;
+  height: number | null;
+  status: 'pending' | 'ready' | 'failed';
+  attempt_count: number;
+}
+
+async function fetchImageBuffer(url: string): Promise<Buffer> {
+  const controller = new AbortController();
+  const timer = setTimeout(() => controller.abort(), FETCH_TIMEOUT_MS);
+  try {
+    const response = await fetch(url, {
+      headers: { 'User-Agent': USER_AGENT, Accept: 'image/avif,image/webp,image/*,*/*;q=0.8' },
+      cache: 'no-store',
+      signal: controller.signal,
+    });
+    if (!response.ok) {
+      throw new Error(`Image fetch failed with status ${response.status}`);
+    }
+    const declaredLength = Number(response.headers.get('content-length') || 0);
+    if (declaredLength > MAX_SOURCE_BYTES) {
+      throw new Error(`Image too large (${declaredLength} bytes)`);
+    }
+    const buffer = Buffer.from(await response.arrayBuffer());
+    if (buffer.length > MAX_SOURCE_BYTES) {
+      throw new Error(`Image too large (${buffer.length} bytes)`);
+    }
+    return buffer;
+  } finally {
+    clearTimeout(timer);
+  }
+}
+
+async function fileExists(filePath: string): Promise<boolean> {
+  try {
+    await fs.access(filePath);
+    return true;
+  } catch {
+    return false;
+  }
+}
+
+async function encodeDerivative(buffer: Buffer, variant: ImageVariant, format: ImageFormat): Promise<Buffer> {
+  const pipeline = sharp(buffer).rotate().resize({ width: IMAGE_VARIANTS[variant], withoutEnlargement: true });
+  return format === 'avif'
+    ? pipeline.avif({ quality: 50 }).toBuffer()
+    : pipeline.webp({ quality: 72 }).toBuffer();
+}
+
+/**
+ * Upload every variant/format of an image to the storage bucket
+ * Keys are content-addressed, so an object that already exists is left as is.
+ */
+async function uploadDerivatives(bucket: string, buffer: Buffer, contentHash: string): Promise<void> {
+  const storage = dbClient.storage.from(bucket);
+  for (const variant of Object.keys(IMAGE_VARIANTS) as ImageVariant[]) {
+    for (const format of IMAGE_FORMATS) {
+      const output = await encodeDerivative(buffer, variant, format);
+      const { error } = await storage.upload(getDerivativeKey(contentHash, variant, format), output, {
+        contentType: `image/${format}`,
+        cacheControl: '31536000',
+        upsert: false,
+      });
+      if (error && !/already exists|duplicate/i.test(error.message)) {
+        throw new Error(`Failed to upload image derivative: ${error.message}`);
+      }
+    }
+  }
+}
+
+/**
+ * Write every variant/format of an image into the local store
+ * Files are content-addressed, so existing files are never rewritten.
+ */
+async function writeLocalDerivatives(buffer: Buffer, contentHash: string): Promise<void> {
+  for (const variant of Object.keys(IMAGE_VARIANTS) as ImageVariant[]) {
+    for (const format of IMAGE_FORMATS) {
+      const target = getDerivativePath(contentHash, variant, format)!;
+      if (await fileExists(target)) continue;
+
+      await fs.mkdir(path.dirname(target), { recursive: true });
+      const output = await encodeDerivative(buffer, variant, format);
+
+      // Write to a temp file first so a crashed worker never leaves a truncated derivative
+      const tempPath = `${target}.${process.pid}.tmp`;
+      await fs.writeFile(tempPath, output);
+      await fs.rename(tempPath, target);
+    }
+  }
+}
+
+async function writeDerivatives(buffer: Buffer, contentHash: string): Promise<void> {
+  const bucket = getImageStorageBucket();
+  if (bucket) {
+    await uploadDerivatives(bucket, buffer, contentHash);
+  } else {
+    await writeLocalDerivatives(buffer, contentHash);
+  }
+}
+
+/**
+ * Resolve a normalized URL to a ready image asset, fetching and deriving it if needed
+ * Returns the asset row (ready or failed) so callers can link to it either way.
+ */
+async function resolveImageAsset(normalizedUrl: string): Promise<ImageAssetRecord | null> {
+  const { data: existing, error } = await dbClient
+    .from(ASSETS_TABLE)
+    .select('id, normalized_url, content_hash, width, height, status, attempt_count')
+    .eq('normalized_url', normalizedUrl)
+    .maybeSingle();
+
+  if (error) {
+    throw new Error(`Failed to load image asset: ${error.message}`);
+  }
+
+  const asset = existing as ImageAssetRecord | null;
+  if (asset && (asset.status === 'ready' || asset.attempt_count >= MAX_ATTEMPTS)) {
+    return asset;
+  }
+
+  const attemptCount = (asset?.attempt_count ?? 0) + 1;
+  let row: Record<string, unknown>;
+
+  try {
+    const buffer = await fetchImageBuffer(normalizedUrl);
+    const contentHash = createHash('sha256').update(buffer).digest('hex');
+    const metadata = await sharp(buffer).rotate().metadata();
+    await writeDerivatives(buffer, contentHash);
+
+    // rotate() applies EXIF orientation, so swap dimensions for rotated sources
+    const rotated = (metadata.orientation ?? 1) >= 5;
+    row = {
+      normalized_url: normalizedUrl,
+      content_hash: contentHash,
+      width: (rotated ? metadata.height : metadata.width) ?? null,
+      height: (rotated ? metadata.width : metadata.height) ?? null,
+      byte_size: buffer.length,
+      mime_type: metadata.format ? `image/${metadata.format}` : null,
+      derivatives: { variants: IMAGE_VARIANTS, formats: IMAGE_FORMATS },
+      status: 'ready',
+      error_log: null,
+      attempt_count: attemptCount,
+      fetched_at: new Date().toISOString(),
+    };
+  } catch (err) {
+    const message = err instanceof Error ? err.message : String(err);
+    console.warn('[ImageDerivatives] Failed to process', normalizedUrl, message);
+    row = {
+      normalized_url: normalizedUrl,
+      status: 'failed',
+      error_log: message,
+      attempt_count: attemptCount,
+    };
+  }
+
+  const { data: saved, error: saveError } = await dbClient
+    .from(ASSETS_TABLE)
+    .upsert(row, { onConflict: 'normalized_url' })
+    .select('id, normalized_url, content_hash, width, height, status, attempt_count')
+    .single();
+
+  if (saveError) {
+    throw new Error(`Failed to save image asset: ${saveError.message}`);
+  }
+
+  return saved as ImageAssetRecord;
+}
+
+/**
+ * Process images that have no derivative asset yet
+ * Covers both article_images rows and articles.main_image_url.
+ *
+ * @param limit - Maximum number of rows of each kind to process
+ */
+export async function processPendingImages(limit: number = 20): Promise<{
+  assetsResolved: number;
+  imagesLinked: number;
+  mainImagesLinked: number;
+  failed: number;
+}> {
+  const [{ data: images, error: imagesError }, { data: articles, error: articlesError }] = await Promise.all([
+    dbClient
+      .from('article_images')
+      .select('id, article_id, image_url')
+      .is('asset_id', null)
+      .order('created_at', { ascending: true })
+      .limit(limit),
+    dbClient
+      .from('articles')
+      .select('id, main_image_url')
+      .not('main_image_url', 'is', null)
+      .is('main_image_asset_id', null)
+      .order('created_at', { ascending: false })
+      .limit(limit),
+  ]);
+
+  if (imagesError) {
+    throw new Error(`Failed to load pending article images: ${imagesError.message}`);
+  }
+  if (articlesError) {
+    throw new Error(`Failed to load pending main images: ${articlesError.message}`);
+  }
+
+  // Resolve each distinct normalized URL exactly once per batch
+  const assetsByUrl = new Map<string, ImageAssetRecord | null>();
+  const resolve = async (rawUrl: string) => {
+    // Unparseable URLs are kept verbatim so they fail (and get linked) instead of blocking the queue
+    const normalized = normalizeImageUrl(rawUrl) ?? rawUrl.trim();
+    if (!normalized) return null;
+    if (!assetsByUrl.has(normalized)) {
+      assetsByUrl.set(normalized, await resolveImageAsset(normalized));
+    }
+    return assetsByUrl.get(normalized) ?? null;
+  };
+
+  let imagesLinked = 0;
+  let mainImagesLinked = 0;
+  let failed = 0;
+  const touchedArticleIds = new Set<string>();
+
+  for (const image of images || []) {
+    const asset = await resolve(image.image_url);
+    if (!asset) {
+      failed++;
+      continue;
+    }
+    if (asset.status !== 'ready') {
+      failed++;
+      if (asset.attempt_count < MAX_ATTEMPTS) continue;
+    }
+    const { error } = await dbClient
+      .from('article_images')
+      .update({ asset_id: asset.id, width: asset.width, height: asset.height })
+      .eq('id', image.id);
+    if (error) {
+      console.warn('[ImageDerivatives] Failed to link article image', image.id, error.message);
+    } else {
+      imagesLinked++;
+      touchedArticleIds.add(image.article_id);
+    }
+  }
+
+  for (const article of articles || []) {
+    const asset = await resolve(article.main_image_url);
+    if (!asset) {
+      failed++;
+      continue;
+    }
+    if (asset.status !== 'ready') {
+      failed++;
+      if (asset.attempt_count < MAX_ATTEMPTS) continue;
+    }
+    const { error } = await dbClient
+      .from('articles')
+      .update({ main_image_asset_id: asset.id })
+      .eq('id', article.id);
+    if (error) {
+      console.warn('[ImageDerivatives] Failed to link main image', article.id, error.message);
+    } else {
+      mainImagesLinked++;
+      touchedArticleIds.add(article.id);
+    }
+  }
+
+  // Pages switch from the source URL to the derivatives
+  if (touchedArticleIds.size > 0) {
+    invalidateArticleCache(Array.from(touchedArticleIds));
+  }
+
+  return {
+    assetsResolved: assetsByUrl.size,
+    imagesLinked,
+    mainImagesLinked,
+    failed,
+  };
+}
@@ -0,0 +1,296 @@
+/**
+ * Public News Cache
+ *
+ * Read-through cache for the public news pages, built on the Next.js data
+ * cache. Entries are keyed by article id and by list-query shape and are
+ * invalidated by tag whenever an article is written (import, admin edit,
+ * image linking), so freshness follows writes instead of a timer.
+ *
+ * Tags:
+ * - news:article:<id>  one article's detail payload
+ * - news:list          every list page (any filter combination)
+ * - news:facets        category / source filter options
+ */
+
+import { createHash } from 'crypto';
+import { revalidateTag, unstable_cache } from 'next/cache';
+import { supabase } from '@/lib/db/supabase';
+
+export const NEWS_LIST_TAG = 'news:list';
+export const NEWS_FACETS_TAG = 'news:facets';
+
+export function articleCacheTag(articleId: string): string {
+  return `news:article:${articleId}`;
+}
+
+/** Safety net for writes made outside the app (SQL console, resets) */
+export const NEWS_CACHE_MAX_AGE_SECONDS = 24 * 60 * 60;
+
+/** Browsers revalidate with the ETag; shared caches may serve briefly stale copies */
+export const NEWS_LIST_CACHE_CONTROL = 'public, max-age=0, s-maxage=30, stale-while-revalidate=300';
+
+export const MAX_NEWS_PAGE_SIZE = 24;
+
+const LIST_COLUMNS =
+  'id, title, excerpt, category, sub_category, published_date, main_image_url, tags, source_id, source_article_id, main_image_asset:image_assets!main_image_asset_id(content_hash, width, height), story_cluster:story_clusters!story_cluster_id(id, article_count, source_count)';
+
+const DETAIL_COLUMNS = `id, title, author, category, sub_category, published_date, updated_date,
+       main_image_url, main_image_caption, content, excerpt, tags,
+       main_image_asset:image_assets!main_image_asset_id ( content_hash, width, height ),
+       article_images ( image_url, caption, is_main_image, width, height, asset:image_assets ( content_hash, width, height ) )`;
+
+export interface NewsListQuery {
+  page: number;
+  limit: number;
+  search?: string | null;
+  category?: string | null;
+  subCategory?: string | null;
+  tag?: string | null;
+  dateFrom?: string | null;
+  dateTo?: string | null;
+  sourceKey?: string | null;
+  collapse: boolean;
+}
+
+export interface NewsFacets {
+  categories: string[];
+  subCategoriesByCategory: Record<string, string[]>;
+  sources: Array<{ key: string; name: string }>;
+}
+
+/**
+ * Parse list query-string parameters into a normalized query
+ * Equivalent requests map to the same shape, and therefore the same cache entry.
+ */
+export function parseNewsListQuery(searchParams: URLSearchParams): NewsListQuery {
+  const page = Math.max(1, parseInt(searchParams.get('page') || '1', 10) || 1);
+  const limitRaw = parseInt(searchParams.get('limit') || '12', 10);
+  const limit = Math.min(MAX_NEWS_PAGE_SIZE, Math.max(6, Number.isNaN(limitRaw) ? 12 : limitRaw));
+  const text = (key: string) => searchParams.get(key)?.trim() || null;
+  const filters = {
+    search: text('search'),
+    category: text('category'),
+    subCategory: text('subCategory'),
+    tag: text('tag'),
+    dateFrom: text('dateFrom'),
+    dateTo: text('dateTo'),
+    sourceKey: text('source'),
+  };
+
+  return {
+    page,
+    limit,
+    ...filters,
+    // Near-duplicate copies of a story are collapsed under one article unless ?collapse=false.
+    // A filter can exclude the cluster's representative (e.g. ?source=mingpao when it is an
+    // HK01 article), which would hide the whole story, so filtered lists are never collapsed.
+    collapse: searchParams.get('collapse') !== 'false' && Object.values(filters).every((value) => !value),
+  };
+}
+
+function listCacheKey(query: NewsListQuery): string {
+  const ordered = Object.keys(query)
+    .sort()
+    .map((key) => [key, query[key as keyof NewsListQuery] ?? null]);
+  return JSON.stringify(ordered);
+}
+
+async function queryNewsList(query: NewsListQuery): Promise<{ data: unknown[]; total: number }> {
+  const offset = (query.page - 1) * query.limit;
+
+  let request = supabase
+    .from('articles')
+    .select(LIST_COLUMNS, { count: 'exact' })
+    .eq('scrape_status', 'success')
+    .order('published_date', { ascending: false })
+    .range(offset, offset + query.limit - 1);
+
+  if (query.collapse) {
+    request = request.eq('is_story_primary', true);
+  }
+
+  if (query.search) {
+    request = request.ilike('title', `%${query.search}%`);
+  }
+
+  if (query.category) {
+    request = request.eq('category', query.category);
+  }
+
+  if (query.subCategory) {
+    request = request.eq('sub_category', query.subCategory);
+  }
+
+  if (query.tag) {
+    request = request.ilike('tags', `%${query.tag}%`);
+  }
+
+  if (query.dateFrom) {
+    request = request.gte('published_date', query.dateFrom);
+  }
+
+  if (query.dateTo) {
+    // Add 1 day to include the entire dateTo day
+    const dateToEnd = new Date(query.dateTo);
+    dateToEnd.setDate(dateToEnd.getDate() + 1);
+    request = request.lt('published_date', dateToEnd.toISOString().split('T')[0]);
+  }
+
+  if (query.sourceKey) {
+    const { data: sourceData } = await supabase
+      .from('news_sources')
+      .select('id')
+      .eq('source_key', query.sourceKey)
+      .single();
+
+    if (sourceData?.id) {
+      request = request.eq('source_id', sourceData.id);
+    }
+  }
+
+  const { data, error, count } = await request;
+
+  if (error) {
+    // Errors are thrown, never cached
+    throw new Error(error.message);
+  }
+
+  return { data: data ?? [], total: count ?? (data?.length ?? 0) };
+}
+
+async function queryNewsFacets(): Promise<NewsFacets> {
+  const { data: categoryRows, error: categoryError } = await supabase
+    .from('articles')
+    .select('category, sub_category')
+    .neq('category', null)
+    .order('category', { ascending: true });
+
+  if (categoryError) {
+    console.warn('[NewsCache] Failed to load category list', categoryError.message);
+  }
+
+  const categories: string[] = [];
+  const subCategoriesByCategory: Record<string, string[]> = {};
+
+  (categoryRows || []).forEach((row) => {
+    const categoryKey = row.category?.trim();
+    if (!categoryKey) return;
+    if (!categories.includes(categoryKey)) {
+      categories.push(categoryKey);
+    }
+
+    const subKey = row.sub_category?.trim();
+    if (!subKey) return;
+    subCategoriesByCategory[categoryKey] = subCategoriesByCategory[categoryKey] || [];
+    if (!subCategoriesByCategory[categoryKey].includes(subKey)) {
+      subCategoriesByCategory[categoryKey].push(subKey);
+    }
+  });
+
+  const { data: sourcesData } = await supabase
+    .from('news_sources')
+    .select('source_key, name')
+    .eq('is_active', true)
+    .order('name');
+
+  const sources = (sourcesData || []).map((s) => ({ key: s.source_key, name: s.name }));
+
+  return { categories, subCategoriesByCategory, sources };
+}
+
+async function queryArticleDetail(articleId: string) {
+  const { data, error } = await supabase.from('articles').select(DETAIL_COLUMNS).eq('id', articleId).maybeSingle();
+
+  if (error) {
+    throw new Error(error.message);
+  }
+
+  return data;
+}
+
+export function getCachedNewsList(query: NewsListQuery) {
+  return unstable_cache(() => queryNewsList(query), ['news-list', listCacheKey(query)], {
+    tags: [NEWS_LIST_TAG],
+    revalidate: NEWS_CACHE_MAX_AGE_SECONDS,
+  })();
+}
+
+export const getCachedNewsFacets = unstable_cache(queryNewsFacets, ['news-facets'], {
+  tags: [NEWS_FACETS_TAG],
+  revalidate: NEWS_CACHE_MAX_AGE_SECONDS,
+});
+
+/**
+ * Article detail payload (content blocks, images, assets), cached per article id
+ * Resolves to null for unknown ids; null is cached too until the id is written.
+ */
+export function getCachedArticleDetail(articleId: string) {
+  return unstable_cache(() => queryArticleDetail(articleId), ['news-article', articleId], {
+    tags: [articleCacheTag(articleId)],
+    revalidate: NEWS_CACHE_MAX_AGE_SECONDS,
+  })();
+}
+
+/**
+ * Ids of the articles worth pre-rendering: recent stories, most widely covered first
+ */
+export async function getHotArticleIds(limit: number): Promise<string[]> {
+  const { data, error } = await supabase
+    .from('articles')
+    .select('id, published_date, story_cluster:story_clusters!story_cluster_id(article_count)')
+    .eq('scrape_status', 'success')
+    .eq('is_story_primary', true)
+    .order('published_date', { ascending: false })
+    .limit(limit * 4);
+
+  if (error) {
+    throw new Error(error.message);
+  }
+
+  const coverage = (row: { story_cluster?: unknown }) => {
+    const cluster = (Array.isArray(row.story_cluster) ? row.story_cluster[0] : row.story_cluster) as
+      | { article_count?: number }
+      | null
+      | undefined;
+    return cluster?.article_count ?? 1;
+  };
+
+  // Stable sort keeps recency order among equally covered stories
+  return (data ?? [])
+    .map((row, index) => ({ id: row.id as string, index, coverage: coverage(row) }))
+    .sort((a, b) => b.coverage - a.coverage || a.index - b.index)
+    .slice(0, limit)
+    .map((row) => row.id);
+}
+
+/**
+ * Weak ETag over a serialized response body
+ */
+export function computeETag(body: string): string {
+  return `W/"${createHash('sha1').update(body).digest('base64url')}"`;
+}
+
+export function matchesETag(ifNoneMatch: string | null, etag: string): boolean {
+  if (!ifNoneMatch) return false;
+  return ifNoneMatch.split(',').some((candidate) => candidate.trim() === etag || candidate.trim() === '*');
+}
+
+/**
+ * Drop cached detail pages for the given articles plus every list page and
+ * the filter facets. Safe to call outside a Next.js request (scripts, tests):
+ * there is no cache to invalidate there, so it is a no-op.
+ */
+export function invalidateArticleCache(articleIds: string | string[]) {
+  const ids = Array.isArray(articleIds) ? articleIds : [articleIds];
+  const tags = [...ids.filter(Boolean).map(articleCacheTag), NEWS_LIST_TAG, NEWS_FACETS_TAG];
+
+  for (const tag of tags) {
+    try {
+      revalidateTag(tag);
+    } catch (error) {
+      const message = error instanceof Error ? error.message : String(error);
+      console.warn(`[NewsCache] Could not revalidate ${tag}:`, message);
+      return;
+    }
+  }
+}
@@ -5,10 +5,17 @@
  * Database Design:
  * - articles: Core article storage with deduplication by (source_id, source_article_id)
  * - article_images: 1-to-many relationship with articles
+ * - articles.content_hash: change detection for re-scraped articles (write only on change)
+ * - articles.story_cluster_id: near-duplicate stories across sources (see storyClusters repository)
  */
 
 import { supabase, supabaseAdmin } from '@/lib/db/supabase';
 import { Article, ArticleImage, ScrapedArticle } from '@/lib/types/database';
+import { computeArticleContentHash } from '@/lib/utils/contentHash';
+import { RECRAWL_LEASE_MS, computeNextRecrawlAt, getRecrawlReferenceDate } from '@/lib/scrapers/recrawlPolicy';
+import { restoreArchivedNewslist } from '@/lib/repositories/newslist';
+import { indexArticleStory } from '@/lib/repositories/storyClusters';
+import { invalidateArticleCache } from '@/lib/services/newsCache';
 
 const dbClient = supabaseAdmin ?? supabase;
 
@@ -72,6 +79,70 @@ export async function checkArticleExists(sourceArticleId: string, sourceKey: str
   }
 }
 
+type ExistingArticle = Pick<
+  Article,
+  'id' | 'source_id' | 'content_hash' | 'published_date' | 'updated_date' | 'recrawl_count' | 'story_cluster_id'
+>;
+
+/**
+ * Load the change-detection fields of an existing article
+ * Uses the same (source_id, source_article_id) key as checkArticleExists
+ *
+ * @returns Existing article fields, or null if the article is not stored yet
+ */
+export async function findExistingArticle(
+  sourceArticleId: string,
+  sourceKey: string = 'hk01'
+): Promise<ExistingArticle | null> {
+  const sourceId = await getSourceId(sourceKey);
+
+  const { data, error } = await dbClient
+    .from('articles')
+    .select('id, source_id, content_hash, published_date, updated_date, recrawl_count, story_cluster_id')
+    .eq('source_id', sourceId)
+    .eq('source_article_id', sourceArticleId)
+    .maybeSingle();
+
+  if (error) {
+    throw error;
+  }
+
+  return (data as ExistingArticle) ?? null;
+}
+
+/**
+ * Build the article columns derived from scraped data
+ * Shared by the create and update paths so both store identical shapes
+ */
+function buildArticleFields(scrapedArticle: ScrapedArticle, sourceUrl: string) {
+  // Content is already in JSONB array format from scraper
+  const contentArray = scrapedArticle.content || [];
+
+  // Extract first 200 characters for excerpt
+  let excerpt = '';
+  if (contentArray.length > 0) {
+    const firstTextBlock = contentArray.find((block) => block.text);
+    if (firstTextBlock) {
+      excerpt = firstTextBlock.text.substring(0, 200);
+    }
+  }
+
+  return {
+    source_url: sourceUrl,
+    title: scrapedArticle.title,
+    author: scrapedArticle.author || null,
+    category: scrapedArticle.category || null,
+    sub_category: scrapedArticle.subCategory || null,
+    tags: scrapedArticle.tags?.join(',') || null,
+    published_date: scrapedArticle.publishedDate || null,
+    updated_date: scrapedArticle.updatedDate || null,
+    content: contentArray,
+    excerpt: excerpt || null,
+    main_image_url: scrapedArticle.mainImageUrl || null,
+    main_image_caption: scrapedArticle.mainImageCaption || null,
+  };
+}
+
 /**
  * Create a new article in the database
  * Converts ScrapedArticle (from scraper) to Article (database format)
@@ -88,35 +159,22 @@ export async function createArticle(
 ): Promise<Article> {
   try {
     const sourceId = await getSourceId(sourceKey);
-
-    // Content is already in JSONB array format from scraper
-    const contentArray = scrapedArticle.content || [];
-    
-    // Extract first 200 characters for excerpt
-    let excerpt = '';
-    if (contentArray.length > 0) {
-      const firstTextBlock = contentArray.find((block) => block.text);
-      if (firstTextBlock) {
-        excerpt = firstTextBlock.text.substring(0, 200);
-      }
-    }
+    const fields = buildArticleFields(scrapedArticle, sourceUrl);
+    const now = new Date();
 
     // Prepare article data for database
     const articleData = {
+      ...fields,
       source_id: sourceId,
       source_article_id: scrapedArticle.articleId,
-      source_url: sourceUrl,
-      title: scrapedArticle.title,
-      author: scrapedArticle.author || null,
-      category: scrapedArticle.category || null,
-      sub_category: scrapedArticle.subCategory || null,
-      tags: scrapedArticle.tags?.join(',') || null,
-      published_date: scrapedArticle.publishedDate || null,
-      updated_date: scrapedArticle.updatedDate || null,
-      content: contentArray,
-      excerpt: excerpt || null,
-      main_image_url: scrapedArticle.mainImageUrl || null,
-      main_image_caption: scrapedArticle.mainImageCaption || null,
+      content_hash: computeArticleContentHash(scrapedArticle),
+      last_checked_at: now.toISOString(),
+      next_recrawl_at: computeNextRecrawlAt(
+        getRecrawlReferenceDate(fields.published_date, fields.updated_date),
+        0,
+        now
+      ),
+      recrawl_count: 0,
       scrape_status: 'success',
     };
 
@@ -142,6 +200,39 @@ export async function createArticle(
   }
 }
 
+type ArticleImageRow = {
+  article_id: string;
+  image_url: string;
+  caption: string | null;
+  display_order: number;
+  is_main_image: boolean;
+};
+
+/**
+ * Convert scraped images to article_images rows, preserving scraper order
+ */
+function toArticleImageRows(
+  articleId: string,
+  images: ScrapedArticle['articleImageList']
+): ArticleImageRow[] {
+  return (images || [])
+    .map((img, index) => {
+      const imageUrl = (img as any).url || (img as any).src;
+      if (!imageUrl) {
+        return null;
+      }
+
+      return {
+        article_id: articleId,
+        image_url: imageUrl,
+        caption: img.caption || null,
+        display_order: index,
+        is_main_image: false, // Main image is stored in articles.main_image_url
+      };
+    })
+    .filter(Boolean) as ArticleImageRow[];
+}
+
 /**
  * Create article images (1-to-many relationship)
  * Stores all images associated with an article
@@ -158,29 +249,7 @@ export async function createArticleImages(
       return [];
     }
 
-    // Convert scraped images to database format
-    const imagesToInsert = images
-      .map((img, index) => {
-        const imageUrl = (img as any).url || (img as any).src;
-        if (!imageUrl) {
-          return null;
-        }
-
-        return {
-          article_id: articleId,
-          image_url: imageUrl,
-          caption: img.caption || null,
-          display_order: index,
-          is_main_image: false, // Main image is stored in articles.main_image_url
-        };
-      })
-      .filter(Boolean) as Array<{
-        article_id: string;
-        image_url: string;
-        caption: string | null;
-        display_order: number;
-        is_main_image: boolean;
-      }>;
+    const imagesToInsert = toArticleImageRows(articleId, images);
 
     const { data, error } = await dbClient
       .from('article_images')
@@ -198,6 +267,165 @@ export async function createArticleImages(
   }
 }
 
+/**
+ * Reconcile article_images with a re-scraped image list
+ * Matches rows by image_url and only inserts, updates or deletes what changed,
+ * so unchanged images keep their row IDs (and any derived data keyed on them).
+ *
+ * @param articleId - Database ID of the article
+ * @param images - Array of images from scraper
+ */
+export async function syncArticleImages(
+  articleId: string,
+  images: ScrapedArticle['articleImageList']
+): Promise<{ inserted: number; updated: number; deleted: number }> {
+  const desired = toArticleImageRows(articleId, images);
+
+  const { data: existingRows, error } = await dbClient
+    .from('article_images')
+    .select('id, image_url, caption, display_order')
+    .eq('article_id', articleId);
+
+  if (error) {
+    throw new Error(`Failed to load article images: ${error.message}`);
+  }
+
+  const existingByUrl = new Map<string, { id: string; caption: string | null; display_order: number }>();
+  const duplicateIds: string[] = [];
+  for (const row of existingRows || []) {
+    if (existingByUrl.has(row.image_url)) {
+      duplicateIds.push(row.id);
+    } else {
+      existingByUrl.set(row.image_url, row);
+    }
+  }
+
+  const toInsert: ArticleImageRow[] = [];
+  const toUpdate: Array<{ id: string; caption: string | null; display_order: number }> = [];
+
+  for (const row of desired) {
+    const current = existingByUrl.get(row.image_url);
+    if (!current) {
+      toInsert.push(row);
+      continue;
+    }
+    existingByUrl.delete(row.image_url);
+    if ((current.caption ?? null) !== row.caption || current.display_order !== row.display_order) {
+      toUpdate.push({ id: current.id, caption: row.caption, display_order: row.display_order });
+    }
+  }
+
+  const toDelete = [...duplicateIds, ...Array.from(existingByUrl.values()).map((row) => row.id)];
+
+  if (toDelete.length > 0) {
+    const { error: deleteError } = await dbClient.from('article_images').delete().in('id', toDelete);
+    if (deleteError) {
+      throw new Error(`Failed to delete stale article images: ${deleteError.message}`);
+    }
+  }
+
+  for (const row of toUpdate) {
+    const { error: updateError } = await dbClient
+      .from('article_images')
+      .update({ caption: row.caption, display_order: row.display_order })
+      .eq('id', row.id);
+    if (updateError) {
+      throw new Error(`Failed to update article image: ${updateError.message}`);
+    }
+  }
+
+  if (toInsert.length > 0) {
+    const { error: insertError } = await dbClient.from('article_images').insert(toInsert);
+    if (insertError) {
+      throw new Error(`Failed to create article images: ${insertError.message}`);
+    }
+  }
+
+  return { inserted: toInsert.length, updated: toUpdate.length, deleted: toDelete.length };
+}
+
+/**
+ * Apply a re-scraped version of an existing article
+ * Writes article fields and diffs images only when the content hash changed;
+ * otherwise just advances the recrawl schedule.
+ *
+ * @returns true if the article content was rewritten
+ */
+async function refreshExistingArticle(
+  existing: ExistingArticle,
+  scrapedArticle: ScrapedArticle,
+  sourceUrl: string
+): Promise<boolean> {
+  const contentHash = computeArticleContentHash(scrapedArticle);
+  const changed = existing.content_hash !== contentHash;
+  const now = new Date();
+
+  if (!changed) {
+    const recrawlCount = (existing.recrawl_count ?? 0) + 1;
+    const { error } = await dbClient
+      .from('articles')
+      .update({
+        last_checked_at: now.toISOString(),
+        recrawl_count: recrawlCount,
+        next_recrawl_at: computeNextRecrawlAt(
+          getRecrawlReferenceDate(existing.published_date, existing.updated_date),
+          recrawlCount,
+          now
+        ),
+      })
+      .eq('id', existing.id);
+
+    if (error) {
+      throw new Error(`Failed to update recrawl schedule: ${error.message}`);
+    }
+    return false;
+  }
+
+  const fields = buildArticleFields(scrapedArticle, sourceUrl);
+  const { error } = await dbClient
+    .from('articles')
+    .update({
+      ...fields,
+      content_hash: contentHash,
+      // Let the image worker re-resolve the hero image in case its URL changed
+      main_image_asset_id: null,
+      last_checked_at: now.toISOString(),
+      last_updated_at: now.toISOString(),
+      // A changed article is likely to change again soon: restart the schedule
+      recrawl_count: 0,
+      next_recrawl_at: computeNextRecrawlAt(
+        getRecrawlReferenceDate(fields.published_date, fields.updated_date),
+        0,
+        now
+      ),
+    })
+    .eq('id', existing.id);
+
+  if (error) {
+    throw new Error(`Failed to update article: ${error.message}`);
+  }
+
+  await syncArticleImages(existing.id, scrapedArticle.articleImageList);
+  await updateStoryIndex(existing, scrapedArticle);
+  return true;
+}
+
+/**
+ * Refresh an article's near-duplicate signature and story cluster
+ * Clustering is best-effort: a failure here never fails the import.
+ */
+async function updateStoryIndex(
+  article: Pick<Article, 'id' | 'source_id' | 'story_cluster_id'>,
+  scrapedArticle: ScrapedArticle
+) {
+  try {
+    await indexArticleStory(article, scrapedArticle);
+  } catch (error) {
+    const message = error instanceof Error ? error.message : (error as { message?: string })?.message ?? String(error);
+    console.warn(`[ArticlesClient] Failed to index story for article ${article.id}:`, message);
+  }
+}
+
 /**
  * Import a complete article with all its images
  * Handles deduplication, article creation, and image creation atomically
@@ -319,6 +547,7 @@ export async function importArticle(
   success: boolean;
   articleId?: string;
   isNew: boolean;
+  isUpdated?: boolean;
   message: string;
   error?: string;
 }> {
@@ -332,17 +561,29 @@ export async function importArticle(
       await markNewslistProcessing(articleId);
     }
 
-    // Check if article already exists
-    const exists = articleId ? await checkArticleExists(articleId, sourceKey) : false;
+    // Check if article already exists; if so, rewrite it only when its content changed
+    const existing = articleId ? await findExistingArticle(articleId, sourceKey) : null;
 
-    if (exists) {
+    if (existing) {
+      const isUpdated = await refreshExistingArticle(existing, scrapedArticle, sourceUrl);
+      if (isUpdated) {
+        invalidateArticleCache(existing.id);
+      }
       if (manageStatus && articleId) {
-        await markNewslistExisting(articleId);
+        if (isUpdated) {
+          await markNewslistSuccess(articleId, existing.id);
+        } else {
+          await markNewslistExisting(articleId);
+        }
       }
       return {
         success: true,
+        articleId: existing.id,
         isNew: false,
-        message: `Article ${articleId} already exists in database`,
+        isUpdated,
+        message: isUpdated
+          ? `Article ${articleId} content changed and was updated`
+          : `Article ${articleId} already exists in database`,
       };
     }
 
@@ -354,6 +595,9 @@ export async function importArticle(
       await createArticleImages(article.id, scrapedArticle.articleImageList);
     }
 
+    await updateStoryIndex(article, scrapedArticle);
+    invalidateArticleCache(article.id);
+
     if (manageStatus) {
       await markNewslistSuccess(scrapedArticle.articleId, article.id);
     }
@@ -393,6 +637,7 @@ export async function batchImportArticles(
 ): Promise<{
   total: number;
   imported: number;
+  updated: number;
   existing: number;
   failed: number;
   errors: Array<{ articleId: string; error: string }>;
@@ -400,6 +645,7 @@ export async function batchImportArticles(
   const results = {
     total: articles.length,
     imported: 0,
+    updated: 0,
     existing: 0,
     failed: 0,
     errors: [] as Array<{ articleId: string; error: string }>,
@@ -411,6 +657,8 @@ export async function batchImportArticles(
     if (result.success) {
       if (result.isNew) {
         results.imported++;
+      } else if (result.isUpdated) {
+        results.updated++;
       } else {
         results.existing++;
       }
@@ -426,6 +674,103 @@ export async function batchImportArticles(
   return results;
 }
 
+/**
+ * Requeue articles whose recrawl is due
+ * Flips their newslist entries back to 'pending' so the regular process route
+ * re-scrapes them; importArticle then takes the content-hash update path.
+ * Every due article that has an entry (requeued or already in flight) is
+ * leased for RECRAWL_LEASE_MS so it is not picked again before its entry is
+ * processed; a successful import replaces the lease with the real schedule.
+ * Only articles with no entry in either tier get their schedule cleared.
+ *
+ * @param limit - Maximum number of articles to requeue
+ * @returns Number of newslist entries requeued
+ */
+export async function requeueArticlesDueForRecrawl(limit: number = 25): Promise<number> {
+  const { data: dueArticles, error } = await dbClient
+    .from('articles')
+    .select('source_id, source_article_id')
+    .not('next_recrawl_at', 'is', null)
+    .lte('next_recrawl_at', new Date().toISOString())
+    .order('next_recrawl_at', { ascending: true })
+    .limit(limit);
+
+  if (error) {
+    throw new Error(`Failed to load articles due for recrawl: ${error.message}`);
+  }
+
+  // Group by source so each update hits the (source_id, source_article_id) unique index
+  const idsBySource = new Map<string, string[]>();
+  for (const article of dueArticles || []) {
+    const ids = idsBySource.get(article.source_id) ?? [];
+    ids.push(article.source_article_id);
+    idsBySource.set(article.source_id, ids);
+  }
+
+  let requeued = 0;
+  for (const [sourceId, sourceArticleIds] of Array.from(idsBySource.entries())) {
+    // Entries of older articles may already sit in the cold tier
+    await restoreArchivedNewslist({ sourceId, sourceArticleIds });
+
+    const { data, error: updateError } = await dbClient
+      .from('newslist')
+      .update({ status: 'pending', error_log: null })
+      .eq('source_id', sourceId)
+      .in('source_article_id', sourceArticleIds)
+      .eq('status', 'extracted')
+      .select('source_article_id');
+
+    if (updateError) {
+      throw new Error(`Failed to requeue newslist entries: ${updateError.message}`);
+    }
+    requeued += data?.length ?? 0;
+
+    // Entries that were not extracted are still pending, processing or failed; they keep
+    // their status and the article waits on the lease like a requeued one
+    const { data: entries, error: entriesError } = await dbClient
+      .from('newslist_all')
+      .select('source_article_id')
+      .eq('source_id', sourceId)
+      .in('source_article_id', sourceArticleIds);
+
+    if (entriesError) {
+      throw new Error(`Failed to load newslist entries: ${entriesError.message}`);
+    }
+
+    const withEntry = new Set((entries ?? []).map((row) => row.source_article_id));
+    const leasedIds = sourceArticleIds.filter((id) => withEntry.has(id));
+    const orphanIds = sourceArticleIds.filter((id) => !withEntry.has(id));
+
+    if (leasedIds.length > 0) {
+      const { error: leaseError } = await dbClient
+        .from('articles')
+        .update({ next_recrawl_at: new Date(Date.now() + RECRAWL_LEASE_MS).toISOString() })
+        .eq('source_id', sourceId)
+        .in('source_article_id', leasedIds);
+
+      if (leaseError) {
+        throw new Error(`Failed to lease recrawl schedule: ${leaseError.message}`);
+      }
+    }
+
+    // Articles imported without any newslist entry can never be requeued; clear their
+    // schedule so they stop heading every batch
+    if (orphanIds.length > 0) {
+      const { error: clearError } = await dbClient
+        .from('articles')
+        .update({ next_recrawl_at: null })
+        .eq('source_id', sourceId)
+        .in('source_article_id', orphanIds);
+
+      if (clearError) {
+        throw new Error(`Failed to clear recrawl schedule: ${clearError.message}`);
+      }
+    }
+  }
+
+  return requeued;
+}
+
 /**
  * Get article count statistics from database
  * Useful for dashboard/admin pages
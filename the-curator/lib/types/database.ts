@@ -43,11 +43,32 @@ export interface NewsSource {
       category?: string;
     };
   };
+  network_policy?: SourceNetworkPolicy; // Request filtering for headless renders
   is_active?: boolean;
   created_at: string;
   updated_at: string;
 }
 
+/**
+ * Declarative request policy applied while rendering a source's article pages
+ * Evaluated by lib/scrapers/networkPolicy.ts
+ */
+export interface SourceNetworkPolicy {
+  allowedHosts: string[]; // First-party hosts (suffix match); other hosts are blocked. Empty = any host
+  blockedResourceTypes: string[]; // Puppeteer resource types never fetched (e.g. 'image', 'font')
+  blockedDomains?: string[]; // Always blocked, even under an allowed host (ads, trackers)
+  stubbedScripts?: Array<{
+    host: string; // Host suffix the script is served from
+    pathPrefix?: string;
+    body: string; // Replacement JS, e.g. a no-op global so page code keeps running
+  }>;
+  readySelector?: string; // Present once server-rendered article content is in the DOM
+  lazyMount?: {
+    wrapperSelector: string; // Lazy wrappers scrolled into view so their <img> elements mount
+    placeholderSelector: string; // Present inside a wrapper until it has mounted
+  };
+}
+
 // ===== NEWSLIST ENTRY =====
 export type NewslistStatus = 'pending' | 'queued' | 'processing' | 'extracted' | 'failed';
 
@@ -109,10 +130,23 @@ export interface Article {
   // Main Image
   main_image_url?: string;
   main_image_caption?: string;
+  main_image_asset_id?: string | null; // UUID reference to image_assets
   
   // Extensibility
   metadata?: Record<string, unknown>; // Source-specific fields
   
+  // Change Detection & Recrawl
+  content_hash?: string | null; // SHA-256 of normalized title/content/images
+  last_checked_at?: string | null; // Last time the source page was re-scraped
+  next_recrawl_at?: string | null; // Null once the article is too old to revisit
+  recrawl_count?: number; // Consecutive re-scrapes that found no change
+  
+  // Story Clustering (near-duplicates across sources)
+  story_signature?: number[] | null; // MinHash over normalized title + content
+  story_cluster_id?: string | null; // UUID reference to story_clusters
+  is_story_primary?: boolean; // False for copies collapsed under another article
+  story_similarity?: number | null; // Estimated similarity to the matched article
+  
   // Scraping Status
   scraped_at: string;
   last_updated_at: string;
@@ -132,7 +166,46 @@ export interface ArticleImage {
   caption?: string;
   display_order: number; // Sort order
   is_main_image: boolean; // Flag for hero image
+  asset_id?: string | null; // UUID reference to image_assets (null until derived)
+  width?: number | null; // Original pixel dimensions, for layout reservation
+  height?: number | null;
+  created_at: string;
+  updated_at?: string;
+}
+
+// ===== STORY CLUSTER =====
+/**
+ * Group of near-duplicate articles covering the same story
+ */
+export interface StoryCluster {
+  id: string;
+  representative_article_id?: string | null; // Article shown when the cluster is collapsed
+  article_count: number;
+  source_count: number;
+  first_published_at?: string | null;
+  created_at: string;
+  updated_at: string;
+}
+
+// ===== IMAGE ASSET =====
+/**
+ * Distinct source image, fetched once and stored as local derivatives
+ */
+export interface ImageAsset {
+  id: string;
+  normalized_url: string;
+  content_hash?: string | null; // SHA-256 of source bytes
+  width?: number | null;
+  height?: number | null;
+  byte_size?: number | null;
+  mime_type?: string | null;
+  derivatives?: Record<string, unknown> | null;
+  status: 'pending' | 'ready' | 'failed';
+  error_log?: string | null;
+  attempt_count: number;
+  fetched_at?: string | null;
   created_at: string;
+  updated_at: string;
 }
 
 // ===== SCRAPED ARTICLE (from scraper) =====
@@ -1,55 +1,286 @@
-import { promises as fs } from 'fs';
+/**
+ * Automation Run Log
+ *
+ * Structured JSONL events for the ingest pipeline (discovery, article
+ * processing), one object per line:
+ *
+ *   {"ts":"…","type":"run_start","runId":"…","pipeline":"article", …}
+ *   {"ts":"…","type":"discovery","runId":"…","categorySlug":"3-體育","discovered":40,"saved":6, …}
+ *   {"ts":"…","type":"article","runId":"…","url":"…","status":"imported","stages":{"render":2310,"parse":41,"import":380},"totalMs":2731}
+ *   {"ts":"…","type":"error","runId":"…","stage":"render","message":"…","url":"…"}
+ *   {"ts":"…","type":"run_end","runId":"…","status":"completed","processed":4,"failed":1,"durationMs":9120}
+ *
+ * Events are buffered in memory and appended in batches. When the active file
+ * passes RUN_LOG_MAX_BYTES it is rotated and gzipped; only the newest
+ * RUN_LOG_MAX_SEGMENTS compressed segments are kept.
+ * Read the logs with analyze_run_log.py.
+ *
+ * On read-only filesystems (Vercel) events go to the console instead.
+ */
+
+import { createReadStream, createWriteStream, promises as fs } from 'fs';
 import path from 'path';
+import { pipeline } from 'stream/promises';
+import { createGzip } from 'zlib';
+import { randomUUID } from 'crypto';
 
 const LOG_DIR = path.join(process.cwd(), 'logs');
-const LOG_FILE = path.join(LOG_DIR, 'automation-history.log');
-
-export interface AutomationLogEntry {
-  runId: string;
-  categorySlug: string;
-  status: string;
-  articlesProcessed: number;
-  errors: Array<string>;
-  startedAt: string;
-  completedAt?: string;
-  notes?: string | null;
-}
-
-export async function appendAutomationLog(entry: AutomationLogEntry): Promise<void> {
-  try {
-    // Attempt to write to file system (will work on local development)
+const LOG_BASENAME = 'automation-run';
+const LOG_FILE = path.join(LOG_DIR, `${LOG_BASENAME}.jsonl`);
+
+export const RUN_LOG_MAX_BYTES = 10 * 1024 * 1024;
+export const RUN_LOG_MAX_SEGMENTS = 20;
+const FLUSH_THRESHOLD_BYTES = 64 * 1024;
+const FLUSH_INTERVAL_MS = 2000;
+
+export type RunPipeline = 'discovery' | 'article' | 'process';
+
+export type RunLogEvent =
+  | {
+      type: 'run_start';
+      pipeline: RunPipeline;
+      categorySlug?: string | null;
+      sourceKey?: string | null;
+      meta?: Record<string, unknown>;
+    }
+  | {
+      type: 'discovery';
+      categorySlug?: string | null;
+      sourceKey?: string | null;
+      discovered: number;
+      saved: number;
+      duplicates: number;
+      durationMs: number;
+    }
+  | {
+      type: 'article';
+      url: string;
+      categorySlug?: string | null;
+      sourceKey?: string | null;
+      status: string;
+      articleId?: string | null;
+      stages: Record<string, number>;
+      totalMs: number;
+    }
+  | {
+      type: 'error';
+      stage: string;
+      message: string;
+      url?: string | null;
+      categorySlug?: string | null;
+      sourceKey?: string | null;
+    }
+  | {
+      type: 'run_end';
+      pipeline: RunPipeline;
+      status: string;
+      processed: number;
+      failed: number;
+      durationMs: number;
+      meta?: Record<string, unknown>;
+    };
+
+let buffer: string[] = [];
+let bufferedBytes = 0;
+let flushTimer: NodeJS.Timeout | null = null;
+let flushChain: Promise<void> = Promise.resolve();
+let activeFileBytes: number | null = null;
+let fileSinkDisabled = false;
+
+function scheduleFlush() {
+  if (flushTimer) return;
+  flushTimer = setTimeout(() => {
+    flushTimer = null;
+    void flushRunLog();
+  }, FLUSH_INTERVAL_MS);
+  flushTimer.unref?.();
+}
+
+function writeRunLogEvent(runId: string, event: RunLogEvent) {
+  const line = JSON.stringify({ ts: new Date().toISOString(), runId, ...event });
+
+  if (fileSinkDisabled) {
+    console.info('[AutomationLog]', line);
+    return;
+  }
+
+  buffer.push(line);
+  bufferedBytes += Buffer.byteLength(line) + 1;
+
+  if (bufferedBytes >= FLUSH_THRESHOLD_BYTES) {
+    void flushRunLog();
+  } else {
+    scheduleFlush();
+  }
+}
+
+function rotatedSegmentName() {
+  const stamp = new Date().toISOString().replace(/[-:.]/g, '');
+  return `${LOG_BASENAME}-${stamp}-${randomUUID().slice(0, 8)}.jsonl`;
+}
+
+async function compressSegment(segmentPath: string) {
+  await pipeline(createReadStream(segmentPath), createGzip(), createWriteStream(`${segmentPath}.gz`));
+  await fs.unlink(segmentPath);
+}
+
+async function pruneSegments() {
+  const segments = (await fs.readdir(LOG_DIR))
+    .filter((name) => name.startsWith(`${LOG_BASENAME}-`) && name.endsWith('.jsonl.gz'))
+    // Names embed a UTC timestamp, so lexical order is chronological
+    .sort();
+
+  const excess = segments.slice(0, Math.max(0, segments.length - RUN_LOG_MAX_SEGMENTS));
+  await Promise.all(excess.map((name) => fs.unlink(path.join(LOG_DIR, name)).catch(() => {})));
+}
+
+async function rotateActiveFile() {
+  const segmentPath = path.join(LOG_DIR, rotatedSegmentName());
+  await fs.rename(LOG_FILE, segmentPath);
+  activeFileBytes = 0;
+
+  // Compression runs off the write path; a failure leaves a plain .jsonl segment, which the analyzer also reads
+  compressSegment(segmentPath)
+    .then(pruneSegments)
+    .catch((err) => console.warn('[AutomationLogger] Failed to compress log segment:', err instanceof Error ? err.message : String(err)));
+}
+
+async function writeChunk(lines: string[], bytes: number) {
+  if (activeFileBytes === null) {
     await fs.mkdir(LOG_DIR, { recursive: true });
-    const timestamp = new Date().toISOString();
-    const meta = [
-      `runId=${entry.runId}`,
-      `category=${entry.categorySlug}`,
-      `status=${entry.status}`,
-      `processed=${entry.articlesProcessed}`,
-      `errors=${entry.errors.length}`,
-      `started_at=${entry.startedAt}`,
-    ];
-
-    if (entry.completedAt) {
-      meta.push(`completed_at=${entry.completedAt}`);
+    activeFileBytes = await fs
+      .stat(LOG_FILE)
+      .then((stat) => stat.size)
+      .catch(() => 0);
+  }
+
+  if (activeFileBytes > 0 && activeFileBytes + bytes > RUN_LOG_MAX_BYTES) {
+    await rotateActiveFile().catch((err) => {
+      // Keep appending to the current file; rotation is retried on the next flush
+      console.warn('[AutomationLogger] Failed to rotate run log:', err instanceof Error ? err.message : String(err));
+    });
+  }
+
+  await fs.appendFile(LOG_FILE, `${lines.join('\n')}\n`);
+  activeFileBytes = (activeFileBytes ?? 0) + bytes;
+}
+
+/**
+ * Write buffered events to disk
+ * Call before returning from a route handler: serverless instances may be
+ * frozen as soon as the response is sent.
+ */
+export function flushRunLog(): Promise<void> {
+  if (flushTimer) {
+    clearTimeout(flushTimer);
+    flushTimer = null;
+  }
+
+  const lines = buffer;
+  const bytes = bufferedBytes;
+  buffer = [];
+  bufferedBytes = 0;
+
+  if (lines.length === 0) {
+    return flushChain;
+  }
+
+  // Flushes are serialized so lines stay in order and rotation never races an append
+  flushChain = flushChain.then(async () => {
+    if (fileSinkDisabled) {
+      lines.forEach((line) => console.info('[AutomationLog]', line));
+      return;
     }
-    if (entry.notes) {
-      meta.push(`notes=${entry.notes}`);
+
+    try {
+      await writeChunk(lines, bytes);
+    } catch (err) {
+      // On serverless platforms like Vercel, filesystem is read-only
+      fileSinkDisabled = true;
+      console.warn(
+        '[AutomationLogger] Could not write to filesystem - likely on serverless platform:',
+        err instanceof Error ? err.message : String(err)
+      );
+      lines.forEach((line) => console.info('[AutomationLog]', line));
     }
+  });
+
+  return flushChain;
+}
+
+/**
+ * Per-article stage timings, in milliseconds
+ *
+ * @example
+ * const timings = createStageTimings();
+ * const html = await timings.measure('render', () => fetchPageHtml(url));
+ * runLog.article({ url, status: 'imported', stages: timings.stages, totalMs: timings.totalMs() });
+ */
+export function createStageTimings() {
+  const startedAt = Date.now();
+  const stages: Record<string, number> = {};
+
+  return {
+    stages,
+    async measure<T>(stage: string, fn: () => Promise<T> | T): Promise<T> {
+      const stageStart = Date.now();
+      try {
+        return await fn();
+      } finally {
+        stages[stage] = (stages[stage] ?? 0) + (Date.now() - stageStart);
+      }
+    },
+    totalMs: () => Date.now() - startedAt,
+  };
+}
+
+type EventInput<T extends RunLogEvent['type']> = Omit<Extract<RunLogEvent, { type: T }>, 'type'>;
+
+/**
+ * Events for a single pipeline run, all tagged with the same runId
+ */
+export class RunLog {
+  readonly runId: string;
+  readonly pipeline: RunPipeline;
+  private readonly startedAt = Date.now();
+
+  constructor(pipeline: RunPipeline, runId: string = randomUUID()) {
+    this.pipeline = pipeline;
+    this.runId = runId;
+  }
+
+  static start(
+    pipeline: RunPipeline,
+    context: Omit<EventInput<'run_start'>, 'pipeline'> & { runId?: string } = {}
+  ): RunLog {
+    const { runId, ...rest } = context;
+    const runLog = new RunLog(pipeline, runId);
+    writeRunLogEvent(runLog.runId, { type: 'run_start', pipeline, ...rest });
+    return runLog;
+  }
+
+  discovery(event: EventInput<'discovery'>) {
+    writeRunLogEvent(this.runId, { type: 'discovery', ...event });
+  }
+
+  article(event: EventInput<'article'>) {
+    writeRunLogEvent(this.runId, { type: 'article', ...event });
+  }
+
+  error(event: Omit<EventInput<'error'>, 'message'> & { error: unknown }) {
+    const { error, ...rest } = event;
+    const message = error instanceof Error ? error.message : String(error);
+    writeRunLogEvent(this.runId, { type: 'error', message, ...rest });
+  }
 
-    const line = `[${timestamp}] ${meta.join(' | ')} | errorSamples=${JSON.stringify(entry.errors.slice(0, 3))}`;
-    await fs.appendFile(LOG_FILE, `${line}\n`);
-  } catch (err) {
-    // On serverless platforms like Vercel, filesystem is read-only
-    // Gracefully handle and log to console instead
-    console.warn('[AutomationLogger] Could not write to filesystem - likely on serverless platform:', err instanceof Error ? err.message : String(err));
-    console.info('[AutomationLog]', {
-      runId: entry.runId,
-      category: entry.categorySlug,
-      status: entry.status,
-      processed: entry.articlesProcessed,
-      errors: entry.errors.length,
-      startedAt: entry.startedAt,
-      completedAt: entry.completedAt,
+  /** Emit run_end and flush everything buffered for the run */
+  end(event: Omit<EventInput<'run_end'>, 'pipeline' | 'durationMs'>): Promise<void> {
+    writeRunLogEvent(this.runId, {
+      type: 'run_end',
+      pipeline: this.pipeline,
+      durationMs: Date.now() - this.startedAt,
+      ...event,
     });
+    return flushRunLog();
   }
 }
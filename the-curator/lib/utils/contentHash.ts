@@ -0,0 +1,42 @@
+import { createHash } from 'crypto';
+import type { ScrapedArticle } from '@/lib/types/database';
+
+/**
+ * Normalize a text fragment before hashing so that cosmetic differences
+ * (full-width forms, NBSP, line breaks, trailing whitespace) do not count as edits.
+ */
+export function normalizeHashText(value?: string | null): string {
+  if (!value) return '';
+  return value
+    .normalize('NFKC')
+    .replace(/\s+/g, ' ')
+    .trim();
+}
+
+/**
+ * Compute a stable SHA-256 fingerprint of the parts of an article readers see:
+ * title, content blocks, main image and the ordered image list.
+ * Used by importArticle to decide whether a re-scraped article actually changed.
+ */
+export function computeArticleContentHash(article: ScrapedArticle): string {
+  const blocks = (article.content || [])
+    .map((block) => ({ type: block.type, text: normalizeHashText(block.text) }))
+    .filter((block) => block.text);
+
+  const images = (article.articleImageList || [])
+    .map((img) => ({
+      url: (img.url || img.src || '').trim(),
+      caption: normalizeHashText(img.caption),
+    }))
+    .filter((img) => img.url);
+
+  const payload = JSON.stringify({
+    title: normalizeHashText(article.title),
+    blocks,
+    mainImageUrl: (article.mainImageUrl || '').trim(),
+    mainImageCaption: normalizeHashText(article.mainImageCaption),
+    images,
+  });
+
+  return createHash('sha256').update(payload).digest('hex');
+}
@@ -0,0 +1,11 @@
+import type { NextRequest } from 'next/server';
+
+/**
+ * Check that a GET came from the scheduler configured in vercel.json
+ * Vercel Cron sends `Authorization: Bearer $CRON_SECRET`; without a configured
+ * secret every scheduled call is rejected.
+ */
+export function isAuthorizedCronRequest(request: NextRequest): boolean {
+  const secret = process.env.CRON_SECRET;
+  return Boolean(secret) && request.headers.get('authorization') === `Bearer ${secret}`;
+}
@@ -0,0 +1,90 @@
+/**
+ * Image URL helpers shared by the derivative worker (server) and the news UI (client)
+ * Kept free of Node-only imports so client components can use them.
+ */
+
+export const IMAGE_VARIANTS = {
+  thumb: 320,
+  card: 640,
+  full: 1280,
+} as const;
+
+export type ImageVariant = keyof typeof IMAGE_VARIANTS;
+export type ImageFormat = 'avif' | 'webp';
+
+export const IMAGE_FORMATS: ImageFormat[] = ['avif', 'webp'];
+
+const TRACKING_PARAM_PATTERN = /^(utm_|fbclid$|gclid$)/i;
+
+/**
+ * Normalize a source image URL so the same image referenced by different
+ * articles (or with tracking params / fragments) is fetched only once.
+ * Size-selecting query params (e.g. HK01's ?v=w1280r16_9) are kept.
+ */
+export function normalizeImageUrl(rawUrl: string): string | null {
+  if (!rawUrl) return null;
+  try {
+    const url = new URL(rawUrl.trim());
+    if (url.protocol !== 'http:' && url.protocol !== 'https:') {
+      return null;
+    }
+    url.protocol = 'https:';
+    url.hostname = url.hostname.toLowerCase();
+    url.hash = '';
+
+    const params = Array.from(url.searchParams.entries())
+      .filter(([key]) => !TRACKING_PARAM_PATTERN.test(key))
+      .sort(([a], [b]) => a.localeCompare(b));
+    url.search = '';
+    for (const [key, value] of params) {
+      url.searchParams.append(key, value);
+    }
+
+    return url.toString();
+  } catch {
+    return null;
+  }
+}
+
+/**
+ * Public Supabase Storage bucket holding the derivatives, if one is configured
+ * Without a bucket, derivatives live on the local disk of the instance that
+ * produced them and are served by /api/images.
+ */
+export function getImageStorageBucket(): string | null {
+  return process.env.NEXT_PUBLIC_IMAGE_STORAGE_BUCKET || null;
+}
+
+/**
+ * Object key of a derivative, shared by the local store and the storage bucket
+ */
+export function getDerivativeKey(contentHash: string, variant: ImageVariant, format: ImageFormat): string {
+  return `${contentHash.slice(0, 2)}/${contentHash}/${variant}.${format}`;
+}
+
+/**
+ * Public URL of a derivative, addressed by the source image's content hash
+ */
+export function getDerivativeUrl(contentHash: string, variant: ImageVariant, format: ImageFormat): string {
+  const bucket = getImageStorageBucket();
+  const supabaseUrl = process.env.NEXT_PUBLIC_SUPABASE_URL;
+  if (bucket && supabaseUrl) {
+    return `${supabaseUrl.replace(/\/$/, '')}/storage/v1/object/public/${bucket}/${getDerivativeKey(contentHash, variant, format)}`;
+  }
+  return `/api/images/${contentHash}/${variant}.${format}`;
+}
+
+/**
+ * Scale original dimensions to a variant width, never enlarging
+ */
+export function getVariantDimensions(
+  width: number,
+  height: number,
+  variant: ImageVariant
+): { width: number; height: number } {
+  const targetWidth = Math.min(width, IMAGE_VARIANTS[variant]);
+  return {
+    width: targetWidth,
+    height: Math.round((height * targetWidth) / width),
+  };
+}
@@ -0,0 +1,232 @@
+/**
+ * Client-side data layer for /api/news/list
+ *
+ * - bounded LRU cache of list pages, keyed by filter scope + page
+ * - in-flight deduplication: a prefetch and the real request share one fetch
+ * - cancellation: callers pass an AbortSignal; the shared fetch is aborted
+ *   only when every caller waiting on it has gone away
+ * - facets (categories/sources) are requested once per facet scope
+ */
+
+export const NEWS_LIST_PAGE_SIZE = 12;
+const NEWS_LIST_CACHE_SIZE = 60;
+const NEWS_LIST_CACHE_TTL_MS = 60 * 1000;
+
+export type NewsListFilters = {
+  search?: string;
+  tag?: string;
+  source?: string;
+  category?: string;
+  subCategory?: string;
+  dateFrom?: string;
+  dateTo?: string;
+};
+
+export type NewsFacets = {
+  categories: string[];
+  subCategoriesByCategory: Record<string, string[]>;
+  sources: Array<{ key: string; name: string }>;
+};
+
+export type NewsListPage<T> = {
+  data: T[];
+  total: number;
+};
+
+type NewsListPayload<T> = Partial<NewsFacets> & {
+  success: boolean;
+  data: T[];
+  total: number;
+  message?: string;
+};
+
+class LruCache<V> {
+  private entries = new Map<string, { value: V; expiresAt: number }>();
+
+  constructor(private maxEntries: number, private ttlMs: number) {}
+
+  get(key: string): V | undefined {
+    const entry = this.entries.get(key);
+    if (!entry) return undefined;
+    if (entry.expiresAt < Date.now()) {
+      this.entries.delete(key);
+      return undefined;
+    }
+    // Re-insert to mark as most recently used
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    return entry.value;
+  }
+
+  set(key: string, value: V) {
+    this.entries.delete(key);
+    this.entries.set(key, { value, expiresAt: Date.now() + this.ttlMs });
+    while (this.entries.size > this.maxEntries) {
+      const oldest = this.entries.keys().next().value as string;
+      this.entries.delete(oldest);
+    }
+  }
+}
+
+type InflightRequest<T> = {
+  promise: Promise<NewsListPage<T>>;
+  controller: AbortController;
+  waiters: number;
+};
+
+const pageCache = new LruCache<NewsListPage<unknown>>(NEWS_LIST_CACHE_SIZE, NEWS_LIST_CACHE_TTL_MS);
+const inflight = new Map<string, InflightRequest<unknown>>();
+const facetsByScope = new Map<string, NewsFacets>();
+
+/**
+ * Facets do not depend on the list filters today, so there is a single scope;
+ * change this if the API starts narrowing facets by filter.
+ */
+export function getFacetScope(_filters: NewsListFilters): string {
+  return 'all';
+}
+
+export function getCachedFacets(filters: NewsListFilters): NewsFacets | undefined {
+  return facetsByScope.get(getFacetScope(filters));
+}
+
+/**
+ * Stable key for a filter combination (the "scope" of an infinite-scroll list)
+ */
+export function getNewsListScopeKey(filters: NewsListFilters): string {
+  const params = new URLSearchParams();
+  (Object.keys(filters) as Array<keyof NewsListFilters>)
+    .sort()
+    .forEach((key) => {
+      const value = filters[key]?.trim();
+      if (value) params.set(key, value);
+    });
+  return params.toString();
+}
+
+function pageKey(scopeKey: string, page: number) {
+  return `${scopeKey}#${page}`;
+}
+
+export function getCachedNewsListPage<T>(filters: NewsListFilters, page: number): NewsListPage<T> | undefined {
+  return pageCache.get(pageKey(getNewsListScopeKey(filters), page)) as NewsListPage<T> | undefined;
+}
+
+function abortError() {
+  return new DOMException('The request was superseded', 'AbortError');
+}
+
+export function isAbortError(error: unknown): boolean {
+  return error instanceof DOMException && error.name === 'AbortError';
+}
+
+function startRequest<T>(filters: NewsListFilters, page: number, key: string): InflightRequest<T> {
+  const params = new URLSearchParams(getNewsListScopeKey(filters));
+  params.set('page', String(page));
+  params.set('limit', String(NEWS_LIST_PAGE_SIZE));
+  const facetScope = getFacetScope(filters);
+  if (facetsByScope.has(facetScope)) {
+    params.set('facets', '0');
+  }
+
+  const controller = new AbortController();
+  const promise = fetch(`/api/news/list?${params.toString()}`, { signal: controller.signal })
+    .then(async (response) => {
+      const payload: NewsListPayload<T> = await response.json();
+      if (!response.ok || !payload.success) {
+        throw new Error(payload.message || 'Failed to load news');
+      }
+
+      if (payload.categories) {
+        facetsByScope.set(facetScope, {
+          categories: payload.categories,
+          subCategoriesByCategory: payload.subCategoriesByCategory || {},
+          sources: payload.sources || [],
+        });
+      }
+
+      const result = { data: payload.data || [], total: payload.total || 0 };
+      pageCache.set(key, result);
+      return result;
+    })
+    .finally(() => {
+      if (inflight.get(key) === request) inflight.delete(key);
+    });
+
+  // Avoid unhandled rejections when every waiter has already left
+  promise.catch(() => {});
+
+  const request: InflightRequest<T> = { promise, controller, waiters: 0 };
+  return request;
+}
+
+/**
+ * Load one page of the list, from cache when possible
+ * Aborting `signal` rejects this call with an AbortError; the underlying fetch
+ * is cancelled once no other caller (e.g. a prefetch) still needs it.
+ */
+export function loadNewsListPage<T>(
+  filters: NewsListFilters,
+  page: number,
+  signal?: AbortSignal
+): Promise<NewsListPage<T>> {
+  const key = pageKey(getNewsListScopeKey(filters), page);
+  const cached = pageCache.get(key) as NewsListPage<T> | undefined;
+  if (cached) {
+    return Promise.resolve(cached);
+  }
+  if (signal?.aborted) {
+    return Promise.reject(abortError());
+  }
+
+  let request = inflight.get(key) as InflightRequest<T> | undefined;
+  if (!request) {
+    request = startRequest<T>(filters, page, key);
+    inflight.set(key, request as InflightRequest<unknown>);
+  }
+  const shared = request;
+  shared.waiters++;
+
+  return new Promise<NewsListPage<T>>((resolve, reject) => {
+    let settled = false;
+    const release = () => {
+      if (settled) return;
+      settled = true;
+      signal?.removeEventListener('abort', onAbort);
+      shared.waiters--;
+    };
+    const onAbort = () => {
+      if (settled) return;
+      release();
+      if (shared.waiters === 0) {
+        // Later callers must start a fresh request rather than join a cancelled one
+        if (inflight.get(key) === shared) inflight.delete(key);
+        shared.controller.abort();
+      }
+      reject(abortError());
+    };
+
+    signal?.addEventListener('abort', onAbort);
+    shared.promise.then(
+      (result) => {
+        if (settled) return;
+        release();
+        resolve(result);
+      },
+      (error) => {
+        if (settled) return;
+        release();
+        reject(error);
+      }
+    );
+  });
+}
+
+/**
+ * Warm the cache for a page the user is likely to request next
+ */
+export function prefetchNewsListPage(filters: NewsListFilters, page: number, signal?: AbortSignal) {
+  loadNewsListPage(filters, page, signal).catch(() => {
+    /* prefetch failures surface when the page is actually requested */
+  });
+}
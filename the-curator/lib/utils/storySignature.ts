@@ -0,0 +1,122 @@
+import type { ScrapedArticle } from '@/lib/types/database';
+import { normalizeHashText } from '@/lib/utils/contentHash';
+
+/**
+ * MinHash signatures for near-duplicate story detection.
+ *
+ * Text is reduced to character shingles (works for Chinese without a word
+ * segmenter), hashed with NUM_HASHES seeded 32-bit hashes and split into
+ * LSH bands. Two articles sharing any band key are candidate duplicates;
+ * the full signatures then estimate their Jaccard similarity.
+ */
+
+export const SHINGLE_SIZE = 3;
+export const LSH_BANDS = 20;
+export const LSH_ROWS_PER_BAND = 3;
+export const NUM_HASHES = LSH_BANDS * LSH_ROWS_PER_BAND;
+
+/** Estimated Jaccard similarity above which two articles are the same story */
+export const STORY_SIMILARITY_THRESHOLD = 0.35;
+
+/** Cap on normalized characters per article so signature cost stays bounded */
+const MAX_SIGNATURE_CHARS = 6000;
+
+function fmix32(value: number): number {
+  let h = value;
+  h ^= h >>> 16;
+  h = Math.imul(h, 0x85ebca6b);
+  h ^= h >>> 13;
+  h = Math.imul(h, 0xc2b2ae35);
+  h ^= h >>> 16;
+  return h >>> 0;
+}
+
+function fnv1a(value: string): number {
+  let h = 0x811c9dc5;
+  for (let i = 0; i < value.length; i++) {
+    h ^= value.charCodeAt(i);
+    h = Math.imul(h, 0x01000193);
+  }
+  return h >>> 0;
+}
+
+const HASH_SEEDS = Array.from({ length: NUM_HASHES }, (_, i) => fmix32(Math.imul(i + 1, 0x9e3779b9)));
+
+/**
+ * Letters and digits only, lowercased; punctuation and whitespace carry no story signal
+ */
+export function normalizeSignatureText(value?: string | null): string {
+  return normalizeHashText(value)
+    .toLowerCase()
+    .replace(/[^\p{L}\p{N}]+/gu, '');
+}
+
+function shingleHashes(text: string): Set<number> {
+  const hashes = new Set<number>();
+  if (text.length <= SHINGLE_SIZE) {
+    if (text) hashes.add(fnv1a(text));
+    return hashes;
+  }
+  for (let i = 0; i + SHINGLE_SIZE <= text.length; i++) {
+    hashes.add(fnv1a(text.slice(i, i + SHINGLE_SIZE)));
+  }
+  return hashes;
+}
+
+/**
+ * MinHash signature over the title and text blocks of an article.
+ * Values are stored as signed 32-bit integers so they fit an INTEGER[] column.
+ * Returns null when the article has too little text to compare.
+ */
+export function computeStorySignature(
+  article: Pick<ScrapedArticle, 'title' | 'content'>
+): number[] | null {
+  const text = [article.title, ...(article.content || []).map((block) => block.text)]
+    .map(normalizeSignatureText)
+    .join('')
+    .slice(0, MAX_SIGNATURE_CHARS);
+
+  const shingles = shingleHashes(text);
+  if (shingles.size < LSH_BANDS) {
+    return null;
+  }
+
+  const signature = new Array<number>(NUM_HASHES).fill(0xffffffff);
+  shingles.forEach((shingle) => {
+    for (let i = 0; i < NUM_HASHES; i++) {
+      const value = fmix32(shingle ^ HASH_SEEDS[i]);
+      if (value < signature[i]) {
+        signature[i] = value;
+      }
+    }
+  });
+
+  return signature.map((value) => value | 0);
+}
+
+/**
+ * LSH band keys: one per band, prefixed with the band index so equal rows
+ * in different bands never collide
+ */
+export function getStoryBandKeys(signature: number[]): string[] {
+  const keys: string[] = [];
+  for (let band = 0; band < LSH_BANDS; band++) {
+    const rows = signature.slice(band * LSH_ROWS_PER_BAND, (band + 1) * LSH_ROWS_PER_BAND);
+    keys.push(`${band.toString(36)}:${fnv1a(rows.join(',')).toString(16).padStart(8, '0')}`);
+  }
+  return keys;
+}
+
+/**
+ * Fraction of matching MinHash positions (an estimate of Jaccard similarity)
+ */
+export function estimateStorySimilarity(a: number[], b: number[]): number {
+  if (a.length !== b.length || a.length === 0) {
+    return 0;
+  }
+  let matches = 0;
+  for (let i = 0; i < a.length; i++) {
+    if (a[i] === b[i]) matches++;
+  }
+  return matches / a.length;
+}
@@ -29,7 +29,7 @@ const nextConfig = {
   // Required for @sparticuz/chromium to work on Vercel
   // Prevents webpack from bundling the chromium binary files
   experimental: {
-    serverComponentsExternalPackages: ['@sparticuz/chromium'],
+    serverComponentsExternalPackages: ['@sparticuz/chromium', 'sharp'],
   },
 }
 